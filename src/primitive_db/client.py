@@ -0,0 +1,142 @@
+import json
+import socket
+from collections.abc import Iterable
+from itertools import islice
+from typing import Any
+
+import prompt
+from prettytable import PrettyTable
+
+from src.primitive_db.conf import CONFIG
+from src.primitive_db.const.commands import COMMANDS_HELP
+
+
+class ClientError(Exception):
+    """
+    Класс ошибок взаимодействия с сервером.
+    """
+    pass
+
+
+class Client:
+    """
+    Клиент сервера базы данных (см. server.Server): отправляет команды на
+    сервер и выводит результаты.
+
+    :param host: адрес сервера.
+    :param port: порт сервера.
+
+    :raises ClientError: если не удалось подключиться к серверу.
+    """
+    def __init__(self, host: str, port: int):
+        try:
+            self._socket = socket.create_connection((host, port))
+        except OSError as err:
+            raise ClientError(
+                f"Не удалось подключиться к серверу {host}:{port}: {err}"
+            )
+        self._reader = self._socket.makefile("r", encoding="utf-8")
+        self._writer = self._socket.makefile("w", encoding="utf-8")
+        self._exit_flag = False
+
+    def execute(self, command: str) -> dict[str, Any]:
+        """
+        Выполнение команды на сервере.
+
+        :param command: строка команды.
+        :return: ответ сервера (см. server.Server).
+
+        :raises ClientError: если соединение с сервером разорвано.
+        """
+        try:
+            self._writer.write(command + "\n")
+            self._writer.flush()
+            line = self._reader.readline()
+        except OSError as err:
+            raise ClientError(f"Соединение с сервером разорвано: {err}")
+        if not line:
+            raise ClientError("Сервер закрыл соединение")
+        return json.loads(line)
+
+    def run(self) -> None:
+        """
+        Интерактивная работа с сервером.
+
+        :return: None.
+
+        :raises ClientError: если соединение с сервером разорвано.
+        """
+        print(COMMANDS_HELP)
+        while not self._exit_flag:
+            data = prompt.string("Введите команду: ").strip()
+            if data:
+                self._run_command(data)
+
+    def run_script(self, lines: Iterable[str]) -> int:
+        """
+        Выполнение команд скрипта на сервере (см. Engine.run_script).
+
+        :param lines: строки скрипта.
+        :return: количество команд, завершившихся ошибкой.
+
+        :raises ClientError: если соединение с сервером разорвано.
+        """
+        failures_count: int = 0
+        for line in lines:
+            data = line.strip()
+            if not data or data.startswith("#"):
+                continue
+            if not self._run_command(data):
+                failures_count += 1
+            if self._exit_flag:
+                break
+        return failures_count
+
+    def close(self) -> None:
+        """
+        Закрытие соединения.
+
+        :return: None.
+        """
+        for stream in (self._reader, self._writer, self._socket):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+    def _run_command(self, data: str) -> bool:
+        """
+        Выполнение команды на сервере с выводом результата.
+
+        :param data: строка команды.
+        :return: выполнена ли команда без ошибок.
+
+        :raises ClientError: если соединение с сервером разорвано.
+        """
+        response: dict[str, Any] = self.execute(data)
+        for line in response.get("output", ()):
+            print(line)
+        if "rows" in response:
+            self._print_rows(response["columns"], response["rows"])
+        if response.get("exit"):
+            self._exit_flag = True
+        return response.get("ok", False)
+
+    @staticmethod
+    def _print_rows(field_names: list[str], rows: list[list]) -> None:
+        """
+        Постраничный вывод строк (см. Engine._print_rows).
+
+        :param field_names: заголовки колонок.
+        :param rows: строки.
+        :return: None.
+        """
+        rows_iter = iter(rows)
+        page: list[list] = list(islice(rows_iter, CONFIG.page_size))
+        while True:
+            pretty_table = PrettyTable(field_names=field_names)
+            pretty_table.add_rows(page)
+            print(pretty_table)
+            page = list(islice(rows_iter, CONFIG.page_size))
+            if not page:
+                break
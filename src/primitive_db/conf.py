@@ -2,6 +2,8 @@ from enum import Enum
 from json import load
 from pathlib import Path
 
+from src.primitive_db.const.durability_modes import DurabilityModes
+
 
 class LoadConfigError(Exception):
     pass
@@ -9,12 +11,35 @@ class LoadConfigError(Exception):
 
 class ConfigJSONTags(Enum):
     database_path = "database_path"
+    change_log_limit = "change_log_limit"
+    page_size = "page_size"
+    durability = "durability"
+    durability_interval = "durability_interval"
+    flush_mutations = "flush_mutations"
+    flush_interval = "flush_interval"
+    cache_sizes = "cache_sizes"
+    sort_buffer_rows = "sort_buffer_rows"
+    query_workers = "query_workers"
 
 
 class Config:
     def __init__(self):
         self.__is_loaded = False
         self._database_path: Path | None = Path("database_data")
+        self._change_log_limit: int = 1000
+        self._page_size: int = 100
+        self._durability: DurabilityModes = DurabilityModes.commit
+        self._durability_interval: int = 1000
+        self._flush_mutations: int = 100
+        self._flush_interval: int = 1000
+        self._cache_sizes: dict[str, int] = {}
+        self._sort_buffer_rows: int = 100000
+        self._query_workers: int = 4
+        # режим работы задается параметрами запуска, а не файлом
+        # конфигурации:
+        self._interactive: bool = True
+        self._assume_yes: bool = False
+        self._quiet: bool = False
 
     def _check_loaded(self):
         if not self.__is_loaded:
@@ -26,6 +51,117 @@ class Config:
     def database_path(self) -> Path:
         return self._database_path
 
+    @property
+    def change_log_limit(self) -> int:
+        """
+        :return: максимальное количество записей в журнале изменений
+            таблицы, после которого журнал сворачивается в файл данных.
+        """
+        return self._change_log_limit
+
+    @property
+    def page_size(self) -> int:
+        """
+        :return: количество строк на одной странице вывода select.
+        """
+        return self._page_size
+
+    @property
+    def durability(self) -> DurabilityModes:
+        """
+        :return: режим сброса сохраняемых данных на диск (fsync).
+        """
+        return self._durability
+
+    @property
+    def durability_interval(self) -> int:
+        """
+        :return: минимальный интервал между вызовами fsync в режиме
+            interval, мс.
+        """
+        return self._durability_interval
+
+    @property
+    def flush_mutations(self) -> int:
+        """
+        :return: количество несохраненных изменений, после которого
+            фоновый поток сохраняет данные, не дожидаясь интервала.
+        """
+        return self._flush_mutations
+
+    @property
+    def flush_interval(self) -> int:
+        """
+        :return: интервал сохранения изменений фоновым потоком, мс (0 -
+            изменения сохраняются сразу).
+        """
+        return self._flush_interval
+
+    @property
+    def cache_sizes(self) -> dict[str, int]:
+        """
+        :return: размеры кэшей вида {имя кэша: количество записей}.
+        """
+        return self._cache_sizes
+
+    @property
+    def sort_buffer_rows(self) -> int:
+        """
+        :return: количество строк, сортируемых в памяти; при сортировке
+            большего количества строк отсортированные части записываются во
+            временные файлы.
+        """
+        return self._sort_buffer_rows
+
+    @property
+    def query_workers(self) -> int:
+        """
+        :return: количество потоков для параллельного выполнения запросов.
+        """
+        return self._query_workers
+
+    @property
+    def interactive(self) -> bool:
+        """
+        :return: вводятся ли команды пользователем (иначе команды читаются
+            из скрипта).
+        """
+        return self._interactive
+
+    @property
+    def assume_yes(self) -> bool:
+        """
+        :return: подтверждать ли действия без запроса пользователю.
+        """
+        return self._assume_yes
+
+    @property
+    def quiet(self) -> bool:
+        """
+        :return: отключен ли вывод сообщений по отдельным записям и времени
+            выполнения операций.
+        """
+        return self._quiet
+
+    def set_run_mode(
+            self,
+            interactive: bool,
+            assume_yes: bool = False,
+            quiet: bool = False
+    ) -> None:
+        """
+        Установка режима работы.
+
+        :param interactive: вводятся ли команды пользователем.
+        :param assume_yes: подтверждать ли действия без запроса.
+        :param quiet: отключить ли вывод сообщений по отдельным записям и
+            времени выполнения операций.
+        :return: None.
+        """
+        self._interactive = interactive
+        self._assume_yes = assume_yes
+        self._quiet = quiet
+
     def load(self, config_path: Path) -> None:
         try:
             with config_path.open() as f:
@@ -33,6 +169,49 @@ class Config:
             self._database_path = Path(
                 data[ConfigJSONTags.database_path.value]
             )
+            self._change_log_limit = int(data.get(
+                ConfigJSONTags.change_log_limit.value,
+                self._change_log_limit
+            ))
+            self._page_size = int(data.get(
+                ConfigJSONTags.page_size.value,
+                self._page_size
+            ))
+            self._durability = DurabilityModes(data.get(
+                ConfigJSONTags.durability.value,
+                self._durability.value
+            ))
+            self._durability_interval = int(data.get(
+                ConfigJSONTags.durability_interval.value,
+                self._durability_interval
+            ))
+            self._flush_mutations = int(data.get(
+                ConfigJSONTags.flush_mutations.value,
+                self._flush_mutations
+            ))
+            self._flush_interval = int(data.get(
+                ConfigJSONTags.flush_interval.value,
+                self._flush_interval
+            ))
+            self._cache_sizes = {
+                str(name): int(size)
+                for name, size in data.get(
+                    ConfigJSONTags.cache_sizes.value,
+                    self._cache_sizes
+                ).items()
+            }
+            self._sort_buffer_rows = int(data.get(
+                ConfigJSONTags.sort_buffer_rows.value,
+                self._sort_buffer_rows
+            ))
+            if self._sort_buffer_rows < 1:
+                raise ValueError("sort_buffer_rows must be positive")
+            self._query_workers = int(data.get(
+                ConfigJSONTags.query_workers.value,
+                self._query_workers
+            ))
+            if self._query_workers < 1:
+                raise ValueError("query_workers must be positive")
         except Exception as err:
             raise LoadConfigError(
                 f"Cannot load config from {config_path}: "
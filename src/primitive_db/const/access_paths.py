@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class AccessPaths(Enum):
+    # полный просмотр строк таблицы
+    scan = "scan"
+    # поиск строки по ID
+    id_lookup = "id_lookup"
+    # двоичный поиск по отсортированному списку ID
+    id_range = "id_range"
+    # поиск по значению в индексе
+    index_lookup = "index_lookup"
+    # поиск по диапазону значений в упорядоченном индексе
+    index_range = "index_range"
@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class AggregateFunctions(Enum):
+    count = "count"
+    sum = "sum"
+    avg = "avg"
+    min = "min"
+    max = "max"
+
+
+# агрегатные функции, применимые только к столбцам типа int:
+NUMERIC_FUNCTIONS = (AggregateFunctions.sum, AggregateFunctions.avg)
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class ChangeOperations(Enum):
+    insert = "insert"
+    update = "update"
+    delete = "delete"
@@ -5,11 +5,25 @@ class Commands(Enum):
     create_table = "create_table"
     list_tables = "list_tables"
     drop_table = "drop_table"
+    create_index = "create_index"
+    drop_index = "drop_index"
+    set_storage = "set_storage"
+    convert_table = "convert_table"
+    analyze = "analyze"
     insert = "insert"
+    load = "load"
     select = "select"
     update = "update"
     delete = "delete"
     info = "info"
+    prepare = "prepare"
+    execute = "execute"
+    explain = "explain"
+    begin = "begin"
+    commit = "commit"
+    rollback = "rollback"
+    flush = "flush"
+    cache_stats = "cache_stats"
     exit = "exit"
     help = "help"
 
@@ -19,29 +33,70 @@ DB_COMMANDS_DESCRIPTION = {
         "<имя_таблицы> <столбец1:тип> <столбец2:тип> ... - создать таблицу",
     Commands.list_tables: "- показать список всех таблиц",
     Commands.drop_table: "<имя_таблицы> - удалить таблицу",
+    Commands.create_index:
+        "<имя_таблицы> <столбец> [hash|sorted] - создать индекс по столбцу",
+    Commands.drop_index: "<имя_таблицы> <столбец> - удалить индекс",
+    Commands.set_storage:
+        "<имя_таблицы> <rows|columnar> - сменить тип хранилища строк",
+    Commands.convert_table:
+        "<имя_таблицы> <json|binary> - сменить формат файла таблицы",
+    Commands.analyze:
+        "<имя_таблицы> - собрать статистику значений столбцов",
 }
 
 CRUD_COMMANDS_DESCRIPTION = {
     Commands.insert:
-        "into <имя_таблицы> values (<значение1>, <значение2>, ...) - "
-        "создать запись",
+        "into <имя_таблицы> values (<значение1>, <значение2>, ...) "
+        "[, (...) ...] - создать одну или несколько записей",
+    Commands.load:
+        "<имя_таблицы> from <файл.csv|файл.jsonl> - загрузить записи из "
+        "файла",
     Commands.select:
-        "from <имя_таблицы> [where <столбец> = <значение>] "
-        "- прочитать записи из таблицы",
+        "[*|<столбец>|<функция>(<столбец>|*), ...] from <имя_таблицы> "
+        "[join <имя_таблицы> on <таблица.столбец> = <таблица.столбец>] "
+        "[where <условие> [and <условие> ...]] [group by <столбец>] "
+        "[order by <столбец> [asc|desc]] [after ID=<значение>] "
+        "[limit <N>] [offset <M>] - прочитать записи из таблицы (или "
+        "соединения таблиц) или вычислить агрегатные функции "
+        "(count, sum, avg, min, max)",
     Commands.update:
         "<имя_таблицы> set <столбец> = <значение> "
-        "where <столбец> = <значение> - обновить запись",
+        "where <условие> [and <условие> ...] - обновить запись",
     Commands.delete:
-        "from <имя_таблицы> where <столбец> = <значение> - удалить запись",
-    Commands.info: "<имя_таблицы> - вывести информацию о таблице"
+        "from <имя_таблицы> where <условие> [and <условие> ...] "
+        "- удалить запись",
+    Commands.info: "<имя_таблицы> - вывести информацию о таблице",
+    Commands.prepare:
+        "<имя> as <insert|select|update|delete ...> - подготовить запрос "
+        "с параметрами ? вместо значений",
+    Commands.execute:
+        "<имя> [(<значение1>, <значение2>, ...)] - выполнить подготовленный "
+        "запрос с заданными значениями параметров",
+    Commands.explain:
+        "<select|update|delete ...> - показать план выборки строк запроса",
+}
+
+TRANSACTION_COMMANDS_DESCRIPTION = {
+    Commands.begin: "- начать транзакцию",
+    Commands.commit: "- зафиксировать транзакцию (сохранить изменения)",
+    Commands.rollback: "- отменить транзакцию (отменить изменения)",
 }
 
 OTHER_COMMANDS_DESCRIPTION = {
+    Commands.flush: "- сохранить все изменения на диск",
+    Commands.cache_stats: "- вывести статистику кэшей",
     Commands.exit: "- выход из программы",
     Commands.help: "- справочная информация"
 }
 
 
+CONDITIONS_HELP = (
+    "<условие>: <столбец> <оператор> <значение> (оператор: =, <, <=, >, >=; "
+    "сравнения <, <=, >, >= только для int) или <столбец> between "
+    "<значение1> and <значение2> (только для int)"
+)
+
+
 def _commands_help(commands: dict[Enum, str]) -> list[str]:
     """
     :param commands: словарь с описанием команд.
@@ -61,6 +116,11 @@ COMMANDS_HELP = "\n".join([
     "***Операции с данными***",
     "Функции:",
     *_commands_help(CRUD_COMMANDS_DESCRIPTION),
+    CONDITIONS_HELP,
+    "",
+    "***Транзакции***",
+    "Функции:",
+    *_commands_help(TRANSACTION_COMMANDS_DESCRIPTION),
     "",
     "***Прочие***",
     "Функции:",
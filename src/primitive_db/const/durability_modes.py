@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class DurabilityModes(Enum):
+    # без вызова fsync: данные сбрасываются на диск операционной системой
+    none = "none"
+    # fsync при каждом сохранении данных
+    commit = "commit"
+    # fsync не чаще, чем раз в durability_interval миллисекунд
+    interval = "interval"
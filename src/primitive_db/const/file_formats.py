@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class FileFormats(Enum):
+    json = "json"
+    binary = "binary"
+
+
+FILE_EXTENSIONS = {
+    FileFormats.json: "json",
+    FileFormats.binary: "bin"
+}
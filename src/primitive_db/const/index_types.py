@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class IndexTypes(Enum):
+    hash = "hash"
+    sorted = "sorted"
@@ -0,0 +1,20 @@
+from enum import Enum
+
+
+class Operators(Enum):
+    eq = "="
+    lt = "<"
+    le = "<="
+    gt = ">"
+    ge = ">="
+    between = "between"
+
+
+# операторы сравнения, применимые только к столбцам типа int:
+RANGE_OPERATORS = (
+    Operators.lt,
+    Operators.le,
+    Operators.gt,
+    Operators.ge,
+    Operators.between
+)
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class StorageTypes(Enum):
+    rows = "rows"
+    columnar = "columnar"
@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class TokenTypes(Enum):
+    # имя (таблицы, колонки) или ключевое слово
+    name = "name"
+    # целое или дробное число
+    number = "number"
+    # строка в кавычках
+    string = "string"
+    # оператор сравнения
+    operator = "operator"
+    # знак пунктуации: ( ) , * ? .
+    punct = "punct"
+    # конец команды
+    end = "end"
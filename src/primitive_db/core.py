@@ -1,26 +1,110 @@
+from collections.abc import Iterator, Sequence
+from contextlib import ExitStack, contextmanager
+from itertools import islice
 from pathlib import Path
+from threading import RLock
 from typing import Any, Optional
 
+from src.primitive_db.conf import CONFIG
 from src.primitive_db.const.auto_column_names import AutoColumnNames
+from src.primitive_db.const.change_operations import ChangeOperations
 from src.primitive_db.const.columns_type import ColumnsType
-from src.primitive_db.metadata import Database, Table
+from src.primitive_db.const.file_formats import FILE_EXTENSIONS, FileFormats
+from src.primitive_db.const.index_types import IndexTypes
+from src.primitive_db.metadata import Database, DatabaseError, Table
 from src.primitive_db.metadata.column import Column
-from src.primitive_db.utils.decorators import confirm_action, log_time
-from src.primitive_db.utils.load_data import load_data, save_data
+from src.primitive_db.metadata.column_stats import ColumnStats
+from src.primitive_db.metadata.table import WhereType
+from src.primitive_db.query.ast import (
+    Aggregate,
+    DeleteStatement,
+    InsertStatement,
+    SelectStatement,
+    Statement,
+    UpdateStatement,
+)
+from src.primitive_db.query.condition import Condition
+from src.primitive_db.query.join import hash_join, resolve_column
+from src.primitive_db.query.planner import QueryPlan
+from src.primitive_db.query.prepared import PreparedStatement
+from src.primitive_db.storage import MappedStorage
+from src.primitive_db.utils.binary_format import (
+    BinaryTableFile,
+    check_binary_values,
+    write_binary_table,
+)
+from src.primitive_db.utils.change_log import ChangeLog
+from src.primitive_db.utils.decorators import (
+    confirm_action,
+    log_time,
+    synchronized,
+)
+from src.primitive_db.utils.flusher import Flusher
+from src.primitive_db.utils.json_format import (
+    read_json_table,
+    write_json_table,
+)
+from src.primitive_db.utils.load_data import (
+    LoadDataError,
+    load_data,
+    load_rows,
+    save_data,
+)
+from src.primitive_db.utils.rw_lock import RWLock
+
+
+class TransactionError(DatabaseError):
+    """
+    Класс ошибок, возникающих при работе с транзакциями.
+    """
+    pass
 
 
 class Core:
     """
     Класс, реализующий функционал ядра базы данных.
 
+    Данные таблиц загружаются при первом обращении к таблице. Изменения
+    данных внутри транзакции сохраняются только при ее фиксации.
+
+    Изменения данных не записываются на диск сразу: таблица помечается как
+    измененная, а записи журнала изменений накапливаются в памяти и
+    сохраняются фоновым потоком после `flush_mutations` изменений или
+    через `flush_interval` миллисекунд.
+
+    Методы ядра можно вызывать из нескольких потоков. Каждая таблица
+    защищена блокировкой чтения/записи: выборки из таблицы выполняются
+    параллельно, изменения - по одному. Создание и удаление таблиц
+    выполняется под блокировкой каталога. Блокировки получаются в порядке:
+    каталог, таблицы (по возрастанию имен), self._lock (состояние
+    транзакции и сохранение данных). Транзакция общая для всех потоков.
+
     :param metadata_path: путь к файлу с метаданными.
     """
     def __init__(self, database_path: Path):
         self._database_path = database_path
         self._database_meta_path = database_path / "metadata.json"
         self._database = self._get_database_meta(self._database_meta_path)
-        for table in self._database.tables:
-            self._get_table_data(table)
+        self._change_logs: dict[str, ChangeLog] = {}
+        # отложенные записи журналов изменений таблиц, измененных в текущей
+        # транзакции, вида {имя таблицы: [записи]} (None - нет транзакции):
+        self._transaction: dict[str, list[dict]] | None = None
+        # несохраненные записи журналов изменений измененных таблиц вида
+        # {имя таблицы: [записи]}:
+        self._pending: dict[str, list[dict]] = {}
+        self._pending_count: int = 0
+        self._lock = RLock()
+        self._catalog_lock = RWLock()
+        # блокировки чтения/записи таблиц вида {имя таблицы: блокировка}:
+        self._table_locks: dict[str, RWLock] = {}
+        self._prepared: dict[str, PreparedStatement] = {}
+        self._flusher: Flusher | None = None
+        if CONFIG.flush_interval > 0:
+            self._flusher = Flusher(
+                self._flush_pending,
+                CONFIG.flush_interval / 1000
+            )
+            self._flusher.start()
 
     @staticmethod
     def _get_database_meta(metadata_path: Path) -> Database:
@@ -42,9 +126,12 @@ class Core:
     def _get_table_data(self, table: Table) -> None:
         """
         Получение данных таблицы из файла.
-        Если файл с данными таблицы существует, то данные считываются из него.
-        Иначе, создается пустой список для данных таблицы и сохраняется в
-        новом файле.
+        Если файл с данными таблицы существует, то данные считываются из него
+        (файл в бинарном формате отображается в память, файл в формате JSON
+        читается в версии 1 или 2 - при первом сохранении файл версии 1
+        перезаписывается в версии 2). Иначе, создается пустой список для
+        данных таблицы и сохраняется в новом файле. Поверх считанных данных
+        накатывается журнал изменений таблицы.
 
         :param table: описание таблицы.
         :return: None.
@@ -52,19 +139,218 @@ class Core:
         :raises utils.load_data.LoadDataError: если не удалось считать данные
             таблицы.
         """
-        path: Path = self._table_file_path(table.name)
-        if path.exists():
-            table.rows = load_data(path)
-        else:
+        path: Path = self._table_file_path(table)
+        if not path.exists():
             table.rows = []
-            save_data(path, table.rows)
+            self._save_table_data(table)
+        elif table.file_format == FileFormats.binary.value:
+            table_file = BinaryTableFile(path)
+            if table_file.columns != self._columns_spec(table):
+                table_file.close()
+                raise LoadDataError(
+                    f"Схема файла {path} не совпадает со схемой таблицы "
+                    f"\"{table.name}\""
+                )
+            table.attach_storage(
+                MappedStorage(table.columns, table_file, table.storage_type)
+            )
+        else:
+            table.rows, _ = read_json_table(path)
+        change_log = ChangeLog(self._change_log_path(table.name))
+        self._replay_changes(table, change_log.read())
+        self._change_logs[table.name] = change_log
 
-    def _table_file_path(self, table_name: str) -> Path:
+    @staticmethod
+    def _replay_changes(table: Table, records: list[dict]) -> None:
         """
-        :param table_name: название таблицы.
+        Применение записей журнала изменений к данным таблицы.
+
+        Повторное применение записей не изменяет данные: если сбой
+        произошел после сохранения данных таблицы при контрольной точке, но
+        до очистки журнала, то файл данных уже содержит изменения журнала.
+        Поэтому вставка строки с существующим ID пропускается (ID не
+        используются повторно, и строка файла не старее записи журнала), а
+        изменение и удаление отсутствующих строк ничего не делают.
+
+        :param table: таблица.
+        :param records: записи журнала изменений.
+        :return: None.
+
+        :raises utils.load_data.LoadDataError: если журнал содержит
+            некорректные записи.
+        """
+        id_column: str = AutoColumnNames.ID.value
+        try:
+            for record in records:
+                match ChangeOperations(record["op"]):
+                    case ChangeOperations.insert:
+                        for row in record.get("rows") or [record["row"]]:
+                            if table.get_row(row[id_column]) is None:
+                                table.append_row(row)
+                    case ChangeOperations.update:
+                        for row_id in record["ids"]:
+                            table.update_row(
+                                record["set"],
+                                {id_column: row_id}
+                            )
+                    case ChangeOperations.delete:
+                        for row_id in record["ids"]:
+                            table.delete_row({id_column: row_id})
+        except (KeyError, ValueError, DatabaseError) as err:
+            raise LoadDataError(
+                f"Некорректная запись в журнале изменений таблицы "
+                f"\"{table.name}\": {err} ({err.__class__.__name__})"
+            )
+        if records:
+            # статистика могла быть сохранена в метаданных до части
+            # изменений журнала:
+            table.refresh_stats()
+
+    def _log_change(self, table: Table, record: dict) -> None:
+        """
+        Регистрация изменения таблицы: таблица помечается как измененная, а
+        запись журнала изменений откладывается до сохранения фоновым
+        потоком (внутри транзакции - до ее фиксации). Если фоновое
+        сохранение отключено, то изменение сохраняется сразу.
+
+        :param table: таблица.
+        :param record: запись журнала изменений.
+        :return: None.
+
+        :raises utils.load_data.SaveDataError: если не удалось сохранить
+            данные.
+        """
+        with self._lock:
+            if (
+                self._transaction is not None
+                and table.name in self._transaction
+            ):
+                self._transaction[table.name].append(record)
+                return
+            self._pending.setdefault(table.name, []).append(record)
+            self._pending_count += 1
+        if self._flusher is None:
+            self._flush_table(table.name)
+        elif self._pending_count >= CONFIG.flush_mutations:
+            self._flusher.notify()
+
+    def _flush_pending(self) -> None:
+        """
+        Сохранение отложенных записей журналов изменений: записи каждой
+        измененной таблицы записываются в журнал одним обращением к файлу.
+        Если журнал превышает допустимый размер, то вместо этого
+        выполняется контрольная точка.
+
+        :return: None.
+
+        :raises utils.load_data.SaveDataError: если не удалось сохранить
+            данные.
+        """
+        with self._lock:
+            tables_names: list[str] = list(self._pending)
+        for table_name in tables_names:
+            self._flush_table(table_name)
+
+    def _flush_table(self, table_name: str) -> None:
+        """
+        Сохранение отложенных записей журнала изменений таблицы (см.
+        _flush_pending). Данные таблицы не изменяются во время сохранения:
+        сохранение выполняется под блокировкой чтения таблицы.
+
+        :param table_name: имя таблицы.
+        :return: None.
+
+        :raises utils.load_data.SaveDataError: если не удалось сохранить
+            данные.
+        """
+        with (
+            self._catalog_lock.read(),
+            self._table_lock(table_name).read(),
+            self._lock
+        ):
+            records: list[dict] | None = self._pending.pop(table_name, None)
+            if not records:
+                # таблица удалена или изменения уже сохранены
+                return
+            self._pending_count -= len(records)
+            table: Table = self._database.get_table(table_name)
+            change_log: ChangeLog = self._change_logs[table_name]
+            # пакетная вставка учитывается по количеству строк:
+            size: int = sum(len(r.get("rows", ())) or 1 for r in records)
+            in_transaction: bool = (
+                self._transaction is not None
+                and table_name in self._transaction
+            )
+            if (
+                not in_transaction
+                and change_log.records_count + size
+                >= CONFIG.change_log_limit
+            ):
+                self._checkpoint(table)
+            else:
+                change_log.extend(records)
+
+    def _checkpoint(self, table: Table) -> None:
+        """
+        Контрольная точка: сохранение данных таблицы в файл, сохранение
+        метаданных (счетчик ID таблицы) и очистка журнала изменений.
+        Выполняется под блокировкой таблицы и self._lock. Если журнал не
+        будет очищен из-за сбоя, то при загрузке таблицы он применяется к
+        сохраненным данным повторно (см. _replay_changes).
+
+        :param table: таблица.
+        :return: None.
+
+        :raises utils.load_data.SaveDataError: если не удалось сохранить
+            данные.
+        """
+        self._save_table_data(table)
+        self._save_metadata()
+        self._change_logs[table.name].clear()
+        self._pending.pop(table.name, None)
+
+    def _save_table_data(self, table: Table) -> None:
+        """
+        Сохранение данных таблицы в файл в формате таблицы.
+
+        :param table: таблица.
+        :return: None.
+
+        :raises utils.load_data.SaveDataError: если не удалось сохранить
+            данные.
+        """
+        path: Path = self._table_file_path(table)
+        if table.file_format == FileFormats.binary.value:
+            write_binary_table(path, self._columns_spec(table), table.rows)
+        else:
+            write_json_table(
+                path,
+                [column.name for column in table.columns],
+                table.rows
+            )
+
+    @staticmethod
+    def _columns_spec(table: Table) -> list[tuple[str, str]]:
+        """
+        :param table: таблица.
+        :return: схема таблицы вида [(имя колонки, тип колонки)].
+        """
+        return [(column.name, column.column_type) for column in table.columns]
+
+    def _table_file_path(self, table: Table) -> Path:
+        """
+        :param table: таблица.
         :return: путь к файлу с данными таблицы.
         """
-        return self._database_path / f"table_{table_name}.json"
+        extension: str = FILE_EXTENSIONS[FileFormats(table.file_format)]
+        return self._database_path / f"table_{table.name}.{extension}"
+
+    def _change_log_path(self, table_name: str) -> Path:
+        """
+        :param table_name: название таблицы.
+        :return: путь к файлу журнала изменений таблицы.
+        """
+        return self._database_path / f"table_{table_name}.log"
 
     def _table_names(self) -> list[str]:
         """
@@ -72,6 +358,94 @@ class Core:
         """
         return [table.name for table in self._database.tables]
 
+    def _save_metadata(self) -> None:
+        """
+        Сохранение метаданных базы данных.
+
+        :return: None.
+
+        :raises utils.load_data.SaveDataError: если не удалось сохранить
+            метаданные.
+        """
+        with self._lock:
+            save_data(self._database_meta_path, self._database.dumps())
+
+    def _table_lock(self, table_name: str) -> RWLock:
+        """
+        :param table_name: имя таблицы.
+        :return: блокировка чтения/записи таблицы.
+        """
+        with self._lock:
+            lock: RWLock | None = self._table_locks.get(table_name)
+            if lock is None:
+                lock = self._table_locks[table_name] = RWLock()
+            return lock
+
+    def _load_table(self, table: Table) -> None:
+        """
+        Загрузка данных таблицы, если они еще не загружены. Вызывается под
+        блокировкой таблицы.
+
+        :param table: таблица.
+        :return: None.
+
+        :raises utils.load_data.LoadDataError: если не удалось загрузить
+            данные таблицы.
+        """
+        # журнал изменений регистрируется после загрузки данных и накатки
+        # журнала, поэтому таблица без журнала еще загружается:
+        if table.name in self._change_logs:
+            return
+        with self._lock:
+            if table.name not in self._change_logs:
+                self._get_table_data(table)
+
+    @contextmanager
+    def _reading(self, *tables_names: str) -> Iterator[list[Table]]:
+        """
+        Блокировка таблиц для чтения данных. Данные таблиц загружаются при
+        необходимости.
+
+        :param tables_names: имена таблиц.
+        :return: менеджер контекста, возвращающий таблицы в порядке имен
+            tables_names.
+
+        :raises metadata.db_object.DatabaseError: если таблица не найдена.
+
+        :raises utils.load_data.LoadDataError: если не удалось загрузить
+            данные таблицы.
+        """
+        with self._catalog_lock.read(), ExitStack() as stack:
+            tables: list[Table] = [
+                self._database.get_table(name) for name in tables_names
+            ]
+            for name in sorted(set(tables_names)):
+                stack.enter_context(self._table_lock(name).read())
+            for table in tables:
+                self._load_table(table)
+            yield tables
+
+    @contextmanager
+    def _writing(self, table_name: str, load: bool = True) -> Iterator[Table]:
+        """
+        Блокировка таблицы для изменения.
+
+        :param table_name: имя таблицы.
+        :param load: загрузить ли данные таблицы.
+        :return: менеджер контекста, возвращающий таблицу.
+
+        :raises metadata.db_object.DatabaseError: если таблица не найдена.
+
+        :raises utils.load_data.LoadDataError: если не удалось загрузить
+            данные таблицы.
+        """
+        with self._catalog_lock.read():
+            table: Table = self._database.get_table(table_name)
+            with self._table_lock(table_name).write():
+                if load:
+                    self._load_table(table)
+                yield table
+
     def create_table(
             self,
             table_name: str,
@@ -101,16 +475,19 @@ class Core:
             Column(AutoColumnNames.ID.value, type=ColumnsType.int.value)
         )
         table = Table(table_name, columns=column_objs)
-        self._database.add_table(table)
-        save_data(self._database_meta_path, self._database.dumps())
-        self._get_table_data(table)
+        with self._catalog_lock.write(), self._lock:
+            self._check_no_transaction()
+            self._database.add_table(table)
+            self._save_metadata()
+            self._get_table_data(table)
         return table
 
     def list_tables(self) -> list[Table]:
         """
         :return: список таблиц базы данных.
         """
-        return self._database.tables
+        with self._catalog_lock.read():
+            return list(self._database.tables)
 
     @confirm_action("удаление таблицы")
     def drop_table(self, table_name: str) -> None:
@@ -128,8 +505,134 @@ class Core:
         :raises utils.load_data.SaveDataError: если не удалось сохранить
             метаданные.
         """
-        self._database.drop_table(table_name)
-        save_data(self._database_meta_path, self._database.dumps())
+        with self._catalog_lock.write(), self._lock:
+            self._check_no_transaction()
+            self._database.drop_table(table_name)
+            self._save_metadata()
+            self._change_logs.pop(table_name, None)
+            records: list[dict] = self._pending.pop(table_name, [])
+            self._pending_count -= len(records)
+            self._table_locks.pop(table_name, None)
+            self._prepared = {
+                name: prepared for name, prepared in self._prepared.items()
+                if prepared.statement.table != table_name
+            }
+
+    def create_index(
+            self,
+            table_name: str,
+            column_name: str,
+            index_type: str = IndexTypes.hash.value
+    ) -> None:
+        """
+        Обработка команды создания индекса по колонке таблицы.
+
+        :param table_name: имя таблицы.
+        :param column_name: имя колонки.
+        :param index_type: тип индекса (hash или sorted).
+        :return: None.
+
+        :raises metadata.db_object.DatabaseError: если не удалось создать
+            индекс.
+
+        :raises utils.load_data.SaveDataError: если не удалось сохранить
+            метаданные.
+        """
+        with self._writing(table_name) as table:
+            self._check_no_transaction()
+            table.create_index(column_name, index_type)
+            self._save_metadata()
+
+    def drop_index(self, table_name: str, column_name: str) -> None:
+        """
+        Обработка команды удаления индекса по колонке таблицы.
+
+        :param table_name: имя таблицы.
+        :param column_name: имя колонки.
+        :return: None.
+
+        :raises metadata.db_object.DatabaseError: если не удалось удалить
+            индекс.
+
+        :raises utils.load_data.SaveDataError: если не удалось сохранить
+            метаданные.
+        """
+        with self._writing(table_name, load=False) as table:
+            self._check_no_transaction()
+            table.drop_index(column_name)
+            self._save_metadata()
+
+    def analyze(self, table_name: str) -> list[ColumnStats]:
+        """
+        Обработка команды сбора статистики значений колонок таблицы.
+        Статистика сохраняется в метаданных базы данных.
+
+        :param table_name: имя таблицы.
+        :return: статистика колонок таблицы.
+
+        :raises metadata.db_object.DatabaseError: если таблица не найдена.
+
+        :raises utils.load_data.SaveDataError: если не удалось сохранить
+            метаданные.
+        """
+        with self._writing(table_name) as table:
+            self._check_no_transaction()
+            stats: list[ColumnStats] = table.analyze()
+            self._save_metadata()
+        return stats
+
+    def set_storage(self, table_name: str, storage_type: str) -> None:
+        """
+        Обработка команды смены типа хранилища строк таблицы.
+
+        :param table_name: имя таблицы.
+        :param storage_type: тип хранилища (rows или columnar).
+        :return: None.
+
+        :raises metadata.db_object.DatabaseError: если не удалось сменить
+            тип хранилища.
+
+        :raises utils.load_data.SaveDataError: если не удалось сохранить
+            метаданные.
+        """
+        with self._writing(table_name) as table:
+            self._check_no_transaction()
+            table.set_storage_type(storage_type)
+            self._save_metadata()
+
+    def convert_table(self, table_name: str, file_format: str) -> None:
+        """
+        Обработка команды конвертации файла таблицы в другой формат.
+
+        Данные таблицы сохраняются в файл нового формата, журнал изменений
+        очищается, файл прежнего формата удаляется. Если сохранить данные
+        в новом формате не удалось, то таблица остается в прежнем формате.
+
+        :param table_name: имя таблицы.
+        :param file_format: формат файла (json или binary).
+        :return: None.
+
+        :raises metadata.db_object.DatabaseError: если формат файла не
+            поддерживается.
+
+        :raises utils.load_data.SaveDataError: если не удалось сохранить
+            данные.
+        """
+        with self._writing(table_name) as table, self._lock:
+            self._check_no_transaction()
+            old_format: str = table.file_format
+            old_path: Path = self._table_file_path(table)
+            file_format = table.file_format_validator(file_format)
+            if file_format == FileFormats.binary.value:
+                check_binary_values(self._columns_spec(table), table.rows)
+            table.file_format = file_format
+            try:
+                self._checkpoint(table)
+            except Exception:
+                table.file_format = old_format
+                raise
+            if old_path != self._table_file_path(table):
+                old_path.unlink(missing_ok=True)
 
     @log_time
     def insert(self, table_name: str, values: list) -> int:
@@ -146,36 +649,214 @@ class Core:
         :raises ValueError: если переданные значения не соответствуют
             требуемому формату.
         """
-        table: Table = self._database.get_table(table_name)
-        columns: list[Column] = [
-            c for c in table.columns if c.name != AutoColumnNames.ID.value
-        ]
-        if len(values) != len(columns):
-            raise ValueError(
-                "Количество значений не совпадает с количеством колонок."
-            )
-        values = {
-            column.name: value for column, value in zip(columns, values)
-        }
-        row_id: int = table.add_row(values)
-        save_data(self._table_file_path(table_name), table.rows)
-        return row_id
+        return self._insert_rows(table_name, [values])[0]
+
+    @log_time
+    def insert_many(
+            self,
+            table_name: str,
+            values_list: list[list]
+    ) -> list[int]:
+        """
+        Обработка команды вставки нескольких строк в таблицу.
+
+        Строки проверяются и добавляются одним пакетом, данные сохраняются
+        один раз.
+
+        :param table_name: название таблицы.
+        :param values_list: список значений колонок для каждой строки.
+        :return: список ID добавленных строк.
+
+        :raises src.primitive_db.metadata.db_object.DatabaseError: если не
+            удалось добавить строки.
+
+        :raises ValueError: если переданные значения не соответствуют
+            требуемому формату.
+        """
+        return self._insert_rows(table_name, values_list)
+
+    @log_time
+    def load(self, table_name: str, file_path: Path) -> list[int]:
+        """
+        Обработка команды загрузки строк в таблицу из файла CSV или JSONL.
+
+        Строки проверяются и добавляются одним пакетом, данные сохраняются
+        один раз. Значения колонки ID в файле игнорируются.
+
+        :param table_name: название таблицы.
+        :param file_path: путь до файла.
+        :return: список ID добавленных строк.
+
+        :raises src.primitive_db.metadata.db_object.DatabaseError: если не
+            удалось добавить строки.
+
+        :raises utils.load_data.LoadDataError: если не удалось прочитать
+            файл.
+        """
+        rows: list[dict] = load_rows(file_path)
+        with self._changing(table_name) as table:
+            return self._add_rows(table, rows)
+
+    def _insert_rows(
+            self,
+            table_name: str,
+            values_list: list[list]
+    ) -> list[int]:
+        """
+        Вставка строк, заданных списками значений колонок (без ID).
+
+        :param table_name: название таблицы.
+        :param values_list: список значений колонок для каждой строки.
+        :return: список ID добавленных строк.
+
+        :raises src.primitive_db.metadata.db_object.DatabaseError: если не
+            удалось добавить строки.
+
+        :raises ValueError: если количество значений не совпадает с
+            количеством колонок.
+        """
+        with self._changing(table_name) as table:
+            columns: list[Column] = [
+                c for c in table.columns
+                if c.name != AutoColumnNames.ID.value
+            ]
+            rows: list[dict] = []
+            for values in values_list:
+                if len(values) != len(columns):
+                    raise ValueError(
+                        "Количество значений не совпадает с количеством "
+                        "колонок."
+                    )
+                rows.append({
+                    column.name: value
+                    for column, value in zip(columns, values)
+                })
+            return self._add_rows(table, rows)
+
+    def _add_rows(self, table: Table, rows: list[dict]) -> list[int]:
+        """
+        Добавление строк в таблицу и регистрация изменения.
+
+        Изменение регистрируется одной записью журнала. Если строк не
+        меньше, чем допустимый размер журнала, то при сохранении вместо
+        записи в журнал выполняется контрольная точка.
+
+        :param table: таблица.
+        :param rows: строки вида {имя колонки: значение}.
+        :return: список ID добавленных строк.
+
+        :raises src.primitive_db.metadata.db_object.DatabaseError: если не
+            удалось добавить строки.
+
+        :raises utils.load_data.SaveDataError: если не удалось сохранить
+            данные.
+        """
+        rows_ids: list[int] = table.add_rows(rows)
+        if rows_ids:
+            # в журнал записываются копии строк: строки хранилища могут
+            # быть изменены до сохранения журнала (в том числе в
+            # транзакции, которая будет отменена)
+            self._log_change(table, {
+                "op": ChangeOperations.insert.value,
+                "rows": [dict(table.get_row(row_id)) for row_id in rows_ids]
+            })
+        return rows_ids
 
     @log_time
     def select(
             self,
             table_name: str,
-            where: Optional[dict[str, Any]]
-    ) -> list[list]:
+            where: Optional[WhereType],
+            limit: int | None = None,
+            offset: int = 0,
+            after_id: int | None = None,
+            columns: Sequence[str] = (),
+            order_by: str | None = None,
+            descending: bool = False
+    ) -> Iterator[list]:
         """
         Получение данных из таблицы.
 
+        Данные возвращаются генератором: строки читаются из таблицы по мере
+        чтения результата. Ошибки возникают при получении первой строки.
+
+        :param table_name: имя таблицы.
+
+        :param where: условия фильтрации: словарь вида
+            {имя колонки: значение} или список условий.
+
+        :param limit: максимальное количество строк (None - без
+            ограничения).
+
+        :param offset: количество пропускаемых строк.
+
+        :param after_id: если задан, то выбираются только строки с ID больше
+            заданного.
+
+        :param columns: имена выбираемых колонок (пусто - все колонки).
+
+        :param order_by: имя колонки сортировки (None - без сортировки).
+
+        :param descending: сортировать ли по убыванию.
+
+        :return: генератор строк данных. Первая строка - заголовки колонок.
+
+        :raises src.primitive_db.metadata.db_object.DatabaseError: если не
+            удалось получить данные из таблицы.
+
+        :raises ValueError: если переданные значения не соответствуют
+            требуемому формату.
+        """
+        with self._reading(table_name) as (table,):
+            rows = table.select(
+                where, limit, offset, after_id, columns, order_by, descending
+            )
+            yield list(columns) or [c.name for c in table.columns]
+            yield from rows
+
+    @log_time
+    def aggregate(
+            self,
+            table_name: str,
+            where: Optional[WhereType],
+            aggregates: Sequence[Aggregate],
+            group_by: str | None = None,
+            limit: int | None = None,
+            offset: int = 0,
+            after_id: int | None = None,
+            order_by: str | None = None,
+            descending: bool = False
+    ) -> Iterator[list]:
+        """
+        Вычисление агрегатных функций по строкам таблицы.
+
+        Результат возвращается генератором: строки таблицы читаются за один
+        проход при получении первой строки результата.
+
         :param table_name: имя таблицы.
 
-        :param where: словарь с условиями фильтрации вида
-            {имя колонки: значение}.
+        :param where: условия фильтрации: словарь вида
+            {имя колонки: значение} или список условий.
+
+        :param aggregates: агрегатные функции.
+
+        :param group_by: имя колонки группировки (None - без группировки).
+
+        :param limit: максимальное количество строк результата (None - без
+            ограничения).
+
+        :param offset: количество пропускаемых строк результата.
+
+        :param after_id: если задан, то учитываются только строки с ID
+            больше заданного.
+
+        :param order_by: имя колонки сортировки результата (только колонка
+            группировки).
 
-        :return: список данных. Первая строка - заголовки колонок.
+        :param descending: сортировать ли по убыванию.
+
+        :return: генератор строк результата. Первая строка - заголовки
+            колонок.
 
         :raises src.primitive_db.metadata.db_object.DatabaseError: если не
             удалось получить данные из таблицы.
@@ -183,17 +864,121 @@ class Core:
         :raises ValueError: если переданные значения не соответствуют
             требуемому формату.
         """
-        table: Table = self._database.get_table(table_name)
-        rows = [[c.name for c in table.columns]]
-        for row in table.select(where):
-            rows.append(list(row.values()))
-        return rows
+        with self._reading(table_name) as (table,):
+            rows = table.aggregate(
+                where, aggregates, group_by, limit, offset, after_id,
+                order_by, descending
+            )
+            header: list[str] = [str(a) for a in aggregates]
+            yield header if group_by is None else [group_by, *header]
+            yield from rows
+
+    @log_time
+    def join(self, statement: SelectStatement) -> Iterator[list]:
+        """
+        Выборка строк соединения двух таблиц по равенству колонок.
+
+        Условия фильтрации применяются к строкам каждой таблицы до
+        соединения, из таблиц читаются только выбираемые колонки и колонки
+        условия соединения. Хэш-таблица строится по таблице с меньшим
+        количеством строк, строки другой таблицы сопоставляются с ней по
+        одной, и результат возвращается по мере чтения. Ключи
+        сопоставляемых строк приводятся к типу колонки условия соединения
+        таблицы, по которой построена хэш-таблица.
+
+        :param statement: запрос выборки с соединением таблиц.
+        :return: генератор строк результата. Первая строка - заголовки
+            колонок.
+
+        :raises src.primitive_db.metadata.db_object.DatabaseError: если
+            таблица или колонка не найдена.
+
+        :raises ValueError: если условие соединения или имена колонок
+            некорректны, или значения условий не соответствуют колонкам.
+        """
+        with self._reading(
+                statement.table,
+                statement.join.table
+        ) as (left, right):
+            yield from self._join_rows(statement, left, right)
+
+    @staticmethod
+    def _join_rows(
+            statement: SelectStatement,
+            left: Table,
+            right: Table
+    ) -> Iterator[list]:
+        """
+        Соединение строк таблиц (см. join). Вызывается под блокировкой
+        чтения таблиц.
+
+        :param statement: запрос выборки с соединением таблиц.
+        :param left: таблица запроса.
+        :param right: присоединяемая таблица.
+        :return: генератор строк результата. Первая строка - заголовки
+            колонок.
+        """
+        if left is right:
+            raise ValueError(
+                "Соединение таблицы с самой собой не поддерживается"
+            )
+        tables: tuple[Table, Table] = (left, right)
+        key_columns: dict[str, Column] = {}
+        for name in (statement.join.left_column, statement.join.right_column):
+            table, column = resolve_column(name, tables)
+            key_columns[table.name] = column
+        if len(key_columns) != len(tables):
+            raise ValueError(
+                "Условие соединения должно связывать столбцы разных таблиц"
+            )
+        where: dict[str, list[Condition]] = {t.name: [] for t in tables}
+        for condition in statement.where:
+            table, column = resolve_column(condition.column_name, tables)
+            where[table.name].append(
+                Condition(column.name, condition.operator, condition.value)
+            )
+        output: list[tuple[Table, Column]] = [
+            resolve_column(name, tables) for name in statement.columns
+        ] or [(t, c) for t in tables for c in t.columns]
+        # колонки, читаемые из таблиц (первая - колонка условия соединения):
+        names: dict[str, list[str]] = {
+            t.name: [key_columns[t.name].name] for t in tables
+        }
+        for table, column in output:
+            if column.name not in names[table.name]:
+                names[table.name].append(column.name)
+        build, probe = (left, right) \
+            if left.rows_count <= right.rows_count else (right, left)
+        build_key: Column = key_columns[build.name]
+        pairs = hash_join(
+            build.select(where[build.name], columns=names[build.name]),
+            probe.select(where[probe.name], columns=names[probe.name]),
+            build_key=0,
+            probe_key=0,
+            convert_key=None
+            if build_key.python_type is key_columns[probe.name].python_type
+            else build_key.validate_value
+        )
+        positions: list[tuple[bool, int]] = [
+            (table is build, names[table.name].index(column.name))
+            for table, column in output
+        ]
+        stop = None if statement.limit is None \
+            else statement.offset + statement.limit
+        yield list(statement.columns) or [
+            f"{table.name}.{column.name}" for table, column in output
+        ]
+        for build_row, probe_row in islice(pairs, statement.offset, stop):
+            yield [
+                (build_row if from_build else probe_row)[i]
+                for from_build, i in positions
+            ]
 
     def update(
             self,
             table_name: str,
             set_data: dict[str, Any],
-            where_data: dict[str, Any]
+            where_data: WhereType
     ) -> list[int]:
         """
         Обновление данных в таблице.
@@ -203,8 +988,8 @@ class Core:
         :param set_data: словарь с данными для обновления вида
             {имя колонки: новое значение}.
 
-        :param where_data: словарь с условиями фильтрации вида
-            {имя колонки: значение}.
+        :param where_data: условия фильтрации: словарь вида
+            {имя колонки: значение} или список условий.
 
         :return: список ID обновленных строк.
 
@@ -217,24 +1002,34 @@ class Core:
         :raises utils.load_data.SaveDataError: если не удалось сохранить
             данные.
         """
-        table: Table = self._database.get_table(table_name)
-        updated_rows_ids: list[int] = table.update_row(set_data, where_data)
-        save_data(self._table_file_path(table_name), table.rows)
+        with self._changing(table_name) as table:
+            updated_rows_ids: list[int] = table.update_row(
+                set_data, where_data
+            )
+            if updated_rows_ids:
+                self._log_change(table, {
+                    "op": ChangeOperations.update.value,
+                    "ids": updated_rows_ids,
+                    "set": {
+                        column: table.get_column(column).validate_value(value)
+                        for column, value in set_data.items()
+                    }
+                })
         return updated_rows_ids
 
     @confirm_action("удаление данных")
     def delete(
             self,
             table_name: str,
-            where: dict[str, Any]
+            where: WhereType
     ) -> list[int]:
         """
         Удаление данных из таблицы.
 
         :param table_name: название таблицы.
 
-        :param where: словарь с условиями фильтрации вида
-            {имя колонки: значение}.
+        :param where: условия фильтрации: словарь вида
+            {имя колонки: значение} или список условий.
 
         :return: список ID удаленных строк.
 
@@ -247,10 +1042,350 @@ class Core:
         :raises utils.load_data.SaveDataError: если не удалось сохранить
             данные.
         """
-        table: Table = self._database.get_table(table_name)
-        deleted_rows_ids: list[int] = table.delete_row(where)
-        save_data(self._table_file_path(table_name), table.rows)
+        with self._changing(table_name) as table:
+            deleted_rows_ids: list[int] = table.delete_row(where)
+            if deleted_rows_ids:
+                self._log_change(table, {
+                    "op": ChangeOperations.delete.value,
+                    "ids": deleted_rows_ids
+                })
         return deleted_rows_ids
 
+    def execute(self, statement: Statement) -> list[int] | Iterator[list]:
+        """
+        Выполнение запроса, заданного AST.
+
+        :param statement: запрос.
+        :return: для select - итератор по строкам результата (первый элемент
+            - заголовки колонок), для остальных запросов - список ID
+            затронутых строк.
+
+        :raises src.primitive_db.metadata.db_object.DatabaseError: если не
+            удалось выполнить запрос.
+
+        :raises ValueError: если значения запроса не соответствуют
+            требуемому формату.
+
+        :raises utils.load_data.SaveDataError: если не удалось сохранить
+            данные.
+        """
+        match statement:
+            case SelectStatement(join=join) if join is not None:
+                return self.join(statement)
+            case InsertStatement(table=table_name, rows=(row,)):
+                return [self.insert(table_name, list(row))]
+            case InsertStatement(table=table_name, rows=rows):
+                return self.insert_many(table_name, [list(r) for r in rows])
+            case SelectStatement(aggregates=aggregates) if aggregates:
+                return self.aggregate(
+                    statement.table,
+                    statement.where,
+                    aggregates,
+                    statement.group_by,
+                    statement.limit,
+                    statement.offset,
+                    statement.after_id,
+                    statement.order_by,
+                    statement.descending
+                )
+            case SelectStatement():
+                return self.select(
+                    statement.table,
+                    statement.where,
+                    statement.limit,
+                    statement.offset,
+                    statement.after_id,
+                    statement.columns,
+                    statement.order_by,
+                    statement.descending
+                )
+            case UpdateStatement():
+                return self.update(
+                    statement.table,
+                    dict(statement.assignments),
+                    statement.where
+                )
+            case DeleteStatement():
+                return self.delete(statement.table, statement.where)
+
+    def explain(self, statement: Statement) -> QueryPlan:
+        """
+        Получение плана выборки строк для запроса без его выполнения.
+
+        :param statement: запрос select, update или delete.
+        :return: план выборки строк.
+
+        :raises src.primitive_db.metadata.db_object.DatabaseError: если
+            таблица или колонка запроса не найдена.
+
+        :raises ValueError: если запрос не выбирает строки или значения
+            условий не соответствуют колонкам.
+        """
+        match statement:
+            case SelectStatement(join=join) if join is not None:
+                raise ValueError(
+                    "Для запроса с join план выборки не строится"
+                )
+            case SelectStatement():
+                with self._reading(statement.table) as (table,):
+                    return table.plan(statement.where, statement.after_id)
+            case UpdateStatement() | DeleteStatement():
+                with self._reading(statement.table) as (table,):
+                    return table.plan(statement.where)
+        raise ValueError(
+            f"Для запроса {statement.kind.value} план выборки не строится"
+        )
+
+    def prepare(self, name: str, statement: Statement) -> PreparedStatement:
+        """
+        Обработка команды подготовки запроса: колонки запроса находятся и
+        литералы приводятся к типам колонок один раз, при подготовке.
+        Подготовленный запрос с таким же именем заменяется.
+
+        :param name: имя подготовленного запроса.
+        :param statement: запрос с параметрами (?).
+        :return: подготовленный запрос.
+
+        :raises src.primitive_db.metadata.db_object.DatabaseError: если
+            таблица или колонка запроса не найдена.
+
+        :raises ValueError: если значения запроса не соответствуют колонкам.
+        """
+        table: Table = self.get_table_meta(statement.table)
+        prepared = PreparedStatement(name, statement, table)
+        with self._lock:
+            self._prepared[name] = prepared
+        return prepared
+
+    def execute_prepared(
+            self,
+            name: str,
+            args: Sequence[Any]
+    ) -> tuple[Statement, list[int] | Iterator[list]]:
+        """
+        Обработка команды выполнения подготовленного запроса.
+
+        :param name: имя подготовленного запроса.
+        :param args: значения параметров запроса.
+        :return: запрос с подставленными значениями и результат его
+            выполнения (см. execute).
+
+        :raises src.primitive_db.metadata.db_object.DatabaseError: если
+            подготовленный запрос не найден или не удалось выполнить запрос.
+
+        :raises ValueError: если значения параметров не соответствуют
+            колонкам.
+        """
+        prepared: PreparedStatement | None = self._prepared.get(name)
+        if prepared is None:
+            raise DatabaseError(f"подготовленный запрос {name} не найден")
+        statement: Statement = prepared.bind(args)
+        return statement, self.execute(statement)
+
     def get_table(self, table_name: str) -> Table:
-        return self._database.get_table(table_name)
+        """
+        Получение таблицы с данными. Если данные таблицы еще не загружены,
+        то они загружаются из файла.
+
+        :param table_name: имя таблицы.
+        :return: таблица.
+
+        :raises metadata.db_object.DatabaseError: если таблица не найдена.
+
+        :raises utils.load_data.LoadDataError: если не удалось загрузить
+            данные таблицы.
+        """
+        with self._reading(table_name) as (table,):
+            return table
+
+    @contextmanager
+    def _changing(self, table_name: str) -> Iterator[Table]:
+        """
+        Блокировка таблицы для изменения данных. Если открыта транзакция, то
+        таблица включается в нее: начинается отслеживание изменений таблицы
+        для их отмены.
+
+        :param table_name: имя таблицы.
+        :return: менеджер контекста, возвращающий таблицу.
+
+        :raises metadata.db_object.DatabaseError: если таблица не найдена.
+
+        :raises utils.load_data.LoadDataError: если не удалось загрузить
+            данные таблицы.
+        """
+        with self._writing(table_name) as table:
+            with self._lock:
+                if (
+                    self._transaction is not None
+                    and table.name not in self._transaction
+                ):
+                    table.begin_changes()
+                    self._transaction[table.name] = []
+            yield table
+
+    def _check_no_transaction(self) -> None:
+        """
+        Проверка, что нет открытой транзакции. Изменение структуры базы
+        данных внутри транзакции не поддерживается.
+
+        :return: None.
+
+        :raises TransactionError: если открыта транзакция.
+        """
+        with self._lock:
+            if self._transaction is not None:
+                raise TransactionError(
+                    "операция недоступна внутри транзакции"
+                )
+
+    @property
+    def in_transaction(self) -> bool:
+        """
+        :return: True, если открыта транзакция.
+        """
+        return self._transaction is not None
+
+    @synchronized
+    def begin(self) -> None:
+        """
+        Обработка команды начала транзакции.
+
+        Изменения данных внутри транзакции применяются к таблицам в памяти, а
+        записи журналов изменений откладываются до фиксации транзакции.
+
+        :return: None.
+
+        :raises TransactionError: если транзакция уже открыта.
+        """
+        if self._transaction is not None:
+            raise TransactionError("транзакция уже открыта")
+        self._transaction = {}
+
+    @contextmanager
+    def _closing_transaction(self) -> Iterator[dict[str, list[dict]]]:
+        """
+        Закрытие транзакции под блокировками записи измененных в ней таблиц
+        и self._lock.
+
+        :return: менеджер контекста, возвращающий отложенные записи
+            журналов изменений таблиц транзакции вида
+            {имя таблицы: [записи]}.
+
+        :raises TransactionError: если нет открытой транзакции.
+        """
+        tables_names: list[str] = []
+        with self._catalog_lock.read():
+            while True:
+                with ExitStack() as stack:
+                    for table_name in tables_names:
+                        stack.enter_context(
+                            self._table_lock(table_name).write()
+                        )
+                    with self._lock:
+                        if self._transaction is None:
+                            raise TransactionError("нет открытой транзакции")
+                        if set(self._transaction) == set(tables_names):
+                            changes, self._transaction = \
+                                self._transaction, None
+                            yield changes
+                            return
+                        # в транзакцию включены новые таблицы: блокировки
+                        # получаются заново в порядке имен
+                        tables_names = sorted(self._transaction)
+
+    def commit(self) -> list[str]:
+        """
+        Обработка команды фиксации транзакции.
+
+        Отложенные записи журнала каждой измененной таблицы сохраняются
+        сразу, одним обращением к файлу. Если журнал превышает допустимый
+        размер, то вместо этого выполняется контрольная точка.
+
+        :return: список имен измененных таблиц.
+
+        :raises TransactionError: если нет открытой транзакции.
+
+        :raises utils.load_data.SaveDataError: если не удалось сохранить
+            данные.
+        """
+        with self._closing_transaction() as changes:
+            for table_name, records in changes.items():
+                self._database.get_table(table_name).commit_changes()
+                if records:
+                    self._pending.setdefault(table_name, []).extend(records)
+                    self._pending_count += len(records)
+        self._flush_pending()
+        return list(changes)
+
+    def rollback(self) -> list[str]:
+        """
+        Обработка команды отмены транзакции. Изменения таблиц отменяются в
+        памяти, без повторной загрузки данных из файлов.
+
+        :return: список имен таблиц, изменения которых отменены.
+
+        :raises TransactionError: если нет открытой транзакции.
+        """
+        with self._closing_transaction() as changes:
+            for table_name in changes:
+                self._database.get_table(table_name).rollback_changes()
+        return list(changes)
+
+    def get_table_meta(self, table_name: str) -> Table:
+        """
+        Получение описания таблицы без загрузки ее данных.
+
+        :param table_name: имя таблицы.
+        :return: таблица.
+
+        :raises metadata.db_object.DatabaseError: если таблица не найдена.
+        """
+        with self._catalog_lock.read():
+            return self._database.get_table(table_name)
+
+    def flush(self) -> list[str]:
+        """
+        Обработка команды принудительного сохранения данных: отложенные
+        изменения и непустые журналы изменений сворачиваются в файлы данных
+        таблиц. Таблицы, измененные в открытой транзакции, сохраняются без
+        ее незафиксированных изменений (только в журнал).
+
+        :return: список имен сохраненных таблиц.
+
+        :raises utils.load_data.SaveDataError: если не удалось сохранить
+            данные.
+        """
+        self._flush_pending()
+        flushed: list[str] = []
+        with self._catalog_lock.read():
+            for table in self._database.tables:
+                with self._table_lock(table.name).read(), self._lock:
+                    change_log = self._change_logs.get(table.name)
+                    if change_log is None or not change_log.records_count:
+                        continue
+                    in_transaction: bool = (
+                        self._transaction is not None
+                        and table.name in self._transaction
+                    )
+                    if not in_transaction:
+                        self._checkpoint(table)
+                    flushed.append(table.name)
+        return flushed
+
+    def close(self) -> None:
+        """
+        Завершение работы ядра: остановка фонового сохранения, отмена
+        незафиксированной транзакции и сворачивание отложенных изменений и
+        непустых журналов изменений в файлы данных таблиц.
+
+        :return: None.
+
+        :raises utils.load_data.SaveDataError: если не удалось сохранить
+            данные.
+        """
+        if self._flusher is not None:
+            self._flusher.stop()
+            self._flusher = None
+        if self.in_transaction:
+            self.rollback()
+        self.flush()
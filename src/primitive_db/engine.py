@@ -1,12 +1,15 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
 from pathlib import Path
 from re import Match, findall
-from typing import Any, ClassVar, Optional
+from typing import ClassVar
 
 import prompt
 from prettytable import PrettyTable
 
+from src.primitive_db.conf import CONFIG
 from src.primitive_db.const.commands import COMMANDS_HELP, Commands
+from src.primitive_db.const.index_types import IndexTypes
 from src.primitive_db.core import Core
 from src.primitive_db.exceptions.cancelled_error import CancelledError
 from src.primitive_db.exceptions.command_error import (
@@ -14,7 +17,11 @@ from src.primitive_db.exceptions.command_error import (
     UnknownCommandError,
 )
 from src.primitive_db.metadata import Table
+from src.primitive_db.metadata.column_stats import ColumnStats
+from src.primitive_db.query.ast import Statement
+from src.primitive_db.query.parser import parse_statement, parse_values
 from src.primitive_db.utils import parser
+from src.primitive_db.utils.cache import CACHES
 from src.primitive_db.utils.decorators import handle_db_errors
 
 CommandDataType = str | None
@@ -80,6 +87,15 @@ class Engine:
 
         :return: None.
         """
+        if self._core.in_transaction:
+            print(
+                "Внимание: транзакция не зафиксирована, при выходе ее "
+                "изменения будут отменены"
+            )
+        if not CONFIG.interactive:
+            # выход из скрипта не подтверждается:
+            self._exit_flag = True
+            return
         to_exit: Match = prompt.regex(
             r"^(y|n)$",
             "Вы уверены, что хотите выйти? (y/n): "
@@ -87,6 +103,54 @@ class Engine:
         if to_exit.string == "y":
             self._exit_flag = True
 
+    @handle_db_errors
+    @simple_handler
+    def _begin(self) -> None:
+        """
+        Обработчик команды begin.
+
+        :return: None.
+        """
+        self._core.begin()
+        print("Транзакция открыта")
+
+    @handle_db_errors
+    @simple_handler
+    def _commit(self) -> None:
+        """
+        Обработчик команды commit.
+
+        :return: None.
+        """
+        tables_names: list[str] = self._core.commit()
+        print(
+            f"Транзакция зафиксирована, изменено таблиц: {len(tables_names)}"
+        )
+
+    @handle_db_errors
+    @simple_handler
+    def _rollback(self) -> None:
+        """
+        Обработчик команды rollback.
+
+        :return: None.
+        """
+        tables_names: list[str] = self._core.rollback()
+        print(
+            f"Транзакция отменена, восстановлено таблиц: {len(tables_names)}"
+        )
+
+    @handle_db_errors
+    @simple_handler
+    def _flush(self) -> None:
+        """
+        Обработчик команды flush.
+
+        :return: None.
+        """
+        tables_names: list[str] = self._core.flush()
+        print(f"Данные сохранены, сохранено таблиц: {len(tables_names)}")
+
     @handle_db_errors
     @handler
     def _create_table(self, command_data: str) -> None:
@@ -183,6 +247,115 @@ class Engine:
             f"Таблица \"{command_data}\" успешно удалена"
         )
 
+    @handle_db_errors
+    @handler
+    def _create_index(self, command_data: str) -> None:
+        """
+        Обработчик команды create_index.
+
+        :param command_data: аргументы команды.
+        :return: None.
+        """
+        cd_match = parser.match_command_data(
+            r"^(\w+) (\w+)(?: (\w+))?$",
+            command_data
+        )
+        table_name, column_name = cd_match.group(1), cd_match.group(2)
+        index_type: str = cd_match.group(3) or IndexTypes.hash.value
+        self._core.create_index(table_name, column_name, index_type)
+        print(
+            f"Индекс по столбцу \"{column_name}\" таблицы "
+            f"\"{table_name}\" успешно создан"
+        )
+
+    @handle_db_errors
+    @handler
+    def _drop_index(self, command_data: str) -> None:
+        """
+        Обработчик команды drop_index.
+
+        :param command_data: аргументы команды.
+        :return: None.
+        """
+        cd_match = parser.match_command_data(r"^(\w+) (\w+)$", command_data)
+        table_name, column_name = cd_match.group(1), cd_match.group(2)
+        self._core.drop_index(table_name, column_name)
+        print(
+            f"Индекс по столбцу \"{column_name}\" таблицы "
+            f"\"{table_name}\" успешно удален"
+        )
+
+    @handle_db_errors
+    @handler
+    def _set_storage(self, command_data: str) -> None:
+        """
+        Обработчик команды set_storage.
+
+        :param command_data: аргументы команды.
+        :return: None.
+        """
+        cd_match = parser.match_command_data(r"^(\w+) (\w+)$", command_data)
+        table_name, storage_type = cd_match.group(1), cd_match.group(2)
+        self._core.set_storage(table_name, storage_type)
+        print(
+            f"Тип хранилища таблицы \"{table_name}\" изменен на "
+            f"\"{storage_type}\""
+        )
+
+    @handle_db_errors
+    @handler
+    def _convert_table(self, command_data: str) -> None:
+        """
+        Обработчик команды convert_table.
+
+        :param command_data: аргументы команды.
+        :return: None.
+        """
+        cd_match = parser.match_command_data(r"^(\w+) (\w+)$", command_data)
+        table_name, file_format = cd_match.group(1), cd_match.group(2)
+        self._core.convert_table(table_name, file_format)
+        print(
+            f"Файл таблицы \"{table_name}\" сконвертирован в формат "
+            f"\"{file_format}\""
+        )
+
+    @handle_db_errors
+    @handler
+    def _analyze(self, command_data: str) -> None:
+        """
+        Обработчик команды analyze.
+
+        :param command_data: аргументы команды.
+        :return: None.
+        """
+        matching = parser.match_command_data(r"^(\w+)$", command_data)
+        table_name: str = matching.group(1)
+        stats: list[ColumnStats] = self._core.analyze(table_name)
+        print(f"Статистика таблицы \"{table_name}\" собрана")
+        self._print_column_stats(stats)
+
+    @staticmethod
+    def _print_column_stats(stats: list[ColumnStats]) -> None:
+        """
+        Вывод статистики значений колонок.
+
+        :param stats: статистика колонок.
+        :return: None.
+        """
+        pretty_table = PrettyTable(field_names=[
+            "Столбец", "Записей", "Различных", "Пустых", "Мин.", "Макс.",
+            "Гистограмма"
+        ])
+        for column_stats in stats:
+            histogram = ", ".join(str(b) for b in column_stats.histogram)
+            pretty_table.add_row([
+                column_stats.name, column_stats.rows_count,
+                column_stats.distinct_count, column_stats.empty_count,
+                column_stats.min_value, column_stats.max_value,
+                histogram or "-"
+            ])
+        print(pretty_table)
+
     @handle_db_errors
     @handler
     def _insert(self, command_data: str) -> None:
@@ -192,20 +365,49 @@ class Engine:
         :param command_data: аргументы команды.
         :return: None.
 
+        :raises src.primitive_db.utils.parser.ParserError: если аргументы
+            команды не соответствуют требуемому формату.
+        """
+        statement = parse_statement(Commands.insert, command_data)
+        self._print_result(statement, self._core.execute(statement))
+
+    @handle_db_errors
+    @handler
+    def _load(self, command_data: str) -> None:
+        """
+        Обработчик команды load.
+
+        :param command_data: аргументы команды.
+        :return: None.
+
         :raises src.primitive_db.utils.parser.ParserError: если аргументы
             команды не соответствуют требуемому формату.
         """
         matching = parser.match_command_data(
-            r"^into (\w+) values \(([\w\", ]+)\)$",
+            r"^(\w+) from (.+)$",
             command_data
         )
         table_name = matching.group(1)
-        values = [
-            parser.check_value(el.strip())
-            for el in matching.group(2).split(",")
-        ]
-        row_id: int = self._core.insert(table_name, values)
-        print(f"Запись с ID={row_id} добавлена в таблицу \"{table_name}\"")
+        file_path = Path(matching.group(2).strip().strip("\"'"))
+        rows_ids = self._core.load(table_name, file_path)
+        self._print_inserted(table_name, rows_ids)
+
+    @staticmethod
+    def _print_inserted(table_name: str, rows_ids: list[int]) -> None:
+        """
+        Вывод результата пакетной вставки записей.
+
+        :param table_name: название таблицы.
+        :param rows_ids: список ID добавленных записей.
+        :return: None.
+        """
+        if not rows_ids:
+            print(f"В таблицу \"{table_name}\" не добавлено ни одной записи")
+            return
+        print(
+            f"В таблицу \"{table_name}\" добавлено записей: {len(rows_ids)} "
+            f"(ID={rows_ids[0]}..{rows_ids[-1]})"
+        )
 
     @handle_db_errors
     @handler
@@ -216,18 +418,27 @@ class Engine:
         :param command_data: аргументы команды.
         :return: None.
         """
-        matching = parser.match_command_data(
-            r"^from (\w+) ?(where ((\w+) ?= ?([\w\"]+)))?$",
-            command_data
-        )
-        table_name: str = matching.group(1)
-        where: Optional[str] = matching.group(3)
-        values: dict[str, Any] = parser.parse_command_conditions(where) \
-            if where else {}
-        rows = self._core.select(table_name, values)
-        pretty_table = PrettyTable(field_names=rows[0])
-        pretty_table.add_rows(rows[1:])
-        print(pretty_table)
+        statement = parse_statement(Commands.select, command_data)
+        self._print_result(statement, self._core.execute(statement))
+
+    @staticmethod
+    def _print_rows(field_names: list[str], rows: Iterator[list]) -> None:
+        """
+        Постраничный вывод строк: каждые CONFIG.page_size строк выводятся
+        отдельной таблицей.
+
+        :param field_names: заголовки колонок.
+        :param rows: итератор по строкам.
+        :return: None.
+        """
+        page: list[list] = list(islice(rows, CONFIG.page_size))
+        while True:
+            pretty_table = PrettyTable(field_names=field_names)
+            pretty_table.add_rows(page)
+            print(pretty_table)
+            page = list(islice(rows, CONFIG.page_size))
+            if not page:
+                break
 
     @handle_db_errors
     @handler
@@ -238,61 +449,178 @@ class Engine:
         :param command_data: аргументы команды.
         :return: None.
         """
+        statement = parse_statement(Commands.update, command_data)
+        self._print_result(statement, self._core.execute(statement))
+
+    @handle_db_errors
+    @handler
+    def _delete(self, command_data: str) -> None:
+        """
+        Обработчик команды delete.
+
+        :param command_data: аргументы команды.
+        :return: None.
+        """
+        statement = parse_statement(Commands.delete, command_data)
+        self._print_result(statement, self._core.execute(statement))
+
+    @handle_db_errors
+    @handler
+    def _prepare(self, command_data: str) -> None:
+        """
+        Обработчик команды prepare.
+
+        :param command_data: аргументы команды.
+        :return: None.
+
+        :raises src.primitive_db.utils.parser.ParserError: если аргументы
+            команды не соответствуют требуемому формату.
+        """
         matching = parser.match_command_data(
-            r"^(\w+) set ((\w+ ?= ?[\w\"]+,? ?)+) where (\w+ ?= ?[\w\"]+)$",
+            r"^(\w+) as (\w+) (.+)$",
             command_data
         )
-        table_name = matching.group(1)
-        set_data = parser.parse_command_conditions(matching.group(2))
-        where_data = parser.parse_command_conditions(matching.group(4))
-        updated_rows_ids: list[int] = self._core.update(
-            table_name,
-            set_data,
-            where_data
+        name: str = matching.group(1)
+        statement = parse_statement(
+            Commands(matching.group(2).lower()),
+            matching.group(3)
+        )
+        prepared = self._core.prepare(name, statement)
+        print(
+            f"Запрос \"{name}\" подготовлен "
+            f"(параметров: {prepared.parameters_count})"
         )
-        for row_id in updated_rows_ids:
-            print(
-                f"Запись с ID={row_id} обновлена в таблице \"{table_name}\""
-            )
 
     @handle_db_errors
     @handler
-    def _delete(self, command_data: str) -> None:
+    def _execute(self, command_data: str) -> None:
         """
-        Обработчик команды delete.
+        Обработчик команды execute.
 
         :param command_data: аргументы команды.
         :return: None.
+
+        :raises src.primitive_db.utils.parser.ParserError: если аргументы
+            команды не соответствуют требуемому формату.
         """
         matching = parser.match_command_data(
-            r"^from (\w+) where (\w+ ?= ?[\w\"]+)$",
+            r"^(\w+)(?: (.+))?$",
             command_data
         )
-        table_name = matching.group(1)
-        where = parser.parse_command_conditions(matching.group(2))
-        deleted_rows_ids: list[int] = self._core.delete(table_name, where)
-        for row_id in deleted_rows_ids:
-            print(
-                f"Запись с ID={row_id} удалена из таблицы \"{table_name}\""
-            )
+        args = parse_values(matching.group(2)) if matching.group(2) else ()
+        statement, result = self._core.execute_prepared(
+            matching.group(1),
+            args
+        )
+        self._print_result(statement, result)
+
+    @handle_db_errors
+    @handler
+    def _explain(self, command_data: str) -> None:
+        """
+        Обработчик команды explain.
+
+        :param command_data: аргументы команды.
+        :return: None.
+
+        :raises src.primitive_db.utils.parser.ParserError: если аргументы
+            команды не соответствуют требуемому формату.
+        """
+        matching = parser.match_command_data(r"^(\w+) (.+)$", command_data)
+        statement = parse_statement(
+            Commands(matching.group(1).lower()),
+            matching.group(2)
+        )
+        print(self._core.explain(statement))
+
+    def _print_result(
+            self,
+            statement: Statement,
+            result: list[int] | Iterator[list]
+    ) -> None:
+        """
+        Вывод результата выполнения запроса.
+
+        :param statement: запрос.
+        :param result: результат выполнения запроса (см. Core.execute).
+        :return: None.
+        """
+        match statement.kind:
+            case Commands.select:
+                self._print_rows(next(result), result)
+            case Commands.insert if len(result) != 1:
+                self._print_inserted(statement.table, result)
+            case Commands.insert | Commands.update | Commands.delete \
+                    if CONFIG.quiet:
+                # сообщения по отдельным записям не выводятся
+                pass
+            case Commands.insert:
+                print(
+                    f"Запись с ID={result[0]} добавлена в таблицу "
+                    f"\"{statement.table}\""
+                )
+            case Commands.update:
+                for row_id in result:
+                    print(
+                        f"Запись с ID={row_id} обновлена в таблице "
+                        f"\"{statement.table}\""
+                    )
+            case Commands.delete:
+                for row_id in result:
+                    print(
+                        f"Запись с ID={row_id} удалена из таблицы "
+                        f"\"{statement.table}\""
+                    )
 
     @handle_db_errors
     @handler
     def _info(self, command_data: str) -> None:
         matching = parser.match_command_data(r"^(\w+)$", command_data)
         table_name = matching.group(1)
-        table = self._core.get_table(table_name)
+        table = self._core.get_table_meta(table_name)
         columns = ", ".join(
             [f"{c.name}:{c.column_type}" for c in table.columns]
         )
+        indexes = ", ".join(
+            [f"{i.name}:{i.index_type}" for i in table.indexes]
+        ) or "-"
         print(
             f"Таблица: {table.name}\n"
             f"Столбцы: {columns}\n"
-            f"Количество записей: {len(table.rows)}"
+            f"Индексы: {indexes}\n"
+            f"Хранилище: {table.storage_type}\n"
+            f"Формат файла: {table.file_format}\n"
+            f"Количество записей: {table.rows_count}"
         )
+        stats = [c.stats for c in table.columns if c.stats is not None]
+        if stats:
+            print("Статистика столбцов:")
+            self._print_column_stats(stats)
 
-    @staticmethod
-    def _input_command() -> tuple[Commands, str]:
+    @simple_handler
+    def _cache_stats(self) -> None:
+        """
+        Обработчик команды cache_stats.
+
+        :return: None.
+        """
+        pretty_table = PrettyTable(field_names=[
+            "Кэш", "Размер", "Записей", "Попадания", "Промахи", "Вытеснения",
+            "Доля попаданий"
+        ])
+        for cache in CACHES.values():
+            requests_count: int = cache.hits + cache.misses
+            hit_rate = (
+                f"{cache.hits / requests_count:.1%}" if requests_count else "-"
+            )
+            pretty_table.add_row([
+                cache.name, cache.capacity, cache.size, cache.hits,
+                cache.misses, cache.evictions, hit_rate
+            ])
+        print(pretty_table)
+
+    @classmethod
+    def _input_command(cls) -> tuple[Commands, str]:
         """
         Получение команды из ввода пользователя.
 
@@ -300,7 +628,18 @@ class Engine:
 
         :raises CommandError: если команда не найдена.
         """
-        data = prompt.string("Введите команду: ")
+        return cls._parse_command(prompt.string("Введите команду: "))
+
+    @staticmethod
+    def _parse_command(data: str) -> tuple[Commands, str]:
+        """
+        Разбор строки команды.
+
+        :param data: строка команды.
+        :return: команда, аргументы команды.
+
+        :raises CommandError: если команда не найдена.
+        """
         command_els = data.split(" ", maxsplit=1)
         command = command_els[0].lower().strip()
         command_data = command_els[1].strip() \
@@ -319,15 +658,61 @@ class Engine:
         """
         self._help()
         while not self._exit_flag:
-            try:
-                command, command_data = self._input_command()
-                handler = self._handlers[command]
-                handler(command_data)
-            except CancelledError as err:
-                print(err)
-            except CommandError as err:
-                print(err)
-            except KeyError:
-                print("Команда не найдена")
-            except Exception as err:
-                print(f"Ошибка: {err}")
+            self._run_command(self._input_command)
+
+    def run_script(self, lines: Iterable[str]) -> int:
+        """
+        Выполнение команд скрипта: по одной команде в строке. Пустые строки
+        и строки, начинающиеся с "#", пропускаются. Выполнение завершается
+        после последней строки или команды exit.
+
+        :param lines: строки скрипта (например, открытый файл или
+            sys.stdin).
+        :return: количество команд, завершившихся ошибкой.
+        """
+        failures_count: int = 0
+        for line in lines:
+            data = line.strip()
+            if not data or data.startswith("#"):
+                continue
+            if not self._run_command(lambda: self._parse_command(data)):
+                failures_count += 1
+            if self._exit_flag:
+                break
+        return failures_count
+
+    def _run_command(
+            self,
+            get_command: Callable[[], tuple[Commands, str]]
+    ) -> bool:
+        """
+        Выполнение одной команды с выводом ошибок.
+
+        :param get_command: функция получения команды и ее аргументов.
+        :return: выполнена ли команда без ошибок.
+        """
+        try:
+            command, command_data = get_command()
+            handler = self._handlers[command]
+            return handler(command_data) is not False
+        except CancelledError as err:
+            print(err)
+        except CommandError as err:
+            print(err)
+        except KeyError:
+            print("Команда не найдена")
+        except Exception as err:
+            print(f"Ошибка: {err}")
+        return False
+
+    def close(self) -> None:
+        """
+        Завершение работы движка: несохраненные изменения и журналы
+        изменений сворачиваются в файлы данных таблиц.
+
+        :return: None.
+
+        :raises src.primitive_db.utils.load_data.SaveDataError: если не
+            удалось сохранить данные.
+        """
+        self._core.close()
@@ -1,10 +1,71 @@
 #!/usr/bin/env python3
 import argparse
+import sys
 from pathlib import Path
 
 from src.primitive_db.engine import Engine
 
+from src.primitive_db.client import Client, ClientError
 from src.primitive_db.conf import CONFIG
+from src.primitive_db.utils.load_data import SaveDataError
+
+
+def _address(value: str) -> tuple[str, int]:
+    """
+    Разбор адреса сервера.
+
+    :param value: адрес вида <хост>:<порт>.
+    :return: хост, порт.
+
+    :raises argparse.ArgumentTypeError: если адрес некорректный.
+    """
+    host, _, port = value.rpartition(":")
+    if not host or not port.isdigit():
+        raise argparse.ArgumentTypeError(
+            f"адрес должен иметь вид <хост>:<порт>: {value}"
+        )
+    return host, int(port)
+
+
+def _run_client(
+        address: tuple[str, int],
+        interactive: bool,
+        script_path: str | None
+) -> int:
+    """
+    Работа с сервером базы данных в режиме клиента.
+
+    :param address: хост и порт сервера.
+    :param interactive: вводятся ли команды пользователем.
+    :param script_path: путь файла скрипта (None - команды читаются из
+        стандартного ввода).
+    :return: код завершения.
+    """
+    try:
+        client = Client(*address)
+    except ClientError as err:
+        print(err)
+        return 1
+    failures_count: int = 0
+    try:
+        if interactive:
+            client.run()
+        elif script_path is None:
+            failures_count = client.run_script(sys.stdin)
+        else:
+            with open(script_path, encoding="utf-8") as script:
+                failures_count = client.run_script(script)
+    except KeyboardInterrupt:
+        print("Завершение работы...")
+    except ClientError as err:
+        print(err)
+        failures_count += 1
+    except OSError as err:
+        print(f"Не удалось прочитать скрипт: {err}")
+        failures_count += 1
+    finally:
+        client.close()
+    return 1 if failures_count else 0
 
 
 def main():
@@ -15,16 +76,71 @@ def main():
         dest="config",
         help="Путь файла конфигурации .json"
     )
+    parser.add_argument(
+        "-s", "--script",
+        type=str,
+        dest="script",
+        help="Путь файла скрипта с командами (по одной в строке). Если "
+             "стандартный ввод не является терминалом, то команды читаются "
+             "из него"
+    )
+    parser.add_argument(
+        "-y", "--yes",
+        action="store_true",
+        dest="yes",
+        help="Подтверждать действия без запроса"
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        dest="quiet",
+        help="Не выводить сообщения по отдельным записям и время "
+             "выполнения операций"
+    )
+    parser.add_argument(
+        "--connect",
+        type=_address,
+        dest="connect",
+        metavar="HOST:PORT",
+        help="Адрес сервера базы данных (см. serve): команды выполняются "
+             "на сервере"
+    )
     args = parser.parse_args()
+    interactive: bool = args.script is None and sys.stdin.isatty()
+    CONFIG.set_run_mode(interactive, args.yes, args.quiet)
+
+    if args.connect is not None:
+        # файл конфигурации нужен клиенту только для настроек вывода:
+        if args.config is not None:
+            CONFIG.load(Path(args.config))
+        sys.exit(_run_client(args.connect, interactive, args.script))
 
     CONFIG.load(Path(args.config))
     # CONFIG.load(Path("/home/hex/git/masters_degree_python_project_2/src/conf.json"))
 
     engine = Engine(CONFIG.database_path)
+    failures_count: int = 0
     try:
-        engine.run()
+        if interactive:
+            engine.run()
+        elif args.script is None:
+            failures_count = engine.run_script(sys.stdin)
+        else:
+            with open(args.script, encoding="utf-8") as script:
+                failures_count = engine.run_script(script)
     except KeyboardInterrupt:
         print("Завершение работы...")
+    except OSError as err:
+        print(f"Не удалось прочитать скрипт: {err}")
+        failures_count += 1
+    finally:
+        try:
+            engine.close()
+        except SaveDataError as err:
+            print(f"Не удалось сохранить данные: {err}")
+            failures_count += 1
+    if failures_count:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
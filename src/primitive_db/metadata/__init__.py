@@ -1,10 +1,12 @@
 from .column import Column
 from .database import Database, DatabaseError
+from .index import Index
 from .table import Table
 
 __all__ = [
     "Database",
     "Table",
     "Column",
+    "Index",
     "DatabaseError"
 ]
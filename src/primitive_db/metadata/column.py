@@ -2,6 +2,7 @@ from typing import Any
 
 from src.primitive_db.const.columns_type import ColumnsType
 
+from .column_stats import ColumnStats
 from .db_object import Field, Model, ValidationError
 from .validator import field_validator
 
@@ -26,6 +27,8 @@ _COLUMN_TYPE = {
 
 class Column(Model):
     column_type: str = Field(str, required=True, alias="type")
+    # статистика значений колонки (None - команда analyze не выполнялась):
+    stats: ColumnStats | None = Field(ColumnStats, default=None)
     column_class: type
 
     _python_type: type | None = None
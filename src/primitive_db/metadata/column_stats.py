@@ -0,0 +1,209 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from .db_object import Field, Model
+
+# количество интервалов гистограммы:
+HISTOGRAM_BUCKETS = 10
+
+
+class ColumnStats(Model):
+    """
+    Статистика значений колонки таблицы. Имя статистики совпадает с именем
+    колонки.
+
+    Гистограмма равной глубины хранится как список границ интервалов:
+    каждый интервал содержит примерно одинаковое количество строк, первая
+    граница - минимальное значение колонки, последняя - максимальное.
+
+    При добавлении, изменении и удалении строк количество строк и
+    количество пустых значений обновляются сразу, минимальное/максимальное
+    значения - только расширяются новыми значениями. Количество различных
+    значений и внутренние границы гистограммы обновляются только командой
+    analyze.
+    """
+    rows_count: int = Field(int, default=0)
+    distinct_count: int = Field(int, default=0)
+    empty_count: int = Field(int, default=0)
+    histogram: list = Field(list[object], default_factory=list)
+
+    def __str__(self):
+        return f"<ColumnStats {self.name}: {self.rows_count} rows>"
+
+    @classmethod
+    def collect(cls, name: str, values: Sequence) -> "ColumnStats":
+        """
+        Сбор статистики по значениям колонки.
+
+        :param name: имя колонки.
+        :param values: значения колонки во всех строках таблицы.
+        :return: статистика колонки.
+        """
+        stats = cls(
+            name,
+            rows_count=len(values),
+            distinct_count=len(set(values)),
+            empty_count=_empty_count(values)
+        )
+        stats.histogram = _build_histogram(sorted(values))
+        return stats
+
+    @property
+    def min_value(self) -> Any:
+        """
+        :return: минимальное значение колонки (None - нет строк).
+        """
+        return self.histogram[0] if self.histogram else None
+
+    @property
+    def max_value(self) -> Any:
+        """
+        :return: максимальное значение колонки (None - нет строк).
+        """
+        return self.histogram[-1] if self.histogram else None
+
+    def add_values(self, values: Sequence) -> None:
+        """
+        Обновление статистики при добавлении строк.
+
+        :param values: значения колонки в добавленных строках.
+        :return: None.
+        """
+        if not values:
+            return
+        self.rows_count += len(values)
+        self.empty_count += _empty_count(values)
+        if not self.histogram:
+            self.histogram = _build_histogram(sorted(values))
+            self.distinct_count = len(set(values))
+            return
+        if len(self.histogram) == 1:
+            self.histogram.append(self.histogram[0])
+        self.histogram[0] = min(self.histogram[0], min(values))
+        self.histogram[-1] = max(self.histogram[-1], max(values))
+
+    def remove_values(self, values: Sequence) -> None:
+        """
+        Обновление статистики при удалении строк. Минимальное и
+        максимальное значения не сужаются: для оценки доли строк достаточно
+        границ, содержащих все значения колонки.
+
+        :param values: значения колонки в удаленных строках.
+        :return: None.
+        """
+        if not values:
+            return
+        self.rows_count = max(self.rows_count - len(values), 0)
+        self.empty_count = max(self.empty_count - _empty_count(values), 0)
+        if not self.rows_count:
+            self.distinct_count = 0
+            self.empty_count = 0
+            self.histogram = []
+
+    def copy(self) -> "ColumnStats":
+        """
+        :return: копия статистики.
+        """
+        return ColumnStats(
+            self.name,
+            rows_count=self.rows_count,
+            distinct_count=self.distinct_count,
+            empty_count=self.empty_count,
+            histogram=list(self.histogram)
+        )
+
+    def eq_fraction(self, value: Any) -> float:
+        """
+        Оценка доли строк, в которых значение колонки равно заданному.
+
+        :param value: значение, приведенное к типу колонки.
+        :return: доля строк от 0 до 1.
+        """
+        if not self.histogram:
+            return 0.0
+        if value < self.min_value or value > self.max_value:
+            return 0.0
+        fraction: float = 1 / max(self.distinct_count, 1)
+        if isinstance(value, int):
+            # частые значения занимают несколько интервалов гистограммы:
+            fraction = max(fraction, self.range_fraction(value, value))
+        return fraction
+
+    def range_fraction(
+            self,
+            low: int | None,
+            high: int | None,
+            include_low: bool = True,
+            include_high: bool = True
+    ) -> float:
+        """
+        Оценка доли строк, в которых значение колонки попадает в диапазон.
+        Внутри интервала гистограммы значения считаются распределенными
+        равномерно.
+
+        :param low: нижняя граница диапазона (None - не ограничена).
+        :param high: верхняя граница диапазона (None - не ограничена).
+        :param include_low: включать ли нижнюю границу.
+        :param include_high: включать ли верхнюю границу.
+        :return: доля строк от 0 до 1.
+        """
+        if not self.histogram:
+            return 0.0
+        low_bisect = bisect_left if include_low else bisect_right
+        high_bisect = bisect_right if include_high else bisect_left
+        buckets_count: int = len(self.histogram) - 1
+        if not buckets_count:
+            # все значения колонки одинаковые:
+            start = 0 if low is None else low_bisect(self.histogram, low)
+            end = 1 if high is None else high_bisect(self.histogram, high)
+            return float(max(end - start, 0))
+        start = 0.0 if low is None else self._position(low, low_bisect)
+        end = buckets_count if high is None \
+            else self._position(high, high_bisect)
+        return max(end - start, 0.0) / buckets_count
+
+    def _position(self, value: int, bisect: Callable) -> float:
+        """
+        Положение значения в гистограмме.
+
+        :param value: значение.
+        :param bisect: функция двоичного поиска (bisect_left или
+            bisect_right), определяющая, учитываются ли границы интервалов,
+            равные значению.
+        :return: номер интервала с дробной частью от 0 до количества
+            интервалов.
+        """
+        i: int = bisect(self.histogram, value)
+        if i == 0:
+            return 0.0
+        if i == len(self.histogram):
+            return float(i - 1)
+        low, high = self.histogram[i - 1], self.histogram[i]
+        return i - 1 + (value - low) / (high - low)
+
+
+def _build_histogram(values: list) -> list:
+    """
+    Построение гистограммы равной глубины.
+
+    :param values: отсортированный список значений.
+    :return: границы интервалов гистограммы.
+    """
+    if not values:
+        return []
+    buckets_count: int = min(HISTOGRAM_BUCKETS, len(values) - 1)
+    if not buckets_count:
+        return [values[0]]
+    return [
+        values[i * (len(values) - 1) // buckets_count]
+        for i in range(buckets_count + 1)
+    ]
+
+
+def _empty_count(values: Sequence) -> int:
+    """
+    :param values: значения колонки.
+    :return: количество пустых строковых значений.
+    """
+    return sum(1 for value in values if value == "")
@@ -183,6 +183,9 @@ class Model:
             field_types = field.types()
             if field_types[0] is list:
                 value = self._handle_list(value, field_types[1])
+            elif issubclass(field_types[0], Model) and \
+                    isinstance(value, dict):
+                value = field_types[0](**value)
             else:
                 value = field_types[0](value)
         except (ValueError, TypeError) as err:
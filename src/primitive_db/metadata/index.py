@@ -0,0 +1,214 @@
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable
+from typing import Any
+
+from src.primitive_db.const.index_types import IndexTypes
+
+from .db_object import Field, Model, ValidationError
+from .validator import field_validator
+
+
+class IndexTypeError(ValidationError):
+    """
+    Класс ошибок, возникающий при попытке создать индекс с несуществующим
+    типом.
+    """
+    pass
+
+
+class Index(Model):
+    """
+    Индекс по колонке таблицы. Имя индекса совпадает с именем колонки.
+
+    Хэш-индекс хранит соответствие {значение колонки: множество ID строк}.
+    Упорядоченный индекс дополнительно хранит отсортированный список
+    значений колонки, что позволяет выполнять поиск по диапазону значений
+    двоичным поиском.
+    """
+    index_type: str = Field(
+        str,
+        default=IndexTypes.hash.value,
+        alias="type"
+    )
+
+    _entries: dict[Any, set[int]] | None = None
+    _keys: list | None = None
+
+    def __str__(self):
+        return f"<Index {self.name}: {self.index_type}>"
+
+    @field_validator("index_type")
+    def index_type_validator(self, value: str) -> str:
+        try:
+            IndexTypes(value)
+        except ValueError:
+            raise IndexTypeError(f"Тип индекса {value} не поддерживается")
+        return value
+
+    @property
+    def is_sorted(self) -> bool:
+        """
+        :return: True, если индекс упорядоченный.
+        """
+        return self.index_type == IndexTypes.sorted.value
+
+    def clear(self) -> None:
+        """
+        Очистка индекса.
+
+        :return: None.
+        """
+        self._entries = {}
+        self._keys = [] if self.is_sorted else None
+
+    def build(self, items: Iterable[tuple[Any, int]]) -> None:
+        """
+        Заполнение индекса заново. Список значений упорядоченного индекса
+        сортируется один раз, после добавления всех строк.
+
+        :param items: пары (значение колонки, ID строки).
+        :return: None.
+        """
+        entries: dict[Any, set[int]] = {}
+        for value, row_id in items:
+            row_ids = entries.get(value)
+            if row_ids is None:
+                row_ids = entries[value] = set()
+            row_ids.add(row_id)
+        self._entries = entries
+        self._keys = sorted(entries) if self.is_sorted else None
+
+    def add(self, value: Any, row_id: int) -> None:
+        """
+        Добавление строки в индекс.
+
+        :param value: значение колонки в строке.
+        :param row_id: ID строки.
+        :return: None.
+        """
+        row_ids = self._entries.get(value)
+        if row_ids is None:
+            row_ids = self._entries[value] = set()
+            if self._keys is not None:
+                insort(self._keys, value)
+        row_ids.add(row_id)
+
+    def remove(self, value: Any, row_id: int) -> None:
+        """
+        Удаление строки из индекса.
+
+        :param value: значение колонки в строке.
+        :param row_id: ID строки.
+        :return: None.
+        """
+        row_ids = self._entries.get(value)
+        if row_ids is None:
+            return
+        row_ids.discard(row_id)
+        if not row_ids:
+            del self._entries[value]
+            if self._keys is not None:
+                del self._keys[bisect_left(self._keys, value)]
+
+    def lookup(self, value: Any) -> set[int]:
+        """
+        Поиск строк по значению колонки.
+
+        :param value: значение колонки.
+        :return: множество ID строк с заданным значением.
+        """
+        return self._entries.get(value, set())
+
+    @property
+    def keys_count(self) -> int:
+        """
+        :return: количество различных значений колонки в индексе.
+        """
+        return len(self._entries)
+
+    def count(self, value: Any) -> int:
+        """
+        :param value: значение колонки.
+        :return: количество строк с заданным значением.
+        """
+        return len(self._entries.get(value, ()))
+
+    def range_keys_count(
+            self,
+            low: Any,
+            high: Any,
+            include_low: bool = True,
+            include_high: bool = True
+    ) -> int:
+        """
+        Количество различных значений колонки из диапазона (только для
+        упорядоченного индекса). Вычисляется двоичным поиском, без
+        просмотра значений.
+
+        :param low: нижняя граница диапазона (None - не ограничена).
+        :param high: верхняя граница диапазона (None - не ограничена).
+        :param include_low: включать ли нижнюю границу.
+        :param include_high: включать ли верхнюю границу.
+        :return: количество значений из диапазона.
+        """
+        start, end = key_range(
+            self._keys, low, high, include_low, include_high
+        )
+        return end - start
+
+    def range(
+            self,
+            low: Any,
+            high: Any,
+            include_low: bool = True,
+            include_high: bool = True
+    ) -> set[int]:
+        """
+        Поиск строк по диапазону значений колонки (только для
+        упорядоченного индекса).
+
+        :param low: нижняя граница диапазона (None - не ограничена).
+        :param high: верхняя граница диапазона (None - не ограничена).
+        :param include_low: включать ли нижнюю границу.
+        :param include_high: включать ли верхнюю границу.
+        :return: множество ID строк со значениями из диапазона.
+        """
+        start, end = key_range(
+            self._keys, low, high, include_low, include_high
+        )
+        rows_ids: set[int] = set()
+        for key in self._keys[start:end]:
+            rows_ids.update(self._entries[key])
+        return rows_ids
+
+
+def key_range(
+        keys: list,
+        low: Any,
+        high: Any,
+        include_low: bool = True,
+        include_high: bool = True
+) -> tuple[int, int]:
+    """
+    Поиск границ диапазона в отсортированном списке.
+
+    :param keys: отсортированный список значений.
+    :param low: нижняя граница диапазона (None - не ограничена).
+    :param high: верхняя граница диапазона (None - не ограничена).
+    :param include_low: включать ли нижнюю границу.
+    :param include_high: включать ли верхнюю границу.
+    :return: индексы начала и конца (не включительно) диапазона в списке.
+    """
+    if low is None:
+        start = 0
+    elif include_low:
+        start = bisect_left(keys, low)
+    else:
+        start = bisect_right(keys, low)
+    if high is None:
+        end = len(keys)
+    elif include_high:
+        end = bisect_right(keys, high)
+    else:
+        end = bisect_left(keys, high)
+    return start, max(start, end)
@@ -1,12 +1,38 @@
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+from operator import itemgetter
 from typing import Any, Optional
 
+from src.primitive_db.const.access_paths import AccessPaths
+from src.primitive_db.const.aggregate_functions import NUMERIC_FUNCTIONS
 from src.primitive_db.const.auto_column_names import AutoColumnNames
+from src.primitive_db.const.change_operations import ChangeOperations
+from src.primitive_db.const.file_formats import FileFormats
+from src.primitive_db.const.index_types import IndexTypes
+from src.primitive_db.const.operators import Operators
+from src.primitive_db.const.storage_types import StorageTypes
+from src.primitive_db.query.aggregate import Aggregator
+from src.primitive_db.query.ast import Aggregate
+from src.primitive_db.query.condition import Condition
+from src.primitive_db.query.planner import (
+    PreparedConditions,
+    QueryPlan,
+    plan_query,
+)
+from src.primitive_db.storage import Storage, StorageError, create_storage
 from src.primitive_db.utils.duplicates import get_duplicates
+from src.primitive_db.utils.external_sort import sort_rows
 
 from .column import Column
+from .column_stats import ColumnStats
 from .db_object import DatabaseError, Field, Model, ValidationError
+from .index import Index, key_range
 from .validator import field_validator
 
+# условия фильтрации: словарь вида {колонка: значение} (проверка на
+# равенство) или список условий (в том числе PreparedConditions):
+WhereType = dict[str, Any] | Sequence[Condition]
+
 
 class TableError(DatabaseError):
     """
@@ -29,9 +55,43 @@ class UnknownColumnError(TableError):
     pass
 
 
+class TableIndexError(TableError):
+    """
+    Класс ошибок, возникающих при работе с индексами таблиц.
+    """
+    pass
+
+
 class Table(Model):
     columns: list[Column] = Field(list[Column], required=True)
-    _rows: list[dict] | None = None
+    next_id: int = Field(int, default=1)
+    indexes: list[Index] = Field(list[Index], default_factory=list)
+    storage_type: str = Field(
+        str,
+        default=StorageTypes.rows.value,
+        alias="storage"
+    )
+    file_format: str = Field(
+        str,
+        default=FileFormats.json.value,
+        alias="format"
+    )
+    # количество строк, сохраняется в метаданных, чтобы получать его без
+    # загрузки данных таблицы:
+    stored_rows_count: int = Field(int, default=0, alias="rows_count")
+    # хранилище строк таблицы:
+    _storage: Storage | None = None
+    # отсортированный список ID строк (None - требуется перестроение):
+    _sorted_ids: list[int] | None = None
+    # журнал отмены изменений вида [(операция, данные)] (None - изменения не
+    # отслеживаются):
+    _undo_log: list[tuple[ChangeOperations, Any]] | None = None
+    # значения next_id и stored_rows_count на момент начала отслеживания:
+    _undo_state: tuple[int, int] = (1, 0)
+    # статистика колонок на момент начала отслеживания:
+    _undo_stats: list[ColumnStats | None] | None = None
+    # версия плана: увеличивается при изменении индексов и статистики:
+    _plan_version: int = 0
 
     def __str__(self):
         columns = ", ".join([column.name for column in self.columns])
@@ -46,13 +106,113 @@ class Table(Model):
             )
         return columns
 
+    @field_validator("indexes")
+    def indexes_validator(self, indexes: list) -> list:
+        duplicates = get_duplicates(indexes)
+        if duplicates:
+            raise ValidationError(
+                f"индексы с дублирующимися именами ({', '.join(duplicates)})"
+            )
+        for index in indexes:
+            self.get_column(index.name)
+        return indexes
+
+    @field_validator("storage_type")
+    def storage_type_validator(self, value: str) -> str:
+        try:
+            StorageTypes(value)
+        except ValueError:
+            raise ValidationError(f"Тип хранилища {value} не поддерживается")
+        return value
+
+    @field_validator("file_format")
+    def file_format_validator(self, value: str) -> str:
+        try:
+            FileFormats(value)
+        except ValueError:
+            raise ValidationError(f"Формат файла {value} не поддерживается")
+        return value
+
+    @property
+    def is_loaded(self) -> bool:
+        """
+        :return: True, если данные таблицы загружены.
+        """
+        return self._storage is not None
+
     @property
     def rows(self) -> list[dict]:
-        return self._rows
+        return list(self._storage.rows())
 
     @rows.setter
     def rows(self, rows: list[dict]) -> None:
-        self._rows = [self._validate_row(row) for row in rows]
+        self._storage = create_storage(self.storage_type, self.columns)
+        self._sorted_ids = None
+        for row in rows:
+            self._insert_row(row)
+        self._build_indexes(self.indexes)
+        self.stored_rows_count = len(self._storage)
+
+    def attach_storage(self, storage: Storage) -> None:
+        """
+        Подключить хранилище с уже проверенными строками (например, файл
+        таблицы, отображенный в память) без валидации строк. Индексы
+        таблицы перестраиваются.
+
+        :param storage: хранилище строк.
+        :return: None.
+        """
+        self._storage = storage
+        self._sorted_ids = None
+        self._build_indexes(self.indexes)
+        self.next_id = max(self.next_id, max(storage.ids(), default=0) + 1)
+        self.stored_rows_count = len(storage)
+
+    @property
+    def plan_version(self) -> int:
+        """
+        :return: версия плана таблицы: планы выборки, построенные для
+            другой версии, могут ссылаться на удаленные индексы или
+            устаревшую статистику.
+        """
+        return self._plan_version
+
+    @property
+    def rows_count(self) -> int:
+        """
+        :return: количество строк в таблице.
+        """
+        return self.stored_rows_count
+
+    def get_row(self, row_id: int) -> dict | None:
+        """
+        Получить строку таблицы по ID.
+
+        :param row_id: ID строки.
+        :return: строка таблицы, если она существует. Иначе None.
+        """
+        return self._storage.get(row_id)
+
+    def set_storage_type(self, storage_type: str) -> None:
+        """
+        Сменить тип хранилища строк таблицы. Строки таблицы переносятся в
+        новое хранилище. Если перенести строки не удалось, то таблица
+        остается в прежнем хранилище.
+
+        :param storage_type: тип хранилища (rows или columnar).
+        :return: None.
+
+        :raises ValidationError: если тип хранилища не поддерживается.
+
+        :raises StorageError: если строка не может быть сохранена в новом
+            хранилище.
+        """
+        storage_type = self.storage_type_validator(storage_type)
+        storage: Storage = create_storage(storage_type, self.columns)
+        for row in self._storage.rows():
+            storage.insert(row)
+        self._storage = storage
+        self.storage_type = storage_type
 
     def get_column(self, column_name: str) -> Column:
         """
@@ -69,6 +229,177 @@ class Table(Model):
         except IndexError:
             raise UnknownColumnError(f"колонка \"{column_name}\" не найдена")
 
+    def get_index(self, column_name: str) -> Index | None:
+        """
+        Получить индекс по колонке таблицы.
+
+        :param column_name: имя колонки.
+        :return: индекс, если он существует. Иначе None.
+        """
+        indexes = [i for i in self.indexes if i.name == column_name]
+        return indexes[0] if indexes else None
+
+    def create_index(
+            self,
+            column_name: str,
+            index_type: str = IndexTypes.hash.value
+    ) -> Index:
+        """
+        Создать индекс по колонке таблицы и заполнить его текущими
+        строками.
+
+        :param column_name: имя колонки.
+        :param index_type: тип индекса (hash или sorted).
+        :return: созданный индекс.
+
+        :raises UnknownColumnError: если колонка не найдена.
+
+        :raises TableIndexError: если индекс по колонке уже существует.
+
+        :raises ValidationError: если тип индекса не поддерживается.
+        """
+        self.get_column(column_name)
+        if self.get_index(column_name) is not None:
+            raise TableIndexError(
+                f"индекс по колонке \"{column_name}\" уже существует"
+            )
+        index = Index(column_name, type=index_type)
+        self._build_indexes([index])
+        self.indexes.append(index)
+        self._plan_version += 1
+        return index
+
+    def drop_index(self, column_name: str) -> None:
+        """
+        Удалить индекс по колонке таблицы.
+
+        :param column_name: имя колонки.
+        :return: None.
+
+        :raises TableIndexError: если индекс по колонке не существует.
+        """
+        index = self.get_index(column_name)
+        if index is None:
+            raise TableIndexError(
+                f"индекс по колонке \"{column_name}\" не найден"
+            )
+        self.indexes.remove(index)
+        self._plan_version += 1
+
+    def analyze(self) -> list[ColumnStats]:
+        """
+        Сбор статистики значений всех колонок таблицы. Статистика
+        сохраняется в описании колонок.
+
+        :return: статистика колонок.
+        """
+        rows: list[dict] = list(self._storage.rows())
+        for column in self.columns:
+            column.stats = ColumnStats.collect(
+                column.name,
+                [row[column.name] for row in rows]
+            )
+        self._plan_version += 1
+        return [column.stats for column in self.columns]
+
+    def refresh_stats(self) -> None:
+        """
+        Пересчет собранной ранее статистики колонок по текущим данным
+        таблицы (например, после применения журнала изменений).
+
+        :return: None.
+        """
+        columns: list[Column] = [
+            column for column in self.columns if column.stats is not None
+        ]
+        if not columns:
+            return
+        rows: list[dict] = list(self._storage.rows())
+        for column in columns:
+            column.stats = ColumnStats.collect(
+                column.name,
+                [row[column.name] for row in rows]
+            )
+        self._plan_version += 1
+
+    def _update_stats(self, rows: list[dict]) -> None:
+        """
+        Обновление статистики колонок при добавлении строк.
+
+        :param rows: добавленные строки.
+        :return: None.
+        """
+        for column in self.columns:
+            if column.stats is not None:
+                column.stats.add_values([row[column.name] for row in rows])
+
+    def _remove_stats(self, row_ids: list[int]) -> None:
+        """
+        Обновление статистики колонок при удалении строк. Вызывается до
+        удаления строк из хранилища.
+
+        :param row_ids: ID удаляемых строк.
+        :return: None.
+        """
+        for column in self.columns:
+            if column.stats is not None:
+                column.stats.remove_values([
+                    self._storage.value(row_id, column.name)
+                    for row_id in row_ids
+                ])
+
+    def _replace_stats(self, row_ids: list[int], values: dict) -> None:
+        """
+        Обновление статистики колонок при изменении строк. Вызывается до
+        изменения строк в хранилище.
+
+        :param row_ids: ID изменяемых строк.
+        :param values: новые значения вида {имя колонки: значение}.
+        :return: None.
+        """
+        for column in self.columns:
+            if column.stats is not None and column.name in values:
+                column.stats.remove_values([
+                    self._storage.value(row_id, column.name)
+                    for row_id in row_ids
+                ])
+                column.stats.add_values([values[column.name]] * len(row_ids))
+
+    def _build_indexes(self, indexes: list[Index]) -> None:
+        """
+        Заполнение индексов заново по всем строкам хранилища.
+
+        :param indexes: индексы.
+        :return: None.
+        """
+        for index in indexes:
+            index.build(
+                (self._storage.value(row_id, index.name), row_id)
+                for row_id in self._storage.ids()
+            )
+
+    def _index_row(self, row: dict) -> None:
+        """
+        Добавление строки во все индексы таблицы.
+
+        :param row: строка таблицы.
+        :return: None.
+        """
+        row_id: int = row[AutoColumnNames.ID.value]
+        for index in self.indexes:
+            index.add(row[index.name], row_id)
+
+    def _unindex_row(self, row_id: int, indexes: list[Index]) -> None:
+        """
+        Удаление строки из индексов таблицы.
+
+        :param row_id: ID строки.
+        :param indexes: индексы, из которых удаляется строка.
+        :return: None.
+        """
+        for index in indexes:
+            index.remove(self._storage.value(row_id, index.name), row_id)
+
     def _validate_row(self, row: dict) -> dict[str, Any]:
         """
         Валидация строки таблицы.
@@ -103,83 +434,419 @@ class Table(Model):
 
         :raises TableRowError: если строка не соответствует формату таблицы.
         """
-        max_id: int = max(
-            [row[AutoColumnNames.ID.value] for row in self._rows],
-            default=0
-        )
-        row_id = max_id + 1
-        values[AutoColumnNames.ID.value] = row_id
-        row = self._validate_row(values)
-        self._rows.append(row)
+        return self.add_rows([values])[0]
+
+    def add_rows(self, values_list: list[dict]) -> list[int]:
+        """
+        Добавить несколько строк в таблицу.
+
+        Сначала проверяются все строки, затем строкам назначаются ID и они
+        добавляются в таблицу. Если хотя бы одна строка некорректна, то
+        таблица не изменяется.
+
+        :param values_list: список значений колонок строк.
+        :return: список ID добавленных строк.
+
+        :raises TableRowError: если строка не соответствует формату таблицы.
+
+        :raises StorageError: если значение не может быть сохранено в
+            хранилище таблицы.
+        """
+        rows: list[dict] = []
+        for i, values in enumerate(values_list):
+            values[AutoColumnNames.ID.value] = self.next_id + i
+            rows.append(self._validate_row(values))
+        rows_ids: list[int] = [row[AutoColumnNames.ID.value] for row in rows]
+        inserted: int = 0
+        try:
+            for row in rows:
+                self._storage.insert(row)
+                inserted += 1
+        except StorageError:
+            for row_id in rows_ids[:inserted]:
+                self._storage.delete(row_id)
+            raise
+        for row in rows:
+            self._index_row(row)
+        self._update_stats(rows)
+        if self._sorted_ids is not None:
+            self._sorted_ids.extend(rows_ids)
+        if self._undo_log is not None:
+            self._undo_log.append((ChangeOperations.insert, rows_ids))
+        self.next_id += len(rows)
+        self.stored_rows_count += len(rows)
+        return rows_ids
+
+    def append_row(self, row: dict) -> int:
+        """
+        Добавить строку с уже назначенным ID (например, при восстановлении
+        данных из журнала изменений).
+
+        :param row: строка таблицы вида {имя_колонки: значение}.
+        :return: ID добавленной строки.
+
+        :raises TableRowError: если строка не соответствует формату таблицы
+            или строка с таким ID уже существует.
+        """
+        row = self._insert_row(row)
+        row_id: int = row[AutoColumnNames.ID.value]
+        self._index_row(row)
+        if self._sorted_ids is not None:
+            if self._sorted_ids and self._sorted_ids[-1] > row_id:
+                self._sorted_ids = None
+            else:
+                self._sorted_ids.append(row_id)
+        self.stored_rows_count += 1
         return row_id
 
+    def _insert_row(self, row: dict) -> dict:
+        """
+        Добавление строки с уже назначенным ID в хранилище без обновления
+        индексов.
+
+        :param row: строка таблицы вида {имя_колонки: значение}.
+        :return: валидированная строка.
+
+        :raises TableRowError: если строка не соответствует формату таблицы
+            или строка с таким ID уже существует.
+        """
+        row = self._validate_row(row)
+        row_id: int = row[AutoColumnNames.ID.value]
+        if row_id in self._storage:
+            raise TableRowError(f"строка с ID={row_id} уже существует")
+        self._storage.insert(row)
+        self.next_id = max(self.next_id, row_id + 1)
+        return row
+
     def select(
             self,
-            where: Optional[dict]
-    ) -> list[dict]:
+            where: Optional[WhereType],
+            limit: int | None = None,
+            offset: int = 0,
+            after_id: int | None = None,
+            columns: Sequence[str] = (),
+            order_by: str | None = None,
+            descending: bool = False
+    ) -> Iterator[list]:
         """
-        Получить строки таблицы.
-
-        :param where: условия фильтрации вида {колонка: значение}.
-        :return: список строк таблицы.
+        Получить значения колонок в строках таблицы.
+
+        Строки отбираются лениво: фильтрация выполняется по мере чтения
+        результата и прекращается, как только получено limit строк. Из
+        строк читаются только значения выбранных колонок. Условия
+        фильтрации и колонки проверяются сразу при вызове.
+
+        :param where: условия фильтрации: словарь вида {колонка: значение}
+            или список условий.
+        :param limit: максимальное количество строк (None - без
+            ограничения).
+        :param offset: количество пропускаемых строк.
+        :param after_id: если задан, то выбираются только строки с ID больше
+            заданного (постраничный вывод по ключу).
+        :param columns: имена выбираемых колонок (пусто - все колонки).
+        :param order_by: имя колонки сортировки (None - строки выбираются
+            в порядке плана выборки).
+        :param descending: сортировать ли по убыванию.
+        :return: итератор по спискам значений колонок в строках таблицы.
 
         :raises ValueError: некорректное данные для фильтрации.
 
         :raises UnknownColumnError: если колонка не найдена.
         """
-        if not where:
-            return self._rows
-        else:
-            return self._filter_rows(where)
+        column_names: list[str] = [
+            self.get_column(name).name for name in columns
+        ] or [column.name for column in self.columns]
+        order_column: str | None = None
+        if order_by is not None:
+            order_column = self.get_column(order_by).name
+        rows_ids = self._plan_ids(self.plan(where or {}, after_id))
+        stop = None if limit is None else offset + limit
+        if order_column is None:
+            return self._storage.project(
+                islice(rows_ids, offset, stop),
+                column_names
+            )
+        # колонка сортировки читается, даже если она не выбирается:
+        extra: bool = order_column not in column_names
+        names: list[str] = [*column_names, order_column] \
+            if extra else column_names
+        rows = islice(
+            sort_rows(
+                self._storage.project(rows_ids, names),
+                itemgetter(names.index(order_column)),
+                descending,
+                stop
+            ),
+            offset,
+            None
+        )
+        return (row[:-1] for row in rows) if extra else rows
 
-    def _filter_rows(self, conditions: dict) -> list[dict]:
+    def aggregate(
+            self,
+            where: Optional[WhereType],
+            aggregates: Sequence[Aggregate],
+            group_by: str | None = None,
+            limit: int | None = None,
+            offset: int = 0,
+            after_id: int | None = None,
+            order_by: str | None = None,
+            descending: bool = False
+    ) -> Iterator[list]:
         """
-        Фильтрация строк таблицы по значению в колонке.
+        Вычислить агрегатные функции по строкам таблицы.
+
+        Строки читаются за один проход, по мере чтения результата; в памяти
+        хранится только состояние агрегатных функций для каждой группы.
+        Условия фильтрации и колонки проверяются сразу при вызове.
+
+        :param where: условия фильтрации: словарь вида {колонка: значение}
+            или список условий.
+        :param aggregates: агрегатные функции.
+        :param group_by: имя колонки группировки (None - без группировки).
+        :param limit: максимальное количество строк результата (None - без
+            ограничения).
+        :param offset: количество пропускаемых строк результата.
+        :param after_id: если задан, то учитываются только строки с ID
+            больше заданного.
+        :param order_by: имя колонки сортировки результата (только колонка
+            группировки; None - группы выводятся в порядке появления).
+        :param descending: сортировать ли по убыванию.
+        :return: итератор по строкам результата: значение колонки
+            группировки (если задана) и значения агрегатных функций.
+
+        :raises ValueError: некорректные данные для фильтрации, агрегатная
+            функция не применима к колонке или сортировка не по колонке
+            группировки.
 
-        :param conditions: словарь условий фильтрации вида {колонка: значение}
-        :return: список строк, удовлетворяющих фильтру.
+        :raises UnknownColumnError: если колонка не найдена.
+        """
+        numeric_columns: set[str] = set()
+        for aggregate in aggregates:
+            if aggregate.column_name is None:
+                continue
+            column: Column = self.get_column(aggregate.column_name)
+            if column.python_type is int:
+                numeric_columns.add(column.name)
+            elif aggregate.function in NUMERIC_FUNCTIONS:
+                raise ValueError(
+                    f"Функция {aggregate.function.value} применима только к "
+                    f"столбцам типа int"
+                )
+        if group_by is not None:
+            self.get_column(group_by)
+        if order_by is not None and order_by != group_by:
+            raise ValueError(
+                "Результат агрегатных функций сортируется только по столбцу "
+                "группировки"
+            )
+        plan: QueryPlan = self.plan(where or {}, after_id)
+        aggregator = Aggregator(
+            aggregates,
+            numeric_columns,
+            grouped=group_by is not None
+        )
+        stop = None if limit is None else offset + limit
+        rows = self._aggregate_rows(plan, aggregator, group_by)
+        if order_by is None:
+            return islice(rows, offset, stop)
+        # значение колонки группировки - первое в строке результата:
+        return islice(
+            sort_rows(rows, itemgetter(0), descending, stop),
+            offset,
+            None
+        )
+
+    def _aggregate_rows(
+            self,
+            plan: QueryPlan,
+            aggregator: Aggregator,
+            group_by: str | None
+    ) -> Iterator[list]:
+        """
+        Проход по строкам плана выборки с вычислением агрегатных функций.
+
+        :param plan: план выборки.
+        :param aggregator: агрегатные функции.
+        :param group_by: имя колонки группировки.
+        :return: итератор по строкам результата.
+        """
+        value = self._storage.value
+        column_names: list[str] = aggregator.column_names
+        key = None
+        for row_id in self._plan_ids(plan):
+            if group_by is not None:
+                key = value(row_id, group_by)
+            aggregator.add(key, [value(row_id, name) for name in column_names])
+        for key, values in aggregator.results():
+            yield values if group_by is None else [key, *values]
+
+    def _filter_ids(self, where: WhereType) -> Iterable[int]:
+        """
+        Фильтрация строк таблицы по условиям в соответствии с планом
+        выборки.
+
+        :param where: условия фильтрации: словарь вида {колонка: значение}
+            или список условий.
+        :return: итератор по ID строк, удовлетворяющих фильтру.
+
+        :raises UnknownColumnError: если колонка не найдена.
+
+        :raises ValueError: некорректные данные для фильтрации.
+        """
+        return self._plan_ids(self.plan(where))
+
+    def plan(
+            self,
+            where: WhereType,
+            after_id: int | None = None
+    ) -> QueryPlan:
+        """
+        Построение плана выборки строк по условиям фильтрации. Условия
+        подготовленного запроса (PreparedConditions) не проверяются
+        повторно, а план берется из шаблона плана запроса.
+
+        :param where: условия фильтрации: словарь вида {колонка: значение}
+            или список условий.
+        :param after_id: если задан, то выбираются только строки с ID больше
+            заданного.
+        :return: план выборки.
 
         :raises UnknownColumnError: если колонка не найдена.
+
+        :raises ValueError: некорректные данные для фильтрации.
         """
-        conditions = {
-            key: self._validate_value(key, value)
-            for key, value in conditions.items()
-        }
-        return [
-            row for row in self._rows
-            if all(row.get(col) == val for col, val in conditions.items())
-        ]
+        prepared: bool = isinstance(where, PreparedConditions)
+        conditions: list[Condition] = list(where) if prepared \
+            else self._validate_conditions(where)
+        if after_id is not None:
+            conditions.append(
+                Condition(AutoColumnNames.ID.value, Operators.gt, after_id)
+            )
+        if prepared:
+            return where.template.plan(self, conditions)
+        return plan_query(self, conditions)
+
+    def _plan_ids(self, plan: QueryPlan) -> Iterable[int]:
+        """
+        Выполнение плана выборки.
+
+        :param plan: план выборки.
+        :return: итератор по ID строк, удовлетворяющих условиям плана.
+        """
+        row_ids: Iterable[int] | None = self._access_ids(plan)
+        if row_ids is None and not plan.filters:
+            return self._storage.ids()
+        return self._storage.filter(plan.filters, row_ids)
+
+    def _validate_conditions(self, where: WhereType) -> list[Condition]:
+        """
+        Приведение условий фильтрации к списку условий со значениями,
+        приведенными к типам колонок.
+
+        :param where: условия фильтрации.
+        :return: список валидированных условий.
+
+        :raises UnknownColumnError: если колонка не найдена.
+
+        :raises ValueError: некорректные данные для фильтрации.
+        """
+        if isinstance(where, dict):
+            where = [
+                Condition(column_name, Operators.eq, value)
+                for column_name, value in where.items()
+            ]
+        return [c.validate(self.get_column(c.column_name)) for c in where]
+
+    def _access_ids(self, plan: QueryPlan) -> Iterable[int] | None:
+        """
+        Получение ID строк способом доступа плана выборки.
+
+        :param plan: план выборки.
+        :return: ID строк в порядке возрастания ID или None, если
+            необходимо просмотреть все строки таблицы.
+        """
+        condition: Condition | None = plan.access_condition
+        match plan.access_path:
+            case AccessPaths.id_lookup:
+                return [condition.value] \
+                    if condition.value in self._storage \
+                    else []
+            case AccessPaths.id_range:
+                ids: list[int] = self._ids_in_order()
+                start, end = key_range(ids, *condition.bounds())
+                return (ids[i] for i in range(start, end))
+            case AccessPaths.index_lookup:
+                index = self.get_index(condition.column_name)
+                return sorted(index.lookup(condition.value))
+            case AccessPaths.index_range:
+                index = self.get_index(condition.column_name)
+                return sorted(index.range(*condition.bounds()))
+        return None
+
+    def id_range_count(self, condition: Condition) -> int:
+        """
+        Количество строк с ID из диапазона условия (двоичный поиск по
+        отсортированному списку ID).
+
+        :param condition: валидированное условие по колонке ID.
+        :return: количество строк.
+        """
+        start, end = key_range(self._ids_in_order(), *condition.bounds())
+        return end - start
+
+    def _ids_in_order(self) -> list[int]:
+        """
+        :return: отсортированный список ID строк таблицы.
+        """
+        if self._sorted_ids is None:
+            self._sorted_ids = sorted(self._storage.ids())
+        return self._sorted_ids
 
     def update_row(
             self,
             set_data: dict,
-            where_data: dict
+            where_data: WhereType
     ) -> list[int]:
         """
         Обновить строки таблицы.
 
         :param set_data: данные для обновления вида {колонка: значение}.
-        :param where_data: название колонки для обновления.
+        :param where_data: условия фильтрации обновляемых строк.
         :return: список ID обновленных строк.
 
         :raises UnknownColumnError: если колонка не найдена.
 
+        :raises TableRowError: если требуется изменить ID строки.
+
         :raises ValueError: переданы некорректные данные.
         """
+        if AutoColumnNames.ID.value in set_data:
+            raise TableRowError(
+                f"колонка {AutoColumnNames.ID.value} не может быть изменена"
+            )
         validated_set = {
             col: self._validate_value(col, val)
             for col, val in set_data.items()
         }
-        validated_where = {
-            col: self._validate_value(col, val)
-            for col, val in where_data.items()
-        }
-        updated_rows = self._filter_rows(validated_where)
-        updated_rows_ids: list[int] = []
-        for row in updated_rows:
-            for set_column_name, set_value in validated_set.items():
-                row[set_column_name] = set_value
-            updated_rows_ids.append(row[AutoColumnNames.ID.value])
+        updated_rows_ids: list[int] = list(self._filter_ids(where_data))
+        indexes: list[Index] = [
+            index for index in self.indexes if index.name in validated_set
+        ]
+        if self._undo_log is not None:
+            self._undo_log.append((ChangeOperations.update, {
+                row_id: {
+                    column: self._storage.value(row_id, column)
+                    for column in validated_set
+                }
+                for row_id in updated_rows_ids
+            }))
+        self._replace_stats(updated_rows_ids, validated_set)
+        for row_id in updated_rows_ids:
+            self._unindex_row(row_id, indexes)
+            self._storage.update(row_id, validated_set)
+            for index in indexes:
+                index.add(validated_set[index.name], row_id)
         return updated_rows_ids
 
     def _validate_value(self, column_name: str, value: Any) -> Any:
@@ -199,18 +866,118 @@ class Table(Model):
 
     def delete_row(
             self,
-            where: dict
+            where: WhereType
     ) -> list[int]:
         """
         Удалить строки таблицы.
 
-        :param where: условия фильтрации вида {колонка: значение}.
+        :param where: условия фильтрации: словарь вида {колонка: значение}
+            или список условий.
         :return: список ID удаленных строк.
+
+        :raises UnknownColumnError: если колонка не найдена.
+
+        :raises ValueError: некорректные данные для фильтрации.
         """
-        validated_where = {
-            col: self._validate_value(col, val)
-            for col, val in where.items()
-        }
-        deleted_rows = self._filter_rows(validated_where)
-        self._rows = [row for row in self._rows if row not in deleted_rows]
-        return [row[AutoColumnNames.ID.value] for row in deleted_rows]
+        deleted_rows_ids: list[int] = list(self._filter_ids(where))
+        if self._undo_log is not None:
+            self._undo_log.append((
+                ChangeOperations.delete,
+                [self._storage.get(row_id) for row_id in deleted_rows_ids]
+            ))
+        self._remove_stats(deleted_rows_ids)
+        for row_id in deleted_rows_ids:
+            self._unindex_row(row_id, self.indexes)
+            self._storage.delete(row_id)
+        self.stored_rows_count -= len(deleted_rows_ids)
+        if deleted_rows_ids:
+            self._sorted_ids = None
+        return deleted_rows_ids
+
+    @property
+    def is_tracking_changes(self) -> bool:
+        """
+        :return: True, если изменения таблицы отслеживаются для отмены.
+        """
+        return self._undo_log is not None
+
+    def begin_changes(self) -> None:
+        """
+        Начать отслеживание изменений таблицы: все последующие изменения
+        строк записываются в журнал отмены, пока не будут зафиксированы
+        (`commit_changes`) или отменены (`rollback_changes`).
+
+        :return: None.
+
+        :raises TableError: если изменения уже отслеживаются.
+        """
+        if self._undo_log is not None:
+            raise TableError(
+                f"изменения таблицы {self.name} уже отслеживаются"
+            )
+        self._undo_log = []
+        self._undo_state = (self.next_id, self.stored_rows_count)
+        self._undo_stats = [
+            None if column.stats is None else column.stats.copy()
+            for column in self.columns
+        ]
+
+    def commit_changes(self) -> None:
+        """
+        Зафиксировать изменения таблицы: журнал отмены очищается.
+
+        :return: None.
+        """
+        self._undo_log = None
+        self._undo_stats = None
+
+    def rollback_changes(self) -> None:
+        """
+        Отменить изменения таблицы, сделанные после вызова `begin_changes`.
+        Изменения отменяются в памяти в обратном порядке, без повторной
+        загрузки данных из файла. Если восстанавливались удаленные строки, то
+        хранилище перестраивается, чтобы сохранить порядок строк по ID.
+        Статистика колонок восстанавливается на момент вызова
+        `begin_changes`.
+
+        :return: None.
+        """
+        if self._undo_log is None:
+            return
+        rows_restored: bool = False
+        for operation, data in reversed(self._undo_log):
+            match operation:
+                case ChangeOperations.insert:
+                    for row_id in data:
+                        self._unindex_row(row_id, self.indexes)
+                        self._storage.delete(row_id)
+                case ChangeOperations.update:
+                    for row_id, old_values in data.items():
+                        indexes: list[Index] = [
+                            index for index in self.indexes
+                            if index.name in old_values
+                        ]
+                        self._unindex_row(row_id, indexes)
+                        self._storage.update(row_id, old_values)
+                        for index in indexes:
+                            index.add(old_values[index.name], row_id)
+                case ChangeOperations.delete:
+                    for row in data:
+                        self._storage.insert(row)
+                        self._index_row(row)
+                    rows_restored = rows_restored or bool(data)
+        if rows_restored:
+            storage: Storage = create_storage(self.storage_type, self.columns)
+            for row in sorted(
+                self._storage.rows(),
+                key=lambda r: r[AutoColumnNames.ID.value]
+            ):
+                storage.insert(row)
+            self.attach_storage(storage)
+        self.next_id, self.stored_rows_count = self._undo_state
+        for column, stats in zip(self.columns, self._undo_stats or ()):
+            column.stats = stats
+        self._plan_version += 1
+        self._sorted_ids = None
+        self._undo_log = None
+        self._undo_stats = None
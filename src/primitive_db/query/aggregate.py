@@ -0,0 +1,205 @@
+from array import array
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+from src.primitive_db.const.aggregate_functions import AggregateFunctions
+
+from .ast import Aggregate
+
+try:
+    import numpy
+except ImportError:
+    # NumPy не установлен: значения агрегируются по одному
+    numpy = None
+
+# количество значений, накапливаемых перед векторизованной обработкой:
+CHUNK_SIZE = 65536
+# граница значений int64:
+INT64_LIMIT = 2 ** 63
+
+
+class ColumnAccumulator:
+    """
+    Накопитель значений колонки для агрегатных функций: количество, сумма,
+    минимальное и максимальное значения.
+
+    :param numeric: вычислять ли сумму значений (для колонок типа int).
+    """
+    def __init__(self, numeric: bool):
+        self._numeric = numeric
+        self.count: int = 0
+        self.total: int = 0
+        self.minimum: Any = None
+        self.maximum: Any = None
+
+    def add(self, value: Any) -> None:
+        """
+        Добавление значения.
+
+        :param value: значение колонки.
+        :return: None.
+        """
+        self.count += 1
+        if self._numeric:
+            self.total += value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def result(self, function: AggregateFunctions) -> Any:
+        """
+        :param function: агрегатная функция.
+        :return: значение агрегатной функции (None для sum, avg, min, max,
+            если значений нет).
+        """
+        match function:
+            case AggregateFunctions.count:
+                return self.count
+            case AggregateFunctions.sum:
+                return self.total if self.count else None
+            case AggregateFunctions.avg:
+                return self.total / self.count if self.count else None
+            case AggregateFunctions.min:
+                return self.minimum
+            case AggregateFunctions.max:
+                return self.maximum
+
+
+class VectorAccumulator(ColumnAccumulator):
+    """
+    Накопитель значений колонки типа int, обрабатывающий значения пачками
+    по CHUNK_SIZE с помощью NumPy. Значения, не помещающиеся в int64,
+    обрабатываются по одному.
+    """
+    def __init__(self):
+        super().__init__(numeric=True)
+        self._buffer: array = array("q")
+
+    def add(self, value: int) -> None:
+        try:
+            self._buffer.append(value)
+        except OverflowError:
+            super().add(value)
+            return
+        if len(self._buffer) >= CHUNK_SIZE:
+            self._flush()
+
+    def result(self, function: AggregateFunctions) -> Any:
+        self._flush()
+        return super().result(function)
+
+    def _flush(self) -> None:
+        """
+        Обработка накопленных значений.
+
+        :return: None.
+        """
+        if not self._buffer:
+            return
+        values = numpy.frombuffer(self._buffer, dtype=numpy.int64)
+        # буфер занят представлением values, поэтому создается новый:
+        self._buffer = array("q")
+        low, high = int(values.min()), int(values.max())
+        if max(-low, high) * len(values) < INT64_LIMIT:
+            total = int(values.sum())
+        else:
+            # сумма может не поместиться в int64:
+            total = sum(values.tolist())
+        self.count += len(values)
+        self.total += total
+        if self.minimum is None or low < self.minimum:
+            self.minimum = low
+        if self.maximum is None or high > self.maximum:
+            self.maximum = high
+
+
+class _Group:
+    """
+    Состояние агрегатных функций для группы строк.
+
+    :param accumulators: накопители значений колонок.
+    """
+    __slots__ = ("rows_count", "accumulators")
+
+    def __init__(self, accumulators: list[ColumnAccumulator]):
+        self.rows_count: int = 0
+        self.accumulators = accumulators
+
+
+class Aggregator:
+    """
+    Вычисление агрегатных функций за один проход по строкам с группировкой
+    по хэшу значения колонки группировки. Для каждой группы хранится только
+    состояние агрегатных функций.
+
+    :param aggregates: агрегатные функции.
+    :param numeric_columns: имена колонок типа int.
+    :param grouped: выполняется ли группировка. Без группировки результат
+        содержит одну строку, даже если строк нет.
+    """
+    def __init__(
+            self,
+            aggregates: Sequence[Aggregate],
+            numeric_columns: set[str],
+            grouped: bool
+    ):
+        self._aggregates = aggregates
+        # колонки, значения которых передаются в add:
+        self.column_names: list[str] = list(dict.fromkeys(
+            a.column_name for a in aggregates if a.column_name is not None
+        ))
+        self._numeric = [
+            name in numeric_columns for name in self.column_names
+        ]
+        # векторизация выполняется без группировки: иначе буферы значений
+        # создавались бы для каждой группы
+        self._vectorized: bool = numpy is not None and not grouped
+        self._groups: dict[Any, _Group] = {}
+        if not grouped:
+            self._groups[None] = self._new_group()
+
+    def add(self, key: Any, values: Sequence) -> None:
+        """
+        Добавление строки.
+
+        :param key: значение колонки группировки (None без группировки).
+        :param values: значения колонок column_names.
+        :return: None.
+        """
+        group: _Group | None = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = self._new_group()
+        group.rows_count += 1
+        for accumulator, value in zip(group.accumulators, values):
+            accumulator.add(value)
+
+    def results(self) -> Iterator[tuple[Any, list]]:
+        """
+        :return: итератор по парам (значение колонки группировки, значения
+            агрегатных функций) в порядке появления групп.
+        """
+        positions: dict[str, int] = {
+            name: i for i, name in enumerate(self.column_names)
+        }
+        for key, group in self._groups.items():
+            values: list = []
+            for aggregate in self._aggregates:
+                if aggregate.column_name is None:
+                    values.append(group.rows_count)
+                else:
+                    accumulator = group.accumulators[
+                        positions[aggregate.column_name]
+                    ]
+                    values.append(accumulator.result(aggregate.function))
+            yield key, values
+
+    def _new_group(self) -> _Group:
+        """
+        :return: группа с пустыми накопителями.
+        """
+        return _Group([
+            VectorAccumulator() if numeric and self._vectorized
+            else ColumnAccumulator(numeric)
+            for numeric in self._numeric
+        ])
@@ -0,0 +1,136 @@
+from typing import Any, NamedTuple
+
+from src.primitive_db.const.aggregate_functions import AggregateFunctions
+from src.primitive_db.const.commands import Commands
+
+from .condition import Condition
+
+
+class Placeholder(NamedTuple):
+    """
+    Параметр подготовленного запроса (знак ? в тексте запроса).
+
+    :param index: порядковый номер параметра в запросе (с 0).
+    """
+    index: int
+
+    def __str__(self):
+        return "?"
+
+
+class Aggregate(NamedTuple):
+    """
+    Агрегатная функция в запросе выборки: count(*), sum(<колонка>) и т.д.
+
+    :param function: агрегатная функция.
+    :param column_name: имя колонки (None - для count(*)).
+    """
+    function: AggregateFunctions
+    column_name: str | None = None
+
+    def __str__(self):
+        return f"{self.function.value}({self.column_name or '*'})"
+
+
+class JoinClause(NamedTuple):
+    """
+    Соединение таблиц в запросе выборки: join <таблица> on <колонка> =
+    <колонка>. Имена колонок могут быть указаны с именем таблицы
+    (<таблица>.<колонка>).
+
+    :param table: имя присоединяемой таблицы.
+    :param left_column: имя колонки левой части условия соединения.
+    :param right_column: имя колонки правой части условия соединения.
+    """
+    table: str
+    left_column: str
+    right_column: str
+
+    def __str__(self):
+        return f"join {self.table} on {self.left_column} = {self.right_column}"
+
+
+# значения колонок одной строки в порядке колонок таблицы (без ID):
+RowValuesType = tuple[Any, ...]
+# присваивание вида (имя колонки, значение):
+AssignmentType = tuple[str, Any]
+
+
+class InsertStatement(NamedTuple):
+    """
+    Запрос вставки строк: insert into <таблица> values (...), (...).
+
+    :param table: имя таблицы.
+    :param rows: значения колонок вставляемых строк.
+    """
+    table: str
+    rows: tuple[RowValuesType, ...]
+
+    kind = Commands.insert
+
+
+class SelectStatement(NamedTuple):
+    """
+    Запрос выборки строк: select [<колонки> | <агрегатные функции>] from
+    <таблица> [join ...] [where ...] [group by ...] [order by ...]
+    [after ID=...] [limit ...] [offset ...].
+
+    :param table: имя таблицы.
+    :param where: условия фильтрации строк.
+    :param after_id: выбирать строки с ID больше заданного.
+    :param limit: максимальное количество строк.
+    :param offset: количество пропускаемых строк.
+    :param aggregates: агрегатные функции (пусто - выбираются строки).
+    :param group_by: имя колонки группировки.
+    :param columns: имена выбираемых колонок (пусто - все колонки).
+    :param order_by: имя колонки сортировки (None - без сортировки).
+    :param descending: сортировать ли по убыванию.
+    :param join: соединение с другой таблицей (None - без соединения).
+    """
+    table: str
+    where: tuple[Condition, ...] = ()
+    after_id: int | None = None
+    limit: int | None = None
+    offset: int = 0
+    aggregates: tuple[Aggregate, ...] = ()
+    group_by: str | None = None
+    columns: tuple[str, ...] = ()
+    order_by: str | None = None
+    descending: bool = False
+    join: JoinClause | None = None
+
+    kind = Commands.select
+
+
+class UpdateStatement(NamedTuple):
+    """
+    Запрос обновления строк: update <таблица> set <колонка> = <значение>,
+    ... where ...
+
+    :param table: имя таблицы.
+    :param assignments: присваивания вида (имя колонки, значение).
+    :param where: условия фильтрации обновляемых строк.
+    """
+    table: str
+    assignments: tuple[AssignmentType, ...]
+    where: tuple[Condition, ...]
+
+    kind = Commands.update
+
+
+class DeleteStatement(NamedTuple):
+    """
+    Запрос удаления строк: delete from <таблица> where ...
+
+    :param table: имя таблицы.
+    :param where: условия фильтрации удаляемых строк.
+    """
+    table: str
+    where: tuple[Condition, ...]
+
+    kind = Commands.delete
+
+
+Statement = (
+    InsertStatement | SelectStatement | UpdateStatement | DeleteStatement
+)
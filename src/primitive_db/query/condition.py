@@ -0,0 +1,112 @@
+from typing import TYPE_CHECKING, Any
+
+from src.primitive_db.const.operators import RANGE_OPERATORS, Operators
+
+if TYPE_CHECKING:
+    # импорт только для аннотаций: модуль metadata сам использует условия
+    from src.primitive_db.metadata.column import Column
+
+
+class Condition:
+    """
+    Условие фильтрации строк вида <колонка> <оператор> <значение>.
+
+    :param column_name: имя колонки.
+    :param operator: оператор сравнения.
+    :param value: значение для сравнения. Для оператора between - кортеж
+        (нижняя граница, верхняя граница).
+    """
+    def __init__(self, column_name: str, operator: Operators, value: Any):
+        self.column_name = column_name
+        self.operator = operator
+        self.value = value
+
+    def __str__(self):
+        if self.operator is Operators.between:
+            return (
+                f"{self.column_name} between {self.value[0]} "
+                f"and {self.value[1]}"
+            )
+        return f"{self.column_name} {self.operator.value} {self.value}"
+
+    @property
+    def is_range(self) -> bool:
+        """
+        :return: True, если условие задает диапазон значений.
+        """
+        return self.operator in RANGE_OPERATORS
+
+    def validate(self, column: "Column") -> "Condition":
+        """
+        Приведение значения условия к типу колонки.
+
+        :param column: колонка, к которой относится условие.
+        :return: новое условие с приведенным значением.
+
+        :raises ValueError: если значение не может быть приведено к типу
+            колонки или оператор не применим к типу колонки.
+        """
+        self.check_operator(column)
+        if self.operator is Operators.between:
+            value = tuple(column.validate_value(v) for v in self.value)
+        else:
+            value = column.validate_value(self.value)
+        return Condition(self.column_name, self.operator, value)
+
+    def check_operator(self, column: "Column") -> None:
+        """
+        Проверка применимости оператора условия к типу колонки.
+
+        :param column: колонка, к которой относится условие.
+        :return: None.
+
+        :raises ValueError: если оператор не применим к типу колонки.
+        """
+        if self.is_range and column.python_type is not int:
+            raise ValueError(
+                f"оператор \"{self.operator.value}\" применим только к "
+                f"столбцам типа int"
+            )
+
+    def bounds(self) -> tuple[Any, Any, bool, bool]:
+        """
+        Границы диапазона значений, удовлетворяющих условию.
+
+        :return: нижняя граница, верхняя граница (None - граница не
+            задана), включается ли нижняя граница, включается ли верхняя
+            граница.
+        """
+        match self.operator:
+            case Operators.eq:
+                return self.value, self.value, True, True
+            case Operators.lt:
+                return None, self.value, True, False
+            case Operators.le:
+                return None, self.value, True, True
+            case Operators.gt:
+                return self.value, None, False, True
+            case Operators.ge:
+                return self.value, None, True, True
+            case Operators.between:
+                return self.value[0], self.value[1], True, True
+
+    def check(self, value: Any) -> bool:
+        """
+        Проверка значения на соответствие условию.
+
+        :param value: значение колонки в строке.
+        :return: True, если значение удовлетворяет условию.
+        """
+        match self.operator:
+            case Operators.eq:
+                return value == self.value
+            case Operators.lt:
+                return value < self.value
+            case Operators.le:
+                return value <= self.value
+            case Operators.gt:
+                return value > self.value
+            case Operators.ge:
+                return value >= self.value
+            case Operators.between:
+                return self.value[0] <= value <= self.value[1]
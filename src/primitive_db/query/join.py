@@ -0,0 +1,87 @@
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # импорт только для аннотаций: модуль metadata сам использует запросы
+    from src.primitive_db.metadata.column import Column
+    from src.primitive_db.metadata.table import Table
+
+
+def resolve_column(
+        name: str,
+        tables: Iterable["Table"]
+) -> tuple["Table", "Column"]:
+    """
+    Поиск колонки среди колонок соединяемых таблиц.
+
+    :param name: имя колонки: <таблица>.<колонка> или <колонка>, если
+        колонка с таким именем есть только в одной из таблиц.
+    :param tables: соединяемые таблицы.
+    :return: таблица и колонка.
+
+    :raises src.primitive_db.metadata.table.UnknownColumnError: если
+        колонка не найдена.
+
+    :raises ValueError: если имя колонки без имени таблицы неоднозначно
+        или таблица не участвует в запросе.
+    """
+    table_name, _, column_name = name.rpartition(".")
+    if table_name:
+        for table in tables:
+            if table.name == table_name:
+                return table, table.get_column(column_name)
+        raise ValueError(f"Таблица {table_name} не участвует в запросе")
+    found: list[tuple["Table", "Column"]] = [
+        (table, column)
+        for table in tables
+        for column in table.columns
+        if column.name == column_name
+    ]
+    if len(found) > 1:
+        raise ValueError(
+            f"Столбец {column_name} есть в нескольких таблицах: укажите "
+            f"имя таблицы (<таблица>.{column_name})"
+        )
+    if not found:
+        # ошибка о неизвестной колонке первой таблицы:
+        table = next(iter(tables))
+        return table, table.get_column(column_name)
+    return found[0]
+
+
+def hash_join(
+        build_rows: Iterable[list],
+        probe_rows: Iterable[list],
+        build_key: int,
+        probe_key: int,
+        convert_key: Callable[[Any], Any] | None = None
+) -> Iterator[tuple[list, list]]:
+    """
+    Соединение строк по равенству ключей хэшированием: по строкам
+    build_rows (меньшей из соединяемых таблиц) строится хэш-таблица
+    {ключ: строки}, затем строки probe_rows читаются по одной и
+    сопоставляются со строками хэш-таблицы. Результат возвращается по мере
+    чтения probe_rows.
+
+    :param build_rows: строки, по которым строится хэш-таблица.
+    :param probe_rows: строки, сопоставляемые со строками хэш-таблицы.
+    :param build_key: позиция ключа в строках build_rows.
+    :param probe_key: позиция ключа в строках probe_rows.
+    :param convert_key: приведение ключа строки probe_rows к типу ключа
+        build_rows (None - типы совпадают). Если ключ не приводится
+        (ValueError), то строка не соединяется ни с одной строкой.
+    :return: генератор пар соединенных строк (строка build_rows, строка
+        probe_rows).
+    """
+    hash_table: dict[Any, list[list]] = {}
+    for row in build_rows:
+        hash_table.setdefault(row[build_key], []).append(row)
+    for row in probe_rows:
+        key = row[probe_key]
+        if convert_key is not None:
+            try:
+                key = convert_key(key)
+            except ValueError:
+                continue
+        for build_row in hash_table.get(key, ()):
+            yield build_row, row
@@ -0,0 +1,493 @@
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+from src.primitive_db.const.aggregate_functions import AggregateFunctions
+from src.primitive_db.const.auto_column_names import AutoColumnNames
+from src.primitive_db.const.commands import Commands
+from src.primitive_db.const.operators import Operators
+from src.primitive_db.const.token_types import TokenTypes
+from src.primitive_db.utils.cache import create_cacher
+from src.primitive_db.utils.parser import ParserError
+
+from .ast import (
+    Aggregate,
+    AssignmentType,
+    DeleteStatement,
+    InsertStatement,
+    JoinClause,
+    Placeholder,
+    RowValuesType,
+    SelectStatement,
+    Statement,
+    UpdateStatement,
+)
+from .condition import Condition
+from .tokenizer import Token, tokenize
+
+BOOLEAN_LITERALS = ("true", "false")
+
+
+class QuerySyntaxError(ParserError):
+    pass
+
+
+class QueryParser:
+    """
+    Синтаксический анализатор запросов (метод рекурсивного спуска).
+
+    Команда разбивается на лексемы один раз, затем каждое правило
+    грамматики читает лексемы последовательно, без возвратов. Значения
+    литералов сохраняются в виде строк (числа и true/false - как есть,
+    строки - без кавычек) и приводятся к типу колонки при выполнении
+    запроса. Вместо литерала в запросе может быть указан параметр (?)
+    подготовленного запроса.
+
+    Грамматика (ключевые слова в кавычках):
+        insert := "into" NAME "values" row ("," row)*
+        row := "(" literal ("," literal)* ")"
+        select := ["*" | item ("," item)*] "from" NAME
+            ["join" NAME "on" column "=" column]
+            ["where" conditions] ["group" "by" NAME]
+            ["order" "by" NAME ["asc" | "desc"]]
+            ["after" "ID" "=" INT] ["limit" INT] ["offset" INT]
+        item := column | FUNCTION "(" ("*" | NAME) ")"
+        column := NAME ["." NAME]
+        update := NAME "set" assignment ("," assignment)* "where" conditions
+        assignment := NAME "=" literal
+        delete := "from" NAME "where" conditions
+        conditions := condition ("and" condition)*
+        condition := column OPERATOR literal
+            | column "between" literal "and" literal
+        literal := NUMBER | STRING | "true" | "false" | "?"
+        values := "(" [literal ("," literal)*] ")"  (параметры execute)
+
+    :param command_data: аргументы команды (текст запроса без имени
+        команды).
+
+    :raises src.primitive_db.query.tokenizer.TokenizerError: если текст
+        запроса содержит недопустимые символы.
+    """
+    def __init__(self, command_data: str):
+        self._tokens: list[Token] = tokenize(command_data)
+        self._position: int = 0
+        self._placeholders_count: int = 0
+
+    def insert(self) -> InsertStatement:
+        """
+        :return: запрос вставки строк.
+
+        :raises QuerySyntaxError: если запрос не соответствует грамматике.
+        """
+        self._expect_keyword("into")
+        table: str = self._expect_name()
+        self._expect_keyword("values")
+        rows: list[RowValuesType] = [self._row()]
+        while self._accept_punct(","):
+            rows.append(self._row())
+        self._expect_end()
+        return InsertStatement(table, tuple(rows))
+
+    def select(self) -> SelectStatement:
+        """
+        :return: запрос выборки строк.
+
+        :raises QuerySyntaxError: если запрос не соответствует грамматике.
+        """
+        items: list[str | Aggregate] = []
+        if self._accept_punct("*"):
+            self._expect_keyword("from")
+        elif not self._accept_keyword("from"):
+            items.append(self._select_item())
+            while self._accept_punct(","):
+                items.append(self._select_item())
+            self._expect_keyword("from")
+        table: str = self._expect_name()
+        join: JoinClause | None = None
+        if self._accept_keyword("join"):
+            join = self._join()
+        where: tuple[Condition, ...] = ()
+        if self._accept_keyword("where"):
+            where = self._conditions()
+        group_by: str | None = None
+        if self._accept_keyword("group"):
+            self._expect_keyword("by")
+            group_by = self._expect_name()
+        columns, aggregates = self._split_items(items, group_by)
+        order_by: str | None = None
+        descending: bool = False
+        if self._accept_keyword("order"):
+            self._expect_keyword("by")
+            order_by = self._expect_name()
+            if aggregates and order_by != group_by:
+                raise QuerySyntaxError(
+                    "в запросе с агрегатными функциями сортировка "
+                    "выполняется только по столбцу группировки"
+                )
+            descending = self._accept_keyword("desc")
+            if not descending:
+                self._accept_keyword("asc")
+        after_id: int | None = None
+        if self._accept_keyword("after"):
+            self._expect_keyword(AutoColumnNames.ID.value)
+            self._expect_operator(Operators.eq)
+            after_id = self._integer()
+        limit: int | None = None
+        if self._accept_keyword("limit"):
+            limit = self._integer()
+        offset: int = 0
+        if self._accept_keyword("offset"):
+            offset = self._integer()
+        self._expect_end()
+        if join is not None and (
+            aggregates or order_by is not None or after_id is not None
+        ):
+            raise QuerySyntaxError(
+                "в запросе с join не поддерживаются агрегатные функции, "
+                "order by и after"
+            )
+        return SelectStatement(
+            table, where, after_id, limit, offset, aggregates, group_by,
+            columns, order_by, descending, join
+        )
+
+    def update(self) -> UpdateStatement:
+        """
+        :return: запрос обновления строк.
+
+        :raises QuerySyntaxError: если запрос не соответствует грамматике.
+        """
+        table: str = self._expect_name()
+        self._expect_keyword("set")
+        assignments: list[AssignmentType] = [self._assignment()]
+        while self._accept_punct(","):
+            assignments.append(self._assignment())
+        self._expect_keyword("where")
+        where: tuple[Condition, ...] = self._conditions()
+        self._expect_end()
+        return UpdateStatement(table, tuple(assignments), where)
+
+    def delete(self) -> DeleteStatement:
+        """
+        :return: запрос удаления строк.
+
+        :raises QuerySyntaxError: если запрос не соответствует грамматике.
+        """
+        self._expect_keyword("from")
+        table: str = self._expect_name()
+        self._expect_keyword("where")
+        where: tuple[Condition, ...] = self._conditions()
+        self._expect_end()
+        return DeleteStatement(table, where)
+
+    def values(self) -> RowValuesType:
+        """
+        :return: значения параметров подготовленного запроса.
+
+        :raises QuerySyntaxError: если значения не соответствуют грамматике.
+        """
+        self._expect_punct("(")
+        values: list[Any] = []
+        if not self._accept_punct(")"):
+            values.append(self._literal(allow_placeholder=False))
+            while self._accept_punct(","):
+                values.append(self._literal(allow_placeholder=False))
+            self._expect_punct(")")
+        self._expect_end()
+        return tuple(values)
+
+    def _row(self) -> RowValuesType:
+        """
+        :return: значения колонок строки.
+        """
+        self._expect_punct("(")
+        values: list[Any] = [self._literal()]
+        while self._accept_punct(","):
+            values.append(self._literal())
+        self._expect_punct(")")
+        return tuple(values)
+
+    def _join(self) -> JoinClause:
+        """
+        :return: соединение с таблицей.
+        """
+        table: str = self._expect_name()
+        self._expect_keyword("on")
+        left_column: str = self._column()
+        self._expect_operator(Operators.eq)
+        return JoinClause(table, left_column, self._column())
+
+    def _column(self) -> str:
+        """
+        :return: имя колонки, возможно, с именем таблицы через точку.
+        """
+        name: str = self._expect_name()
+        if self._accept_punct("."):
+            name = f"{name}.{self._expect_name()}"
+        return name
+
+    def _select_item(self) -> str | Aggregate:
+        """
+        :return: имя колонки или агрегатная функция.
+        """
+        token: Token = self._next()
+        if token.type is not TokenTypes.name:
+            raise self._error("имя столбца или агрегатная функция", token)
+        if self._accept_punct("."):
+            return f"{token.value}.{self._expect_name()}"
+        if not self._accept_punct("("):
+            return token.value
+        try:
+            function = AggregateFunctions(token.value.lower())
+        except ValueError:
+            raise self._error("агрегатная функция", token)
+        column_name: str | None = None
+        if function is not AggregateFunctions.count \
+                or not self._accept_punct("*"):
+            column_name = self._expect_name()
+        self._expect_punct(")")
+        return Aggregate(function, column_name)
+
+    @staticmethod
+    def _split_items(
+            items: list[str | Aggregate],
+            group_by: str | None
+    ) -> tuple[tuple[str, ...], tuple[Aggregate, ...]]:
+        """
+        Разделение выбираемых элементов на колонки и агрегатные функции.
+        В запросе с агрегатными функциями может быть указана только колонка
+        группировки (она выводится первой), поэтому колонки не
+        возвращаются.
+
+        :param items: выбираемые элементы.
+        :param group_by: имя колонки группировки.
+        :return: имена колонок и агрегатные функции.
+
+        :raises QuerySyntaxError: если элементы указаны несколько раз или
+            колонки не соответствуют группировке.
+        """
+        duplicates: list[str] = [
+            name for name, count in Counter(map(str, items)).items()
+            if count > 1
+        ]
+        if duplicates:
+            raise QuerySyntaxError(
+                f"повторно указаны столбцы: {', '.join(duplicates)}"
+            )
+        columns = tuple(item for item in items if isinstance(item, str))
+        aggregates = tuple(
+            item for item in items if isinstance(item, Aggregate)
+        )
+        if not aggregates:
+            if group_by is not None:
+                raise QuerySyntaxError(
+                    "group by используется только с агрегатными функциями"
+                )
+            return columns, ()
+        for column_name in columns:
+            if column_name != group_by:
+                raise QuerySyntaxError(
+                    f"столбец {column_name} должен быть указан в group by"
+                )
+        return (), aggregates
+
+    def _assignment(self) -> AssignmentType:
+        """
+        :return: присваивание вида (имя колонки, значение).
+        """
+        column_name: str = self._expect_name()
+        self._expect_operator(Operators.eq)
+        return column_name, self._literal()
+
+    def _conditions(self) -> tuple[Condition, ...]:
+        """
+        :return: условия, объединенные через and.
+        """
+        conditions: list[Condition] = [self._condition()]
+        while self._accept_keyword("and"):
+            conditions.append(self._condition())
+        return tuple(conditions)
+
+    def _condition(self) -> Condition:
+        """
+        :return: условие фильтрации.
+        """
+        column_name: str = self._column()
+        if self._accept_keyword("between"):
+            low = self._literal()
+            self._expect_keyword("and")
+            return Condition(
+                column_name,
+                Operators.between,
+                (low, self._literal())
+            )
+        token: Token = self._next()
+        if token.type is not TokenTypes.operator:
+            raise self._error("оператор сравнения", token)
+        return Condition(column_name, Operators(token.value), self._literal())
+
+    def _literal(self, allow_placeholder: bool = True) -> Any:
+        """
+        :param allow_placeholder: допускается ли параметр (?).
+        :return: значение литерала: число или true/false - строка как есть,
+            строка - без кавычек, параметр - объект Placeholder.
+        """
+        token: Token = self._next()
+        match token.type:
+            case TokenTypes.number:
+                return token.value
+            case TokenTypes.string:
+                return token.value[1:-1]
+            case TokenTypes.name if token.value in BOOLEAN_LITERALS:
+                return token.value
+            case TokenTypes.punct if token.value == "?" and allow_placeholder:
+                placeholder = Placeholder(self._placeholders_count)
+                self._placeholders_count += 1
+                return placeholder
+        raise self._error("значение", token)
+
+    def _integer(self) -> int:
+        """
+        :return: целое неотрицательное число.
+        """
+        token: Token = self._next()
+        if token.type is not TokenTypes.number or not token.value.isdigit():
+            raise self._error("целое неотрицательное число", token)
+        return int(token.value)
+
+    def _next(self) -> Token:
+        """
+        :return: текущая лексема (указатель смещается на следующую).
+        """
+        token: Token = self._tokens[self._position]
+        if token.type is not TokenTypes.end:
+            self._position += 1
+        return token
+
+    def _accept_keyword(self, keyword: str) -> bool:
+        """
+        Пропуск ключевого слова, если оно является текущей лексемой.
+
+        :param keyword: ключевое слово.
+        :return: True, если ключевое слово пропущено.
+        """
+        token: Token = self._tokens[self._position]
+        if (
+            token.type is TokenTypes.name
+            and token.value.lower() == keyword.lower()
+        ):
+            self._position += 1
+            return True
+        return False
+
+    def _accept_punct(self, punct: str) -> bool:
+        """
+        Пропуск знака пунктуации, если он является текущей лексемой.
+
+        :param punct: знак пунктуации.
+        :return: True, если знак пропущен.
+        """
+        token: Token = self._tokens[self._position]
+        if token.type is TokenTypes.punct and token.value == punct:
+            self._position += 1
+            return True
+        return False
+
+    def _expect_keyword(self, keyword: str) -> None:
+        """
+        :raises QuerySyntaxError: если текущая лексема не ключевое слово.
+        """
+        if not self._accept_keyword(keyword):
+            raise self._error(f"\"{keyword}\"", self._tokens[self._position])
+
+    def _expect_punct(self, punct: str) -> None:
+        """
+        :raises QuerySyntaxError: если текущая лексема не знак punct.
+        """
+        if not self._accept_punct(punct):
+            raise self._error(f"\"{punct}\"", self._tokens[self._position])
+
+    def _expect_operator(self, operator: Operators) -> None:
+        """
+        :raises QuerySyntaxError: если текущая лексема не оператор operator.
+        """
+        token: Token = self._next()
+        if (
+            token.type is not TokenTypes.operator
+            or token.value != operator.value
+        ):
+            raise self._error(f"\"{operator.value}\"", token)
+
+    def _expect_name(self) -> str:
+        """
+        :return: имя.
+
+        :raises QuerySyntaxError: если текущая лексема не имя.
+        """
+        token: Token = self._next()
+        if token.type is not TokenTypes.name:
+            raise self._error("имя", token)
+        return token.value
+
+    def _expect_end(self) -> None:
+        """
+        :raises QuerySyntaxError: если команда содержит лишние лексемы.
+        """
+        token: Token = self._tokens[self._position]
+        if token.type is not TokenTypes.end:
+            raise self._error("конец команды", token)
+
+    @staticmethod
+    def _error(expected: str, token: Token) -> QuerySyntaxError:
+        """
+        :param expected: описание ожидаемой лексемы.
+        :param token: полученная лексема.
+        :return: исключение с описанием синтаксической ошибки.
+        """
+        return QuerySyntaxError(
+            f"ожидается {expected}, получено {token} "
+            f"(позиция {token.position + 1})"
+        )
+
+
+# правила грамматики для команд-запросов:
+STATEMENT_RULES: dict[Commands, Callable[[QueryParser], Statement]] = {
+    Commands.insert: QueryParser.insert,
+    Commands.select: QueryParser.select,
+    Commands.update: QueryParser.update,
+    Commands.delete: QueryParser.delete,
+}
+
+
+@create_cacher()
+def parse_statement(command: Commands, command_data: str) -> Statement:
+    """
+    Синтаксический разбор запроса в AST.
+
+    :param command: команда-запрос (insert, select, update, delete).
+    :param command_data: аргументы команды.
+    :return: запрос.
+
+    :raises src.primitive_db.utils.parser.ParserError: если запрос не
+        соответствует грамматике.
+    """
+    rule = STATEMENT_RULES.get(command)
+    if rule is None:
+        raise QuerySyntaxError(
+            f"команда {command.value} не является запросом"
+        )
+    return rule(QueryParser(command_data))
+
+
+@create_cacher()
+def parse_values(command_data: str) -> RowValuesType:
+    """
+    Синтаксический разбор значений параметров подготовленного запроса.
+
+    :param command_data: значения в скобках, например: (1, "abc").
+    :return: значения параметров.
+
+    :raises src.primitive_db.utils.parser.ParserError: если значения не
+        соответствуют грамматике.
+    """
+    return QueryParser(command_data).values()
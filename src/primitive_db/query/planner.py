@@ -0,0 +1,220 @@
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, NamedTuple
+
+from src.primitive_db.const.access_paths import AccessPaths
+from src.primitive_db.const.auto_column_names import AutoColumnNames
+from src.primitive_db.const.operators import Operators
+
+from .condition import Condition
+
+if TYPE_CHECKING:
+    # импорт только для аннотаций: модуль metadata сам использует планировщик
+    from src.primitive_db.metadata.table import Table
+
+# Доля строк, удовлетворяющих условию, если для колонки нет индекса и
+# статистики (оценки по умолчанию из классических оптимизаторов запросов):
+DEFAULT_SELECTIVITY: dict[Operators, float] = {
+    Operators.eq: 0.1,
+    Operators.lt: 1 / 3,
+    Operators.le: 1 / 3,
+    Operators.gt: 1 / 3,
+    Operators.ge: 1 / 3,
+    Operators.between: 0.25,
+}
+
+# Во сколько раз может измениться количество строк таблицы, прежде чем
+# план подготовленного запроса будет построен заново:
+PLAN_ROWS_FACTOR = 2
+
+
+class QueryPlan(NamedTuple):
+    """
+    План выборки строк таблицы.
+
+    :param access_path: способ доступа к строкам.
+    :param access_condition: условие, по которому выполняется доступ (None
+        для полного просмотра). Строки, полученные по условию, ему
+        удовлетворяют, поэтому условие повторно не проверяется.
+    :param filters: условия, проверяемые для каждой полученной строки, в
+        порядке возрастания оценки доли подходящих строк.
+    :param cost: оценка количества строк, получаемых способом доступа.
+    """
+    access_path: AccessPaths
+    access_condition: Condition | None
+    filters: tuple[Condition, ...]
+    cost: float
+
+    def __str__(self):
+        lines = [f"Доступ: {self.access_path.value}"]
+        if self.access_condition is not None:
+            lines.append(f"Условие доступа: {self.access_condition}")
+        lines.append(f"Оценка количества строк: {round(self.cost)}")
+        if self.filters:
+            filters = ", ".join(str(c) for c in self.filters)
+            lines.append(f"Фильтры: {filters}")
+        return "\n".join(lines)
+
+
+def plan_query(table: "Table", conditions: Sequence[Condition]) -> QueryPlan:
+    """
+    Выбор плана выборки строк: из способов доступа (поиск по ID, по
+    индексу, двоичный поиск по упорядоченным значениям, полный просмотр)
+    выбирается способ с наименьшей оценкой количества получаемых строк.
+    Остальные условия упорядочиваются по оценке доли подходящих строк, чтобы
+    первым проверялось самое избирательное условие.
+
+    :param table: таблица.
+    :param conditions: валидированные условия фильтрации.
+    :return: план выборки.
+    """
+    rows_count: int = table.rows_count
+    access_path: AccessPaths = AccessPaths.scan
+    access_condition: Condition | None = None
+    cost: float = rows_count
+    for condition in conditions:
+        estimate = _estimate_access(table, condition, rows_count)
+        if estimate is not None and estimate[1] < cost:
+            access_path, cost = estimate
+            access_condition = condition
+    filters = sorted(
+        (c for c in conditions if c is not access_condition),
+        key=lambda c: estimate_selectivity(table, c)
+    )
+    return QueryPlan(access_path, access_condition, tuple(filters), cost)
+
+
+def estimate_selectivity(table: "Table", condition: Condition) -> float:
+    """
+    Оценка доли строк таблицы, удовлетворяющих условию. Для условий по ID и
+    по колонкам с индексами оценка вычисляется по индексу, для колонок со
+    статистикой (команда analyze) - по статистике, для остальных
+    используется оценка по умолчанию для оператора.
+
+    :param table: таблица.
+    :param condition: валидированное условие.
+    :return: доля строк от 0 до 1.
+    """
+    rows_count: int = table.rows_count
+    if not rows_count:
+        return 0.0
+    estimate = _estimate_access(table, condition, rows_count)
+    if estimate is not None:
+        return min(estimate[1] / rows_count, 1.0)
+    stats = table.get_column(condition.column_name).stats
+    if stats is not None and stats.rows_count:
+        if condition.is_range:
+            return stats.range_fraction(*condition.bounds())
+        return stats.eq_fraction(condition.value)
+    return DEFAULT_SELECTIVITY[condition.operator]
+
+
+def _estimate_access(
+        table: "Table",
+        condition: Condition,
+        rows_count: int
+) -> tuple[AccessPaths, float] | None:
+    """
+    Оценка доступа к строкам по условию.
+
+    :param table: таблица.
+    :param condition: валидированное условие.
+    :param rows_count: количество строк таблицы.
+    :return: способ доступа и оценка количества получаемых строк или None,
+        если доступ по условию невозможен.
+    """
+    if condition.column_name == AutoColumnNames.ID.value:
+        if not condition.is_range:
+            return AccessPaths.id_lookup, 1
+        return AccessPaths.id_range, table.id_range_count(condition)
+    index = table.get_index(condition.column_name)
+    if index is None:
+        return None
+    if not condition.is_range:
+        return AccessPaths.index_lookup, index.count(condition.value)
+    if not index.is_sorted:
+        return None
+    keys_count: int = index.range_keys_count(*condition.bounds())
+    rows_per_key: float = rows_count / max(index.keys_count, 1)
+    return AccessPaths.index_range, keys_count * rows_per_key
+
+
+class PlanTemplate:
+    """
+    Шаблон плана выборки подготовленного запроса. План строится при первом
+    выполнении запроса, при следующих выполнениях способ доступа и порядок
+    условий берутся из шаблона, а в план подставляются условия с новыми
+    значениями параметров.
+
+    План строится заново, если изменились индексы или статистика таблицы
+    (Table.plan_version), количество условий или количество строк таблицы
+    изменилось больше чем в PLAN_ROWS_FACTOR раз.
+    """
+    def __init__(self):
+        # таблица, версия плана таблицы, количество условий и количество
+        # строк, для которых построен план, сам план, позиции условия
+        # доступа и фильтров в списке условий (None - план не построен):
+        self._cached: tuple | None = None
+
+    def plan(
+            self,
+            table: "Table",
+            conditions: Sequence[Condition]
+    ) -> QueryPlan:
+        """
+        Получение плана выборки строк.
+
+        :param table: таблица.
+        :param conditions: валидированные условия фильтрации.
+        :return: план выборки.
+        """
+        rows_count: int = table.rows_count
+        cached = self._cached
+        if cached is not None:
+            (
+                planned_table, version, conditions_count, planned_rows,
+                plan, access_position, filters_positions
+            ) = cached
+            if (
+                planned_table is table
+                and version == table.plan_version
+                and conditions_count == len(conditions)
+                and rows_count <= planned_rows * PLAN_ROWS_FACTOR
+                and planned_rows <= rows_count * PLAN_ROWS_FACTOR
+            ):
+                return plan._replace(
+                    access_condition=None if access_position is None
+                    else conditions[access_position],
+                    filters=tuple(conditions[i] for i in filters_positions)
+                )
+        plan = plan_query(table, conditions)
+        positions: dict[int, int] = {
+            id(condition): i for i, condition in enumerate(conditions)
+        }
+        self._cached = (
+            table, table.plan_version, len(conditions), rows_count, plan,
+            None if plan.access_condition is None
+            else positions[id(plan.access_condition)],
+            tuple(positions[id(c)] for c in plan.filters)
+        )
+        return plan
+
+
+class PreparedConditions(tuple):
+    """
+    Условия фильтрации подготовленного запроса: условия со значениями,
+    уже приведенными к типам колонок, и шаблон плана запроса. Такие условия
+    не проверяются повторно, а план выборки берется из шаблона.
+
+    :param conditions: валидированные условия.
+    :param template: шаблон плана подготовленного запроса.
+    """
+    template: PlanTemplate
+
+    def __new__(
+            cls,
+            conditions: Sequence[Condition],
+            template: PlanTemplate
+    ) -> "PreparedConditions":
+        instance = super().__new__(cls, conditions)
+        instance.template = template
+        return instance
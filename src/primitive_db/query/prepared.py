@@ -0,0 +1,211 @@
+from collections.abc import Sequence
+from typing import Any
+
+from src.primitive_db.const.auto_column_names import AutoColumnNames
+from src.primitive_db.const.operators import Operators
+from src.primitive_db.metadata.column import Column
+from src.primitive_db.metadata.table import Table
+
+from .ast import (
+    DeleteStatement,
+    InsertStatement,
+    Placeholder,
+    SelectStatement,
+    Statement,
+    UpdateStatement,
+)
+from .condition import Condition
+from .planner import PlanTemplate, PreparedConditions
+
+
+class PreparedStatement:
+    """
+    Подготовленный запрос с параметрами (?).
+
+    При подготовке запроса один раз выполняются разбор запроса, поиск
+    колонок таблицы и приведение значений-литералов к типам колонок. При
+    выполнении значения параметров только приводятся к типам колонок и
+    подставляются в запрос: условия фильтрации передаются в таблицу как
+    PreparedConditions и не проверяются повторно, а план выборки строится
+    при первом выполнении и используется повторно (см. PlanTemplate).
+
+    :param name: имя подготовленного запроса.
+    :param statement: запрос.
+    :param table: таблица запроса.
+
+    :raises src.primitive_db.metadata.table.UnknownColumnError: если
+        колонка запроса не найдена.
+
+    :raises ValueError: если значения запроса не соответствуют колонкам.
+    """
+    def __init__(self, name: str, statement: Statement, table: Table):
+        self.name = name
+        # колонки, к типам которых приводятся параметры, по номеру параметра:
+        self._parameters: dict[int, Column] = {}
+        self._table = table
+        self._statement: Statement = self._resolve(statement)
+        self._plan_template = PlanTemplate()
+
+    @property
+    def statement(self) -> Statement:
+        return self._statement
+
+    @property
+    def parameters_count(self) -> int:
+        """
+        :return: количество параметров запроса.
+        """
+        return len(self._parameters)
+
+    def bind(self, args: Sequence[Any]) -> Statement:
+        """
+        Подстановка значений параметров в запрос.
+
+        :param args: значения параметров в порядке их следования в запросе.
+        :return: запрос со значениями, приведенными к типам колонок.
+
+        :raises ValueError: если количество значений не совпадает с
+            количеством параметров или значение не может быть приведено к
+            типу колонки.
+        """
+        if len(args) != self.parameters_count:
+            raise ValueError(
+                f"ожидается параметров: {self.parameters_count}, "
+                f"передано: {len(args)}"
+            )
+        values: list[Any] = [
+            self._parameters[i].validate_value(arg)
+            for i, arg in enumerate(args)
+        ]
+        return self._substitute(self._statement, values, self._plan_template)
+
+    def _resolve(self, statement: Statement) -> Statement:
+        """
+        Поиск колонок запроса: литералы приводятся к типам колонок, для
+        параметров запоминаются колонки.
+
+        :param statement: запрос.
+        :return: запрос с приведенными литералами.
+        """
+        match statement:
+            case InsertStatement():
+                columns: list[Column] = [
+                    c for c in self._table.columns
+                    if c.name != AutoColumnNames.ID.value
+                ]
+                rows = []
+                for row in statement.rows:
+                    if len(row) != len(columns):
+                        raise ValueError(
+                            "Количество значений не совпадает с количеством "
+                            "колонок."
+                        )
+                    rows.append(tuple(
+                        self._resolve_value(value, column)
+                        for value, column in zip(row, columns)
+                    ))
+                return statement._replace(rows=tuple(rows))
+            case UpdateStatement():
+                return statement._replace(
+                    assignments=tuple(
+                        (name, self._resolve_value(
+                            value,
+                            self._table.get_column(name)
+                        ))
+                        for name, value in statement.assignments
+                    ),
+                    where=self._resolve_conditions(statement.where)
+                )
+            case SelectStatement(join=join) if join is not None:
+                raise ValueError(
+                    "Подготовка запросов с join не поддерживается"
+                )
+            case SelectStatement():
+                for column_name in statement.columns:
+                    self._table.get_column(column_name)
+                if statement.order_by is not None:
+                    self._table.get_column(statement.order_by)
+                return statement._replace(
+                    where=self._resolve_conditions(statement.where)
+                )
+            case DeleteStatement():
+                return statement._replace(
+                    where=self._resolve_conditions(statement.where)
+                )
+
+    def _resolve_conditions(
+            self,
+            conditions: tuple[Condition, ...]
+    ) -> tuple[Condition, ...]:
+        """
+        :param conditions: условия фильтрации.
+        :return: условия с приведенными литералами.
+        """
+        resolved: list[Condition] = []
+        for condition in conditions:
+            column: Column = self._table.get_column(condition.column_name)
+            condition.check_operator(column)
+            if condition.operator is Operators.between:
+                value = tuple(
+                    self._resolve_value(v, column) for v in condition.value
+                )
+            else:
+                value = self._resolve_value(condition.value, column)
+            resolved.append(
+                Condition(condition.column_name, condition.operator, value)
+            )
+        return tuple(resolved)
+
+    def _resolve_value(self, value: Any, column: Column) -> Any:
+        """
+        :param value: литерал или параметр.
+        :param column: колонка, к которой относится значение.
+        :return: литерал, приведенный к типу колонки, или параметр.
+        """
+        if isinstance(value, Placeholder):
+            self._parameters[value.index] = column
+            return value
+        return column.validate_value(value)
+
+    @staticmethod
+    def _substitute(
+            statement: Statement,
+            values: list[Any],
+            template: PlanTemplate
+    ) -> Statement:
+        """
+        :param statement: запрос с параметрами.
+        :param values: значения параметров.
+        :param template: шаблон плана выборки запроса.
+        :return: запрос, в котором параметры заменены значениями.
+        """
+        def bind(value: Any) -> Any:
+            if isinstance(value, Placeholder):
+                return values[value.index]
+            if isinstance(value, tuple):
+                return tuple(bind(v) for v in value)
+            return value
+
+        def bind_conditions(
+                conditions: tuple[Condition, ...]
+        ) -> tuple[Condition, ...]:
+            return PreparedConditions(
+                [
+                    Condition(c.column_name, c.operator, bind(c.value))
+                    for c in conditions
+                ],
+                template
+            )
+
+        match statement:
+            case InsertStatement():
+                return statement._replace(rows=bind(statement.rows))
+            case UpdateStatement():
+                return statement._replace(
+                    assignments=bind(statement.assignments),
+                    where=bind_conditions(statement.where)
+                )
+            case SelectStatement() | DeleteStatement():
+                return statement._replace(
+                    where=bind_conditions(statement.where)
+                )
@@ -0,0 +1,75 @@
+from re import VERBOSE, compile
+from typing import NamedTuple
+
+from src.primitive_db.const.token_types import TokenTypes
+from src.primitive_db.utils.parser import ParserError
+
+# Имена групп совпадают со значениями TokenTypes. Число не может
+# продолжаться буквой, цифрой или точкой (иначе это имя, например 1abc).
+TOKEN_REGEX = compile(
+    r"""
+    \s*(?:
+        (?P<number>[+-]?\d+(?:\.\d+)?)(?![\w.])
+        |(?P<string>"[^"]*"|'[^']*')
+        |(?P<name>\w+)
+        |(?P<operator><=|>=|=|<|>)
+        |(?P<punct>[(),*?.])
+    )
+    """,
+    VERBOSE
+)
+SPACES_REGEX = compile(r"\s*")
+
+
+class TokenizerError(ParserError):
+    pass
+
+
+class Token(NamedTuple):
+    """
+    Лексема команды.
+
+    :param type: тип лексемы.
+    :param value: текст лексемы.
+    :param position: позиция лексемы в команде.
+    """
+    type: TokenTypes
+    value: str
+    position: int
+
+    def __str__(self):
+        if self.type is TokenTypes.end:
+            return "конец команды"
+        return f"\"{self.value}\""
+
+
+def tokenize(text: str) -> list[Token]:
+    """
+    Разбиение команды на лексемы за один проход по строке.
+
+    :param text: текст команды.
+    :return: список лексем, последняя лексема - конец команды.
+
+    :raises TokenizerError: если команда содержит недопустимый символ или
+        незакрытую кавычку.
+    """
+    tokens: list[Token] = []
+    position: int = 0
+    length: int = len(text.rstrip())
+    while position < length:
+        matching = TOKEN_REGEX.match(text, position)
+        if not matching:
+            position = SPACES_REGEX.match(text, position).end()
+            raise TokenizerError(
+                f"недопустимый символ \"{text[position]}\" "
+                f"(позиция {position + 1})"
+            )
+        token_type: str = matching.lastgroup
+        tokens.append(Token(
+            TokenTypes(token_type),
+            matching.group(token_type),
+            matching.start(token_type)
+        ))
+        position = matching.end()
+    tokens.append(Token(TokenTypes.end, "", length))
+    return tokens
@@ -0,0 +1,110 @@
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from src.primitive_db.conf import CONFIG
+from src.primitive_db.const.commands import Commands
+from src.primitive_db.core import Core
+from src.primitive_db.exceptions.command_error import UnknownCommandError
+from src.primitive_db.query.ast import Statement
+from src.primitive_db.query.parser import parse_statement
+
+QueryType = Statement | str
+
+
+class QueryExecutor:
+    """
+    Параллельное выполнение запросов к ядру в пуле потоков. Выборки из
+    одной таблицы выполняются одновременно, изменения таблицы - по одному
+    (см. Core).
+
+    Запрос задается AST или строкой команды (insert, select, update,
+    delete), например: 'select * from users where age > 18'. Результат
+    запроса - список: для select - строки результата (первая строка -
+    заголовки колонок), для остальных запросов - ID затронутых строк.
+
+    Удаление данных не подтверждается пользователем: без режима
+    CONFIG.assume_yes запрос delete отменяется.
+
+    :param core: ядро базы данных.
+    :param max_workers: количество потоков (по умолчанию -
+        CONFIG.query_workers).
+    """
+    def __init__(self, core: Core, max_workers: int | None = None):
+        self._core = core
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers or CONFIG.query_workers,
+            thread_name_prefix="primitive-db-query"
+        )
+
+    def __enter__(self) -> "QueryExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def submit(self, query: QueryType) -> Future:
+        """
+        Передача запроса на выполнение.
+
+        :param query: запрос.
+        :return: Future с результатом запроса. Ошибки запроса (см.
+            Core.execute) возникают при получении результата.
+        """
+        return self._pool.submit(self.execute, query)
+
+    def map(self, queries: Iterable[QueryType]) -> Iterator[list]:
+        """
+        Параллельное выполнение запросов.
+
+        :param queries: запросы.
+        :return: итератор по результатам в порядке запросов.
+        """
+        return self._pool.map(self.execute, queries)
+
+    def execute(self, query: QueryType) -> list:
+        """
+        Выполнение запроса в текущем потоке.
+
+        :param query: запрос.
+        :return: результат запроса.
+
+        :raises src.primitive_db.exceptions.command_error.CommandError:
+            если команда не найдена.
+
+        :raises src.primitive_db.utils.parser.ParserError: если запрос не
+            соответствует грамматике.
+        """
+        statement: Statement = query if isinstance(query, Statement) \
+            else self._parse(query)
+        # строки результата select читаются под блокировкой таблицы:
+        return list(self._core.execute(statement))
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Остановка пула потоков.
+
+        :param wait: дождаться ли выполнения переданных запросов.
+        :return: None.
+        """
+        self._pool.shutdown(wait=wait)
+
+    @staticmethod
+    def _parse(query: str) -> Statement:
+        """
+        Разбор строки запроса.
+
+        :param query: строка команды.
+        :return: запрос.
+
+        :raises src.primitive_db.exceptions.command_error.CommandError:
+            если команда не найдена.
+
+        :raises src.primitive_db.utils.parser.ParserError: если запрос не
+            соответствует грамматике.
+        """
+        command, _, command_data = query.strip().partition(" ")
+        try:
+            kind = Commands(command.lower())
+        except ValueError:
+            raise UnknownCommandError("Неизвестная команда")
+        return parse_statement(kind, command_data.strip())
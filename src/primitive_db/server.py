@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import json
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout, suppress
+from io import StringIO
+from pathlib import Path
+from typing import Any
+
+from src.primitive_db.conf import CONFIG
+from src.primitive_db.const.commands import Commands
+from src.primitive_db.engine import Engine, simple_handler
+from src.primitive_db.exceptions.command_error import CommandError
+from src.primitive_db.query.ast import Statement
+from src.primitive_db.utils.decorators import handle_db_errors
+from src.primitive_db.utils.load_data import SaveDataError
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 5454
+
+
+class Server(Engine):
+    """
+    Сервер базы данных: принимает команды клиентов по TCP и возвращает
+    результаты в формате JSON lines. Все клиенты работают с одним ядром,
+    поэтому данные таблиц загружаются один раз.
+
+    Клиент отправляет по одной команде в строке (язык команд тот же, что у
+    Engine). На каждую команду сервер отвечает одной строкой JSON:
+
+    * `ok` - выполнена ли команда без ошибок;
+    * `output` - строки текстового вывода команды (сообщения и ошибки);
+    * `columns`, `rows` - заголовки и строки результата select;
+    * `ids` - ID записей, измененных insert, update, delete;
+    * `exit` - true в ответе на команду exit, после которого сервер
+      закрывает соединение.
+
+    Команды выполняются в отдельном потоке, поэтому чтение и сохранение
+    данных не блокирует цикл событий. Команды выполняются по одной: вывод
+    команды перехватывается подменой общего для всех потоков sys.stdout, а
+    результат собирается в self._response. Транзакции не поддерживаются:
+    транзакция ядра была бы общей для всех клиентов.
+
+    :param database_path: путь к директории с файлами БД.
+    """
+    def __init__(self, database_path: Path):
+        super().__init__(database_path)
+        # один поток: вывод команды перехватывается через redirect_stdout
+        # (sys.stdout общий для всех потоков), а результат собирается в
+        # self._response, поэтому команды не могут выполняться параллельно
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="primitive-db-server"
+        )
+        self._response: dict[str, Any] = {}
+
+    async def serve(self, host: str, port: int) -> None:
+        """
+        Запуск сервера. Сервер работает до отмены задачи.
+
+        :param host: адрес, на котором принимаются соединения.
+        :param port: порт.
+        :return: None.
+        """
+        server = await asyncio.start_server(self._handle_client, host, port)
+        addresses = ", ".join(
+            "{}:{}".format(*s.getsockname()[:2]) for s in server.sockets
+        )
+        print(f"Сервер запущен: {addresses}")
+        async with server:
+            await server.serve_forever()
+
+    async def _handle_client(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Обработка соединения клиента: чтение команд и отправка ответов.
+
+        :param reader: поток чтения соединения.
+        :param writer: поток записи соединения.
+        :return: None.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            while line := await reader.readline():
+                data = line.decode("utf-8", errors="replace").strip()
+                if not data:
+                    continue
+                response: dict[str, Any] = await loop.run_in_executor(
+                    self._executor, self.execute_command, data
+                )
+                writer.write(
+                    json.dumps(response, ensure_ascii=False, default=str)
+                    .encode("utf-8") + b"\n"
+                )
+                await writer.drain()
+                if response.get("exit"):
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    def execute_command(self, data: str) -> dict[str, Any]:
+        """
+        Выполнение команды клиента.
+
+        :param data: строка команды.
+        :return: ответ клиенту (см. описание класса).
+        """
+        self._response = {}
+        output = StringIO()
+        with redirect_stdout(output):
+            ok: bool = self._run_command(lambda: self._parse_command(data))
+        response, self._response = self._response, {}
+        if not ok:
+            # результат, полученный до ошибки, не возвращается:
+            response.clear()
+        response["ok"] = ok
+        response["output"] = output.getvalue().splitlines()
+        return response
+
+    def close(self) -> None:
+        """
+        Остановка сервера: дожидается выполнения начатых команд и
+        сохраняет данные (см. Engine.close).
+
+        :return: None.
+
+        :raises src.primitive_db.utils.load_data.SaveDataError: если не
+            удалось сохранить данные.
+        """
+        self._executor.shutdown(wait=True)
+        super().close()
+
+    @simple_handler
+    def _exit(self) -> None:
+        """
+        Обработчик команды exit: завершение соединения клиента.
+
+        :return: None.
+        """
+        self._response["exit"] = True
+
+    @handle_db_errors
+    @simple_handler
+    def _begin(self) -> None:
+        """
+        Обработчик команды begin: транзакции не поддерживаются.
+
+        :return: None.
+
+        :raises CommandError: всегда.
+        """
+        raise CommandError("транзакции не поддерживаются в режиме сервера")
+
+    @handle_db_errors
+    @simple_handler
+    def _commit(self) -> None:
+        """
+        Обработчик команды commit: транзакции не поддерживаются.
+
+        :return: None.
+
+        :raises CommandError: всегда.
+        """
+        raise CommandError("транзакции не поддерживаются в режиме сервера")
+
+    @handle_db_errors
+    @simple_handler
+    def _rollback(self) -> None:
+        """
+        Обработчик команды rollback: транзакции не поддерживаются.
+
+        :return: None.
+
+        :raises CommandError: всегда.
+        """
+        raise CommandError("транзакции не поддерживаются в режиме сервера")
+
+    def _print_rows(
+            self,
+            field_names: list[str],
+            rows: Iterator[list]
+    ) -> None:
+        """
+        Сохранение строк результата select в ответ клиенту.
+
+        :param field_names: заголовки колонок.
+        :param rows: итератор по строкам.
+        :return: None.
+        """
+        self._response["columns"] = field_names
+        self._response["rows"] = list(rows)
+
+    def _print_result(
+            self,
+            statement: Statement,
+            result: list[int] | Iterator[list]
+    ) -> None:
+        super()._print_result(statement, result)
+        if statement.kind != Commands.select:
+            self._response["ids"] = result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Primitive DB server")
+    parser.add_argument(
+        "-c", "--config",
+        type=str,
+        dest="config",
+        help="Путь файла конфигурации .json"
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        dest="host",
+        default=DEFAULT_HOST,
+        help=f"Адрес, на котором принимаются соединения (по умолчанию "
+             f"{DEFAULT_HOST})"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        dest="port",
+        default=DEFAULT_PORT,
+        help=f"Порт (по умолчанию {DEFAULT_PORT})"
+    )
+    parser.add_argument(
+        "-y", "--yes",
+        action="store_true",
+        dest="yes",
+        help="Выполнять drop_table и delete без подтверждения (иначе эти "
+             "команды отменяются)"
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        dest="quiet",
+        help="Не выводить сообщения по отдельным записям и время "
+             "выполнения операций"
+    )
+    args = parser.parse_args()
+
+    CONFIG.load(Path(args.config))
+    CONFIG.set_run_mode(False, args.yes, args.quiet)
+
+    server = Server(CONFIG.database_path)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("Завершение работы...")
+    finally:
+        try:
+            server.close()
+        except SaveDataError as err:
+            print(f"Не удалось сохранить данные: {err}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+from .base import Storage, StorageError
+from .columnar_storage import ColumnarStorage
+from .factory import create_storage
+from .mapped_storage import MappedStorage
+from .row_storage import RowStorage
+
+__all__ = [
+    "Storage",
+    "StorageError",
+    "RowStorage",
+    "ColumnarStorage",
+    "MappedStorage",
+    "create_storage"
+]
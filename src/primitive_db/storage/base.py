@@ -0,0 +1,130 @@
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from src.primitive_db.metadata.column import Column
+from src.primitive_db.metadata.db_object import DatabaseError
+from src.primitive_db.query.condition import Condition
+
+
+class StorageError(DatabaseError):
+    """
+    Класс ошибок, возникающих при работе с хранилищем строк таблицы.
+    """
+    pass
+
+
+class Storage:
+    """
+    Базовый класс хранилища строк таблицы.
+
+    Строки адресуются по ID. Порядок обхода строк совпадает с порядком их
+    добавления. Значения, передаваемые в хранилище, должны быть уже
+    приведены к типам колонок.
+
+    :param columns: колонки таблицы.
+    """
+    def __init__(self, columns: Sequence[Column]):
+        self._columns = list(columns)
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __contains__(self, row_id: int) -> bool:
+        raise NotImplementedError
+
+    def ids(self) -> Iterator[int]:
+        """
+        :return: итератор по ID строк в порядке их добавления.
+        """
+        raise NotImplementedError
+
+    def rows(self) -> Iterator[dict]:
+        """
+        :return: итератор по строкам вида {имя колонки: значение} в
+            порядке их добавления.
+        """
+        raise NotImplementedError
+
+    def get(self, row_id: int) -> dict | None:
+        """
+        Получить строку по ID.
+
+        :param row_id: ID строки.
+        :return: строка вида {имя колонки: значение}, если она существует.
+            Иначе None.
+        """
+        raise NotImplementedError
+
+    def value(self, row_id: int, column_name: str) -> Any:
+        """
+        Получить значение колонки в строке.
+
+        :param row_id: ID строки.
+        :param column_name: имя колонки.
+        :return: значение колонки.
+        """
+        raise NotImplementedError
+
+    def project(
+            self,
+            row_ids: Iterable[int],
+            column_names: Sequence[str]
+    ) -> Iterator[list]:
+        """
+        Получить значения заданных колонок в строках. Значения остальных
+        колонок не читаются.
+
+        :param row_ids: ID строк.
+        :param column_names: имена колонок.
+        :return: итератор по спискам значений колонок в порядке row_ids.
+        """
+        raise NotImplementedError
+
+    def filter(
+            self,
+            conditions: Sequence[Condition],
+            row_ids: Iterable[int] | None = None
+    ) -> Iterator[int]:
+        """
+        Отбор строк, удовлетворяющих всем условиям.
+
+        :param conditions: валидированные условия фильтрации.
+        :param row_ids: ID строк-кандидатов. Если None, то проверяются все
+            строки хранилища.
+        :return: итератор по ID подходящих строк (в порядке
+            строк-кандидатов или в порядке добавления строк). Строки
+            проверяются по мере чтения итератора.
+        """
+        raise NotImplementedError
+
+    def insert(self, row: dict) -> None:
+        """
+        Добавить строку.
+
+        :param row: строка вида {имя колонки: значение}, содержащая ID.
+        :return: None.
+
+        :raises StorageError: если значение не может быть сохранено.
+        """
+        raise NotImplementedError
+
+    def update(self, row_id: int, values: dict) -> None:
+        """
+        Обновить значения колонок в строке.
+
+        :param row_id: ID строки.
+        :param values: новые значения вида {имя колонки: значение}.
+        :return: None.
+
+        :raises StorageError: если значение не может быть сохранено.
+        """
+        raise NotImplementedError
+
+    def delete(self, row_id: int) -> None:
+        """
+        Удалить строку.
+
+        :param row_id: ID строки.
+        :return: None.
+        """
+        raise NotImplementedError
@@ -0,0 +1,55 @@
+from collections.abc import Iterable, Iterator
+
+
+class BitArray:
+    """
+    Массив булевых значений, упакованных по 8 значений в байт.
+
+    :param values: начальные значения.
+    """
+    def __init__(self, values: Iterable[bool] = ()):
+        self._bytes = bytearray()
+        self._length = 0
+        for value in values:
+            self.append(value)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[bool]:
+        for i in range(self._length):
+            yield bool(self._bytes[i >> 3] >> (i & 7) & 1)
+
+    def __getitem__(self, i: int) -> bool:
+        self._check_index(i)
+        return bool(self._bytes[i >> 3] >> (i & 7) & 1)
+
+    def __setitem__(self, i: int, value: bool) -> None:
+        self._check_index(i)
+        if value:
+            self._bytes[i >> 3] |= 1 << (i & 7)
+        else:
+            self._bytes[i >> 3] &= ~(1 << (i & 7)) & 0xFF
+
+    def _check_index(self, i: int) -> None:
+        """
+        :param i: индекс элемента.
+        :return: None.
+
+        :raises IndexError: если индекс вне границ массива.
+        """
+        if not 0 <= i < self._length:
+            raise IndexError("индекс вне границ массива")
+
+    def append(self, value: bool) -> None:
+        """
+        Добавить значение в конец массива.
+
+        :param value: значение.
+        :return: None.
+        """
+        if self._length & 7 == 0:
+            self._bytes.append(0)
+        self._length += 1
+        if value:
+            self[self._length - 1] = True
@@ -0,0 +1,173 @@
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from src.primitive_db.const.auto_column_names import AutoColumnNames
+from src.primitive_db.metadata.column import Column
+from src.primitive_db.query.condition import Condition
+
+from .base import Storage, StorageError
+from .bit_array import BitArray
+
+_INT_MIN = -2 ** 63
+_INT_MAX = 2 ** 63 - 1
+
+ColumnValuesType = array | BitArray | list
+
+
+def _new_values(python_type: type, values: Iterable = ()) -> ColumnValuesType:
+    """
+    Создание массива значений колонки.
+
+    :param python_type: тип значений колонки.
+    :param values: начальные значения.
+    :return: array('q') для int, BitArray для bool, list для str.
+    """
+    if python_type is int:
+        return array("q", values)
+    if python_type is bool:
+        return BitArray(values)
+    return list(values)
+
+
+class ColumnarStorage(Storage):
+    """
+    Колоночное хранилище: значения каждой колонки хранятся в отдельном
+    непрерывном массиве, строка таблицы - это позиция в массивах. Строка в
+    виде словаря собирается только при обращении к ней.
+
+    Удаленные строки исключаются из соответствия {ID: позиция}, а сами
+    массивы уплотняются, когда удаленных позиций становится больше, чем
+    действующих.
+    """
+    def __init__(self, columns: Sequence[Column]):
+        super().__init__(columns)
+        self._values: dict[str, ColumnValuesType] = {
+            column.name: _new_values(column.python_type)
+            for column in self._columns
+        }
+        self._int_columns: list[str] = [
+            column.name for column in self._columns
+            if column.python_type is int
+        ]
+        self._positions: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, row_id: int) -> bool:
+        return row_id in self._positions
+
+    def ids(self) -> Iterator[int]:
+        return iter(self._positions)
+
+    def rows(self) -> Iterator[dict]:
+        return (
+            self._materialize(position)
+            for position in self._positions.values()
+        )
+
+    def get(self, row_id: int) -> dict | None:
+        position = self._positions.get(row_id)
+        if position is None:
+            return None
+        return self._materialize(position)
+
+    def value(self, row_id: int, column_name: str) -> Any:
+        return self._values[column_name][self._positions[row_id]]
+
+    def project(
+            self,
+            row_ids: Iterable[int],
+            column_names: Sequence[str]
+    ) -> Iterator[list]:
+        columns = [self._values[name] for name in column_names]
+        return (
+            [values[position] for values in columns]
+            for position in map(self._positions.__getitem__, row_ids)
+        )
+
+    def filter(
+            self,
+            conditions: Sequence[Condition],
+            row_ids: Iterable[int] | None = None
+    ) -> Iterator[int]:
+        checks = [
+            (self._values[c.column_name], c.check) for c in conditions
+        ]
+        if row_ids is None:
+            positions = self._positions.values()
+        else:
+            positions = (self._positions[row_id] for row_id in row_ids)
+        ids = self._values[AutoColumnNames.ID.value]
+        return (
+            ids[position] for position in positions
+            if all(check(values[position]) for values, check in checks)
+        )
+
+    def insert(self, row: dict) -> None:
+        self._check_int_range(row)
+        position = len(self._values[AutoColumnNames.ID.value])
+        for column in self._columns:
+            self._values[column.name].append(row[column.name])
+        self._positions[row[AutoColumnNames.ID.value]] = position
+
+    def update(self, row_id: int, values: dict) -> None:
+        self._check_int_range(values)
+        position = self._positions[row_id]
+        for column_name, value in values.items():
+            self._values[column_name][position] = value
+
+    def delete(self, row_id: int) -> None:
+        del self._positions[row_id]
+        garbage = len(self._values[AutoColumnNames.ID.value]) \
+            - len(self._positions)
+        if garbage > len(self._positions):
+            self._compact()
+
+    def _materialize(self, position: int) -> dict:
+        """
+        Сборка строки по позиции в массивах колонок.
+
+        :param position: позиция строки.
+        :return: строка вида {имя колонки: значение}.
+        """
+        return {
+            column.name: self._values[column.name][position]
+            for column in self._columns
+        }
+
+    def _check_int_range(self, values: dict) -> None:
+        """
+        Проверка, что целые значения помещаются в 64-битный массив.
+
+        :param values: значения вида {имя колонки: значение}.
+        :return: None.
+
+        :raises StorageError: если значение вне допустимого диапазона.
+        """
+        for column_name in self._int_columns:
+            value = values.get(column_name)
+            if value is not None and not _INT_MIN <= value <= _INT_MAX:
+                raise StorageError(
+                    f"значение {value} колонки {column_name} вне диапазона "
+                    f"[{_INT_MIN}, {_INT_MAX}]"
+                )
+
+    def _compact(self) -> None:
+        """
+        Уплотнение массивов колонок: удаление позиций удаленных строк.
+
+        :return: None.
+        """
+        positions = list(self._positions.values())
+        for column in self._columns:
+            values = self._values[column.name]
+            self._values[column.name] = _new_values(
+                column.python_type,
+                (values[position] for position in positions)
+            )
+        self._positions = {
+            row_id: position
+            for position, row_id in enumerate(self._positions)
+        }
@@ -0,0 +1,26 @@
+from collections.abc import Sequence
+
+from src.primitive_db.const.storage_types import StorageTypes
+from src.primitive_db.metadata.column import Column
+
+from .base import Storage
+from .columnar_storage import ColumnarStorage
+from .row_storage import RowStorage
+
+_STORAGES: dict[StorageTypes, type[Storage]] = {
+    StorageTypes.rows: RowStorage,
+    StorageTypes.columnar: ColumnarStorage
+}
+
+
+def create_storage(storage_type: str, columns: Sequence[Column]) -> Storage:
+    """
+    Создание пустого хранилища строк таблицы.
+
+    :param storage_type: тип хранилища.
+    :param columns: колонки таблицы.
+    :return: хранилище.
+
+    :raises ValueError: если тип хранилища не поддерживается.
+    """
+    return _STORAGES[StorageTypes(storage_type)](columns)
@@ -0,0 +1,131 @@
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from src.primitive_db.const.auto_column_names import AutoColumnNames
+from src.primitive_db.metadata.column import Column
+from src.primitive_db.query.condition import Condition
+from src.primitive_db.utils.binary_format import BinaryTableFile
+
+from .base import Storage
+from .factory import create_storage
+
+
+class MappedStorage(Storage):
+    """
+    Хранилище только для чтения поверх файла таблицы в бинарном формате,
+    отображенного в память. Строки читаются прямо из файла, в памяти
+    хранится только соответствие {ID: номер записи}.
+
+    При первом изменении данных строки переносятся в хранилище заданного
+    типа, и дальнейшая работа ведется с ним, а файл закрывается.
+
+    :param columns: колонки таблицы.
+    :param table_file: файл таблицы.
+    :param storage_type: тип хранилища для переноса строк при изменении.
+    """
+    def __init__(
+            self,
+            columns: Sequence[Column],
+            table_file: BinaryTableFile,
+            storage_type: str
+    ):
+        super().__init__(columns)
+        self._file = table_file
+        self._storage_type = storage_type
+        self._materialized: Storage | None = None
+        id_column: str = AutoColumnNames.ID.value
+        self._positions: dict[int, int] = {
+            table_file.value(position, id_column): position
+            for position in range(len(table_file))
+        }
+
+    def __len__(self) -> int:
+        if self._materialized is not None:
+            return len(self._materialized)
+        return len(self._positions)
+
+    def __contains__(self, row_id: int) -> bool:
+        if self._materialized is not None:
+            return row_id in self._materialized
+        return row_id in self._positions
+
+    def ids(self) -> Iterator[int]:
+        if self._materialized is not None:
+            return self._materialized.ids()
+        return iter(self._positions)
+
+    def rows(self) -> Iterator[dict]:
+        if self._materialized is not None:
+            return self._materialized.rows()
+        return (
+            self._file.record(position)
+            for position in self._positions.values()
+        )
+
+    def get(self, row_id: int) -> dict | None:
+        if self._materialized is not None:
+            return self._materialized.get(row_id)
+        position = self._positions.get(row_id)
+        if position is None:
+            return None
+        return self._file.record(position)
+
+    def value(self, row_id: int, column_name: str) -> Any:
+        if self._materialized is not None:
+            return self._materialized.value(row_id, column_name)
+        return self._file.value(self._positions[row_id], column_name)
+
+    def project(
+            self,
+            row_ids: Iterable[int],
+            column_names: Sequence[str]
+    ) -> Iterator[list]:
+        if self._materialized is not None:
+            return self._materialized.project(row_ids, column_names)
+        value = self._file.value
+        return (
+            [value(position, name) for name in column_names]
+            for position in map(self._positions.__getitem__, row_ids)
+        )
+
+    def filter(
+            self,
+            conditions: Sequence[Condition],
+            row_ids: Iterable[int] | None = None
+    ) -> Iterator[int]:
+        if self._materialized is not None:
+            return self._materialized.filter(conditions, row_ids)
+        if row_ids is None:
+            row_ids = self._positions
+        value = self._file.value
+        return (
+            row_id for row_id in row_ids
+            if all(
+                c.check(value(self._positions[row_id], c.column_name))
+                for c in conditions
+            )
+        )
+
+    def insert(self, row: dict) -> None:
+        self._materialize().insert(row)
+
+    def update(self, row_id: int, values: dict) -> None:
+        self._materialize().update(row_id, values)
+
+    def delete(self, row_id: int) -> None:
+        self._materialize().delete(row_id)
+
+    def _materialize(self) -> Storage:
+        """
+        Перенос строк из файла в хранилище в памяти.
+
+        :return: хранилище в памяти.
+        """
+        if self._materialized is None:
+            storage = create_storage(self._storage_type, self._columns)
+            for row in self.rows():
+                storage.insert(row)
+            self._file.close()
+            self._positions = {}
+            self._materialized = storage
+        return self._materialized
@@ -0,0 +1,69 @@
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from src.primitive_db.const.auto_column_names import AutoColumnNames
+from src.primitive_db.metadata.column import Column
+from src.primitive_db.query.condition import Condition
+
+from .base import Storage
+
+
+class RowStorage(Storage):
+    """
+    Построчное хранилище: каждая строка хранится в виде словаря
+    {имя колонки: значение}, строки проиндексированы по ID.
+    """
+    def __init__(self, columns: Sequence[Column]):
+        super().__init__(columns)
+        self._rows: dict[int, dict] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, row_id: int) -> bool:
+        return row_id in self._rows
+
+    def ids(self) -> Iterator[int]:
+        return iter(self._rows)
+
+    def rows(self) -> Iterator[dict]:
+        return iter(self._rows.values())
+
+    def get(self, row_id: int) -> dict | None:
+        return self._rows.get(row_id)
+
+    def value(self, row_id: int, column_name: str) -> Any:
+        return self._rows[row_id][column_name]
+
+    def project(
+            self,
+            row_ids: Iterable[int],
+            column_names: Sequence[str]
+    ) -> Iterator[list]:
+        return (
+            [row[name] for name in column_names]
+            for row in map(self._rows.__getitem__, row_ids)
+        )
+
+    def filter(
+            self,
+            conditions: Sequence[Condition],
+            row_ids: Iterable[int] | None = None
+    ) -> Iterator[int]:
+        if row_ids is None:
+            items = self._rows.items()
+        else:
+            items = ((row_id, self._rows[row_id]) for row_id in row_ids)
+        return (
+            row_id for row_id, row in items
+            if all(c.check(row[c.column_name]) for c in conditions)
+        )
+
+    def insert(self, row: dict) -> None:
+        self._rows[row[AutoColumnNames.ID.value]] = row
+
+    def update(self, row_id: int, values: dict) -> None:
+        self._rows[row_id].update(values)
+
+    def delete(self, row_id: int) -> None:
+        del self._rows[row_id]
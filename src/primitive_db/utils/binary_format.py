@@ -0,0 +1,240 @@
+from collections.abc import Iterable, Iterator
+from json import JSONDecodeError, dumps, loads
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from struct import Struct
+from struct import error as StructError
+from typing import Any
+
+from src.primitive_db.const.columns_type import ColumnsType
+
+from .load_data import LoadDataError, SaveDataError, write_atomic
+
+# Формат файла:
+#   - сигнатура MAGIC и длина заголовка (uint32);
+#   - заголовок в формате JSON: схема таблицы и количество строк;
+#   - записи фиксированной длины: int - int64, bool - 1 байт,
+#     str - смещение (uint64) и длина (uint32) строки в куче;
+#   - куча строк в кодировке UTF-8.
+MAGIC = b"PDB\x01"
+_PREFIX = Struct("<4sI")
+_FIELD_FORMATS = {
+    ColumnsType.int.value: "q",
+    ColumnsType.bool.value: "?",
+    ColumnsType.str.value: "QI"
+}
+
+# диапазон значений int, которые можно сохранить в поле int64:
+INT_MIN = -2 ** 63
+INT_MAX = 2 ** 63 - 1
+
+ColumnsSpecType = list[tuple[str, str]]
+
+
+def _field_structs(columns: ColumnsSpecType) -> dict[str, tuple[int, Struct]]:
+    """
+    :param columns: схема таблицы вида [(имя колонки, тип колонки)].
+    :return: словарь вида {имя колонки: (смещение поля в записи, формат
+        поля)}.
+    """
+    fields = {}
+    offset = 0
+    for column_name, column_type in columns:
+        field = Struct("<" + _FIELD_FORMATS[column_type])
+        fields[column_name] = (offset, field)
+        offset += field.size
+    return fields
+
+
+def _record_struct(columns: ColumnsSpecType) -> Struct:
+    """
+    :param columns: схема таблицы вида [(имя колонки, тип колонки)].
+    :return: формат записи фиксированной длины.
+    """
+    fields = [_FIELD_FORMATS[column_type] for _, column_type in columns]
+    return Struct("<" + "".join(fields))
+
+
+def check_binary_values(
+        columns: ColumnsSpecType,
+        rows: Iterable[dict]
+) -> None:
+    """
+    Проверка, что значения таблицы могут быть сохранены в бинарном формате
+    (целые значения помещаются в int64).
+
+    :param columns: схема таблицы вида [(имя колонки, тип колонки)].
+    :param rows: строки таблицы вида {имя колонки: значение}.
+    :return: None.
+
+    :raises SaveDataError: если значение вне допустимого диапазона.
+    """
+    int_columns: list[str] = [
+        name for name, column_type in columns
+        if column_type == ColumnsType.int.value
+    ]
+    for row in rows:
+        for column_name in int_columns:
+            value = row[column_name]
+            if not INT_MIN <= value <= INT_MAX:
+                raise SaveDataError(
+                    f"значение {value} колонки {column_name} вне диапазона "
+                    f"[{INT_MIN}, {INT_MAX}] бинарного формата"
+                )
+
+
+def write_binary_table(
+        filepath: Path,
+        columns: ColumnsSpecType,
+        rows: Iterable[dict]
+) -> None:
+    """
+    Сохранение данных таблицы в бинарном формате.
+
+    Данные записываются во временный файл, который затем заменяет целевой.
+    Поэтому файл, открытый через `BinaryTableFile`, остается доступным до
+    его закрытия.
+
+    :param filepath: путь до файла.
+    :param columns: схема таблицы вида [(имя колонки, тип колонки)].
+    :param rows: строки таблицы вида {имя колонки: значение}.
+    :return: None.
+
+    :raises SaveDataError: если не удалось сохранить данные.
+    """
+    record = _record_struct(columns)
+    records = bytearray()
+    heap = bytearray()
+    rows_count = 0
+    try:
+        for row in rows:
+            values = []
+            for column_name, column_type in columns:
+                value = row[column_name]
+                if column_type == ColumnsType.str.value:
+                    data = value.encode("utf-8")
+                    values.extend((len(heap), len(data)))
+                    heap += data
+                else:
+                    values.append(value)
+            records += record.pack(*values)
+            rows_count += 1
+    except (StructError, KeyError, AttributeError) as err:
+        raise SaveDataError(
+            f"Не удалось сохранить данные в файл {filepath}: "
+            f"{err} ({err.__class__.__name__})"
+        )
+    header = dumps({
+        "columns": [list(column) for column in columns],
+        "rows_count": rows_count
+    }).encode("utf-8")
+    write_atomic(
+        filepath,
+        b"".join((_PREFIX.pack(MAGIC, len(header)), header, records, heap))
+    )
+
+
+class BinaryTableFile:
+    """
+    Файл таблицы в бинарном формате, отображенный в память (mmap).
+
+    Значения читаются из отображенного файла по запросу: строка или
+    отдельное значение колонки декодируются только при обращении к ним.
+
+    :param filepath: путь до файла.
+
+    :raises LoadDataError: если не удалось открыть файл.
+    """
+    def __init__(self, filepath: Path):
+        self._filepath = filepath
+        try:
+            with filepath.open("rb") as file:
+                self._mmap = mmap(file.fileno(), 0, access=ACCESS_READ)
+            magic, header_size = _PREFIX.unpack_from(self._mmap, 0)
+            if magic != MAGIC:
+                raise ValueError("неверная сигнатура файла")
+            header = loads(
+                self._mmap[_PREFIX.size:_PREFIX.size + header_size]
+            )
+            self.columns: ColumnsSpecType = [
+                (name, column_type) for name, column_type in header["columns"]
+            ]
+            self.rows_count: int = header["rows_count"]
+            self._record = _record_struct(self.columns)
+            self._fields = _field_structs(self.columns)
+        except (OSError, ValueError, KeyError, StructError,
+                JSONDecodeError) as err:
+            raise LoadDataError(
+                f"Не удалось загрузить данные из файла {filepath}: "
+                f"{err} ({err.__class__.__name__})"
+            )
+        self._records_offset = _PREFIX.size + header_size
+        self._heap_offset = \
+            self._records_offset + self.rows_count * self._record.size
+        self._str_columns = {
+            name for name, column_type in self.columns
+            if column_type == ColumnsType.str.value
+        }
+
+    def __len__(self) -> int:
+        return self.rows_count
+
+    def _decode_str(self, offset: int, length: int) -> str:
+        """
+        :param offset: смещение строки в куче.
+        :param length: длина строки в байтах.
+        :return: строка из кучи.
+        """
+        start = self._heap_offset + offset
+        return self._mmap[start:start + length].decode("utf-8")
+
+    def value(self, position: int, column_name: str) -> Any:
+        """
+        Чтение значения колонки из записи.
+
+        :param position: номер записи.
+        :param column_name: имя колонки.
+        :return: значение колонки.
+        """
+        offset, field = self._fields[column_name]
+        values = field.unpack_from(
+            self._mmap,
+            self._records_offset + position * self._record.size + offset
+        )
+        if column_name in self._str_columns:
+            return self._decode_str(*values)
+        return values[0]
+
+    def record(self, position: int) -> dict:
+        """
+        Чтение записи.
+
+        :param position: номер записи.
+        :return: строка вида {имя колонки: значение}.
+        """
+        values = iter(self._record.unpack_from(
+            self._mmap,
+            self._records_offset + position * self._record.size
+        ))
+        row = {}
+        for column_name, column_type in self.columns:
+            if column_type == ColumnsType.str.value:
+                row[column_name] = self._decode_str(next(values), next(values))
+            else:
+                row[column_name] = next(values)
+        return row
+
+    def records(self) -> Iterator[dict]:
+        """
+        :return: итератор по всем записям файла.
+        """
+        return (self.record(position) for position in range(len(self)))
+
+    def close(self) -> None:
+        """
+        Закрытие отображения файла.
+
+        :return: None.
+        """
+        self._mmap.close()
+
@@ -1,27 +1,124 @@
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+from typing import Any
 
+from src.primitive_db.conf import CONFIG
 
-def create_cacher(size: int = 10) -> Callable:
+
+class LRUCache:
+    """
+    Кэш ограниченного размера с вытеснением давно не использованных
+    записей (LRU).
+
+    Размер кэша может быть задан в конфигурации (параметр cache_sizes) по
+    имени кэша, иначе используется размер по умолчанию. Кэш можно
+    использовать из нескольких потоков.
+
+    :param name: имя кэша.
+    :param capacity: размер кэша по умолчанию.
     """
-    Обертка для кэширования результатов вызова функций.
+    def __init__(self, name: str, capacity: int):
+        self._name = name
+        self._default_capacity = capacity
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def capacity(self) -> int:
+        """
+        :return: максимальное количество записей в кэше.
+        """
+        return CONFIG.cache_sizes.get(self._name, self._default_capacity)
+
+    @property
+    def size(self) -> int:
+        """
+        :return: текущее количество записей в кэше.
+        """
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Получение значения из кэша. Запись становится самой недавно
+        использованной.
+
+        :param key: ключ.
+        :param default: значение, возвращаемое при отсутствии ключа.
+        :return: значение из кэша или default.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Добавление значения в кэш. Если кэш заполнен, то вытесняются давно
+        не использованные записи.
+
+        :param key: ключ.
+        :param value: значение.
+        :return: None.
+        """
+        capacity: int = self.capacity
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > capacity:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Очистка кэша и счетчиков.
+
+        :return: None.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+# кэши, созданные create_cacher, вида {имя кэша: кэш}:
+CACHES: dict[str, LRUCache] = {}
+
+_MISSING = object()
+
+
+def create_cacher(size: int = 128, name: str | None = None) -> Callable:
+    """
+    Обертка для кэширования результатов вызова функций в LRU-кэше.
 
     Не стала применять к select по требованию задания, т.к. select не может
     быть кэшируемым, потому что между вызовами могут произойти изменения в БД.
 
-    :param size: размер кэша.
+    :param size: размер кэша по умолчанию.
+    :param name: имя кэша (по умолчанию - имя функции).
     """
-    cache = {}
-
     def decorator(func: Callable) -> Callable:
+        cache = LRUCache(name or func.__name__, size)
+        CACHES[cache.name] = cache
+
         def cache_result(*args, **kwargs):
             key = (args, tuple(kwargs.items()))
-            if key in cache:
-                return cache[key]
-            else:
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
                 result = func(*args, **kwargs)
-                if len(cache) >= size:
-                    cache.popitem()
-                cache[key] = result
-                return result
+                cache.put(key, result)
+            return result
+        cache_result.cache = cache
         return cache_result
     return decorator
@@ -0,0 +1,120 @@
+from json import JSONDecodeError, dumps, loads
+from pathlib import Path
+
+from .load_data import LoadDataError, SaveDataError, sync_file
+
+
+class ChangeLog:
+    """
+    Журнал изменений данных таблицы.
+
+    Журнал ведется в режиме "только добавление": каждая операция изменения
+    данных записывается в конец файла одной строкой в формате JSON.
+    Содержимое журнала накатывается поверх последней контрольной точки
+    (файла с данными таблицы) при загрузке таблицы.
+
+    :param path: путь к файлу журнала.
+    """
+    def __init__(self, path: Path):
+        self._path = path
+        self._records_count = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def records_count(self) -> int:
+        """
+        :return: количество записей в журнале.
+        """
+        return self._records_count
+
+    def read(self) -> list[dict]:
+        """
+        Чтение всех записей журнала.
+
+        Если последняя строка журнала записана не полностью (например,
+        программа была прервана во время записи), то она отбрасывается.
+
+        :return: список записей журнала.
+
+        :raises LoadDataError: если не удалось прочитать журнал.
+        """
+        if not self._path.exists():
+            self._records_count = 0
+            return []
+        try:
+            with self._path.open() as file:
+                lines = file.read().splitlines()
+        except OSError as err:
+            raise LoadDataError(
+                f"Не удалось прочитать журнал изменений {self._path}: "
+                f"{err} ({err.__class__.__name__})"
+            )
+        records: list[dict] = []
+        for i, line in enumerate(lines):
+            if not line:
+                continue
+            try:
+                records.append(loads(line))
+            except JSONDecodeError as err:
+                if i == len(lines) - 1:
+                    break
+                raise LoadDataError(
+                    f"Поврежден журнал изменений {self._path} "
+                    f"(строка {i + 1}): {err}"
+                )
+        self._records_count = len(records)
+        return records
+
+    def append(self, record: dict) -> None:
+        """
+        Добавление записи в конец журнала.
+
+        :param record: запись журнала.
+        :return: None.
+
+        :raises SaveDataError: если не удалось записать данные.
+        """
+        self.extend([record])
+
+    def extend(self, records: list[dict]) -> None:
+        """
+        Добавление нескольких записей в конец журнала за одну запись в файл.
+
+        :param records: записи журнала.
+        :return: None.
+
+        :raises SaveDataError: если не удалось записать данные.
+        """
+        data: str = "".join(
+            dumps(record, ensure_ascii=False) + "\n" for record in records
+        )
+        try:
+            with self._path.open("a") as file:
+                file.write(data)
+                sync_file(file)
+        except OSError as err:
+            raise SaveDataError(
+                f"Не удалось записать журнал изменений {self._path}: "
+                f"{err} ({err.__class__.__name__})"
+            )
+        self._records_count += len(records)
+
+    def clear(self) -> None:
+        """
+        Очистка журнала.
+
+        :return: None.
+
+        :raises SaveDataError: если не удалось очистить журнал.
+        """
+        try:
+            self._path.unlink(missing_ok=True)
+        except OSError as err:
+            raise SaveDataError(
+                f"Не удалось очистить журнал изменений {self._path}: "
+                f"{err} ({err.__class__.__name__})"
+            )
+        self._records_count = 0
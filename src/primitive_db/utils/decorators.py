@@ -1,30 +1,43 @@
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Generator
+from functools import wraps
 from re import Match
+from threading import current_thread, main_thread
 
 import prompt
 
+from src.primitive_db.conf import CONFIG
 from src.primitive_db.exceptions.cancelled_error import CancelledError
 from src.primitive_db.exceptions.command_error import CommandError
 from src.primitive_db.metadata.db_object import DatabaseError
 
-from .load_data import SaveDataError
+from .load_data import LoadDataError, SaveDataError
 from .parser import ParserError
 
 
 def handle_db_errors(func: Callable) -> Callable:
-    """Обертка для обработки ошибок базы данных."""
-    def wrapper(*args, **kwargs):
+    """
+    Обертка для обработки ошибок базы данных.
+
+    Обернутая функция возвращает True, если операция выполнена, и False,
+    если произошла ошибка.
+    """
+    def wrapper(*args, **kwargs) -> bool:
         try:
-            return func(*args, **kwargs)
+            func(*args, **kwargs)
         except (ValueError, ParserError) as err:
             print(f"Введены некорректные данные: {err}")
         except DatabaseError as err:
             print(f"Не удалось выполнить операцию: {err}")
+        except LoadDataError as err:
+            print(f"Не удалось загрузить данные: {err}")
         except SaveDataError as err:
             print(f"Не удалось сохранить данные: {err}")
         except CommandError as err:
             print(f"Некорректная команда: {err}")
+        else:
+            return True
+        return False
     return wrapper
 
 
@@ -32,10 +45,27 @@ def confirm_action(action_name: str) -> Callable:
     """
     Обертка для подтверждения действия.
 
+    Если задан режим CONFIG.assume_yes, то действие выполняется без
+    запроса. Если команды читаются из скрипта или действие выполняется не
+    в основном потоке, то запросить подтверждение нельзя, и действие
+    отменяется.
+
     :param action_name: название действия.
     """
     def decorator(func: Callable) -> Callable:
         def wrapper(*args, **kwargs):
+            if CONFIG.assume_yes:
+                return func(*args, **kwargs)
+            if not CONFIG.interactive:
+                raise CancelledError(
+                    f"Операция \"{action_name}\" отменена: для "
+                    f"подтверждения запустите скрипт с параметром --yes."
+                )
+            if current_thread() is not main_thread():
+                raise CancelledError(
+                    f"Операция \"{action_name}\" отменена: подтверждение "
+                    f"запрашивается только в основном потоке."
+                )
             matching: Match = prompt.regex(
                 r"^(y|n)$",
                 f"Вы уверены, что хотите выполнить "
@@ -49,15 +79,64 @@ def confirm_action(action_name: str) -> Callable:
     return decorator
 
 
+def synchronized(func: Callable) -> Callable:
+    """
+    Обертка для выполнения метода под блокировкой объекта (атрибут _lock).
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return func(self, *args, **kwargs)
+    return wrapper
+
+
 def log_time(func: Callable) -> Callable:
-    """Обертка для логирования времени выполнения функции"""
+    """
+    Обертка для логирования времени выполнения функции.
+
+    Если функция возвращает генератор, то время выводится после окончания
+    чтения генератора. В режиме CONFIG.quiet время не выводится.
+    """
     def wrapper(*args, **kwargs):
         start_time = time.monotonic()
         result = func(*args, **kwargs)
-        end_time = time.monotonic()
-        print(
-            f"Функция {func.__name__} выполнилась за "
-            f"{end_time-start_time:.3f} секунд."
-        )
+        if isinstance(result, Generator):
+            return _log_generator_time(func.__name__, result, start_time)
+        _print_time(func.__name__, start_time)
         return result
     return wrapper
+
+
+def _log_generator_time(
+        func_name: str,
+        generator: Generator,
+        start_time: float
+) -> Generator:
+    """
+    Обертка генератора для логирования времени его чтения.
+
+    :param func_name: имя функции, вернувшей генератор.
+    :param generator: генератор.
+    :param start_time: время вызова функции.
+    """
+    try:
+        yield from generator
+    finally:
+        _print_time(func_name, start_time)
+
+
+def _print_time(func_name: str, start_time: float) -> None:
+    """
+    Вывод времени выполнения функции.
+
+    :param func_name: имя функции.
+    :param start_time: время вызова функции.
+    :return: None.
+    """
+    if CONFIG.quiet:
+        return
+    end_time = time.monotonic()
+    print(
+        f"Функция {func_name} выполнилась за "
+        f"{end_time-start_time:.3f} секунд."
+    )
@@ -0,0 +1,115 @@
+import heapq
+import pickle
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from tempfile import TemporaryFile
+from typing import IO, Any
+
+from src.primitive_db.conf import CONFIG
+
+from .load_data import LoadDataError, SaveDataError
+
+# количество строк, записываемых во временный файл за один раз:
+RUN_BLOCK_ROWS = 1000
+
+KeyType = Callable[[list], Any]
+
+
+def sort_rows(
+        rows: Iterable[list],
+        key: KeyType,
+        reverse: bool = False,
+        limit: int | None = None
+) -> Iterator[list]:
+    """
+    Сортировка строк. Сортировка устойчивая: строки с равными ключами
+    сохраняют исходный порядок.
+
+    Если задано количество строк limit, то первые limit строк отбираются
+    кучей ограниченного размера (в памяти хранится не более limit строк).
+    Иначе строки сортируются частями по CONFIG.sort_buffer_rows строк;
+    если строк больше, то отсортированные части записываются во временные
+    файлы и сливаются по мере чтения результата.
+
+    :param rows: строки.
+    :param key: функция получения ключа сортировки строки.
+    :param reverse: сортировать ли по убыванию.
+    :param limit: количество первых строк результата (None - все строки).
+    :return: генератор отсортированных строк.
+
+    :raises SaveDataError: если не удалось записать временный файл.
+
+    :raises LoadDataError: если не удалось прочитать временный файл.
+    """
+    if limit is not None:
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        yield from select(limit, rows, key=key)
+        return
+    buffer_rows: int = CONFIG.sort_buffer_rows
+    rows = iter(rows)
+    runs: list[IO[bytes]] = []
+    try:
+        while chunk := list(islice(rows, buffer_rows)):
+            chunk.sort(key=key, reverse=reverse)
+            if not runs and len(chunk) < buffer_rows:
+                # все строки поместились в память:
+                yield from chunk
+                return
+            runs.append(_write_run(chunk))
+        yield from heapq.merge(
+            *(_read_run(run) for run in runs),
+            key=key,
+            reverse=reverse
+        )
+    finally:
+        for run in runs:
+            run.close()
+
+
+def _write_run(rows: list[list]) -> IO[bytes]:
+    """
+    Запись отсортированной части строк во временный файл.
+
+    :param rows: отсортированные строки.
+    :return: временный файл, открытый для чтения с начала. Файл удаляется
+        при закрытии.
+
+    :raises SaveDataError: если не удалось записать файл.
+    """
+    try:
+        run: IO[bytes] = TemporaryFile()
+        for i in range(0, len(rows), RUN_BLOCK_ROWS):
+            pickle.dump(
+                rows[i:i + RUN_BLOCK_ROWS],
+                run,
+                pickle.HIGHEST_PROTOCOL
+            )
+        run.seek(0)
+    except OSError as err:
+        raise SaveDataError(
+            f"Не удалось записать временный файл сортировки: "
+            f"{err} ({err.__class__.__name__})"
+        )
+    return run
+
+
+def _read_run(run: IO[bytes]) -> Iterator[list]:
+    """
+    Чтение отсортированной части строк из временного файла.
+
+    :param run: временный файл.
+    :return: генератор строк.
+
+    :raises LoadDataError: если не удалось прочитать файл.
+    """
+    while True:
+        try:
+            block: list[list] = pickle.load(run)
+        except EOFError:
+            return
+        except OSError as err:
+            raise LoadDataError(
+                f"Не удалось прочитать временный файл сортировки: "
+                f"{err} ({err.__class__.__name__})"
+            )
+        yield from block
@@ -0,0 +1,52 @@
+from collections.abc import Callable
+from threading import Event, Thread
+
+
+class Flusher(Thread):
+    """
+    Фоновый поток сохранения измененных данных.
+
+    Поток вызывает функцию сохранения раз в заданный интервал или раньше,
+    если получен сигнал `notify` (например, накопилось заданное количество
+    изменений).
+
+    :param flush: функция сохранения данных.
+    :param interval: интервал между сохранениями, с.
+    """
+    def __init__(self, flush: Callable[[], None], interval: float):
+        super().__init__(name="primitive-db-flusher", daemon=True)
+        self._flush = flush
+        self._interval = interval
+        self._wakeup = Event()
+        self._stopped = Event()
+
+    def run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(self._interval)
+            self._wakeup.clear()
+            if self._stopped.is_set():
+                break
+            try:
+                self._flush()
+            except Exception as err:
+                print(f"Не удалось сохранить данные: {err}")
+
+    def notify(self) -> None:
+        """
+        Запросить сохранение данных, не дожидаясь окончания интервала.
+
+        :return: None.
+        """
+        self._wakeup.set()
+
+    def stop(self) -> None:
+        """
+        Остановить поток и дождаться его завершения. Данные, не сохраненные
+        к этому моменту, должен сохранить вызывающий код.
+
+        :return: None.
+        """
+        self._stopped.set()
+        self._wakeup.set()
+        if self.is_alive():
+            self.join()
@@ -0,0 +1,74 @@
+from collections.abc import Iterable
+from json import dumps
+from pathlib import Path
+
+from .load_data import LoadDataError, SaveDataError, load_data, write_atomic
+
+# Версии формата файла таблицы в формате JSON:
+#   - 1: список строк вида {имя колонки: значение} с отступами;
+#   - 2: объект {"version": 2, "columns": [имена колонок],
+#     "rows": [[значения колонок], ...]} без отступов.
+JSON_FORMAT_VERSION = 2
+
+
+def write_json_table(
+        filepath: Path,
+        columns: list[str],
+        rows: Iterable[dict]
+) -> None:
+    """
+    Сохранение данных таблицы в файл в формате JSON (версия 2): строки
+    записываются массивами значений в порядке колонок заголовка.
+
+    :param filepath: путь до файла.
+    :param columns: имена колонок таблицы.
+    :param rows: строки таблицы вида {имя колонки: значение}.
+    :return: None.
+
+    :raises SaveDataError: если не удалось сохранить данные.
+    """
+    try:
+        data = {
+            "version": JSON_FORMAT_VERSION,
+            "columns": columns,
+            "rows": [[row[column] for column in columns] for row in rows]
+        }
+    except KeyError as err:
+        raise SaveDataError(
+            f"Не удалось сохранить данные в файл {filepath}: "
+            f"{err} ({err.__class__.__name__})"
+        )
+    write_atomic(
+        filepath,
+        dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    )
+
+
+def read_json_table(filepath: Path) -> tuple[list[dict], int]:
+    """
+    Загрузка данных таблицы из файла в формате JSON версии 1 или 2.
+
+    :param filepath: путь до файла.
+    :return: строки таблицы вида {имя колонки: значение} и версия формата
+        файла.
+
+    :raises LoadDataError: если не удалось загрузить данные.
+    """
+    data = load_data(filepath)
+    if isinstance(data, list):
+        return data, 1
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != JSON_FORMAT_VERSION
+    ):
+        raise LoadDataError(
+            f"Неподдерживаемый формат файла таблицы {filepath}"
+        )
+    try:
+        columns: list[str] = data["columns"]
+        return [dict(zip(columns, values)) for values in data["rows"]], 2
+    except (KeyError, TypeError) as err:
+        raise LoadDataError(
+            f"Поврежден файл таблицы {filepath}: "
+            f"{err} ({err.__class__.__name__})"
+        )
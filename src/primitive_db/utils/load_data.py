@@ -1,5 +1,16 @@
-from json import JSONDecodeError, dump, load
+import os
+import time
+from csv import DictReader
+from csv import Error as CSVError
+from json import JSONDecodeError, dumps, load, loads
 from pathlib import Path
+from typing import IO
+
+from src.primitive_db.conf import CONFIG
+from src.primitive_db.const.durability_modes import DurabilityModes
+
+# время последнего вызова fsync (для режима interval):
+_last_sync_time: float = 0.0
 
 
 class LoadDataError(Exception):
@@ -40,11 +51,115 @@ def save_data(filepath: Path, data: dict | list) -> None:
     :return: None.
     :raises SaveDataError: если не удалось сохранить данные.
     """
+    write_atomic(
+        filepath,
+        dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+    )
+
+
+def write_atomic(filepath: Path, data: bytes) -> None:
+    """
+    Атомарная запись данных в файл: данные записываются во временный файл,
+    который сбрасывается на диск (в соответствии с режимом durability) и
+    переименовывается в целевой файл. При сбое во время записи целевой файл
+    остается в прежнем состоянии.
+
+    :param filepath: путь до файла.
+    :param data: данные.
+    :return: None.
+
+    :raises SaveDataError: если не удалось сохранить данные.
+    """
+    tmp_path = filepath.with_name(filepath.name + ".tmp")
     try:
-        with filepath.open("w") as file:
-            dump(data, file, indent=4, ensure_ascii=False)
+        with tmp_path.open("wb") as file:
+            file.write(data)
+            synced: bool = sync_file(file)
+        os.replace(tmp_path, filepath)
+        if synced:
+            _sync_directory(filepath.parent)
     except OSError as err:
         raise SaveDataError(
-            f"Не удалось сохранить метаданные в файл {filepath}: "
+            f"Не удалось сохранить данные в файл {filepath}: "
             f"{err} ({err.__class__.__name__})"
         )
+
+
+def sync_file(file: IO) -> bool:
+    """
+    Сброс данных открытого файла на диск в соответствии с режимом
+    durability: none - без сброса, commit - при каждом вызове, interval - не
+    чаще, чем раз в durability_interval миллисекунд.
+
+    :param file: открытый на запись файл.
+    :return: True, если данные сброшены на диск.
+
+    :raises OSError: если не удалось сбросить данные.
+    """
+    global _last_sync_time
+    file.flush()
+    match CONFIG.durability:
+        case DurabilityModes.none:
+            return False
+        case DurabilityModes.interval:
+            now: float = time.monotonic()
+            if (now - _last_sync_time) * 1000 < CONFIG.durability_interval:
+                return False
+            _last_sync_time = now
+    os.fsync(file.fileno())
+    return True
+
+
+def _sync_directory(path: Path) -> None:
+    """
+    Сброс на диск записи каталога (после переименования файла). На
+    платформах, где каталог нельзя открыть (Windows), ничего не делает.
+
+    :param path: путь до каталога.
+    :return: None.
+
+    :raises OSError: если не удалось сбросить данные.
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd: int = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def load_rows(filepath: Path) -> list[dict]:
+    """
+    Загрузка строк таблицы из файла формата CSV или JSONL.
+
+    Файл CSV должен содержать строку заголовков с именами колонок. Каждая
+    строка файла JSONL должна содержать объект вида {имя колонки: значение}.
+
+    :param filepath: путь до файла с данными.
+    :return: список строк вида {имя колонки: значение}.
+
+    :raises LoadDataError: если не удалось загрузить данные.
+    """
+    suffix = filepath.suffix.lower()
+    if suffix not in (".csv", ".jsonl"):
+        raise LoadDataError(
+            f"Неподдерживаемый формат файла {filepath}: "
+            f"ожидается .csv или .jsonl"
+        )
+    try:
+        with filepath.open(newline="") as file:
+            if suffix == ".csv":
+                return list(DictReader(file))
+            rows = [loads(line) for line in file if line.strip()]
+    except (OSError, JSONDecodeError, CSVError, UnicodeDecodeError) as err:
+        raise LoadDataError(
+            f"Не удалось загрузить данные из файла {filepath}: "
+            f"{err} ({err.__class__.__name__})"
+        )
+    if not all(isinstance(row, dict) for row in rows):
+        raise LoadDataError(
+            f"Не удалось загрузить данные из файла {filepath}: каждая "
+            f"строка должна содержать объект JSON"
+        )
+    return rows
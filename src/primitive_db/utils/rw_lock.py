@@ -0,0 +1,122 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from threading import Condition, Lock, get_ident
+
+
+class RWLock:
+    """
+    Блокировка чтения/записи: читать могут несколько потоков одновременно,
+    записывать - только один поток, когда нет читающих.
+
+    Ожидающий запись поток не пропускает новых читающих, поэтому поток
+    записи не ждет бесконечно. Блокировка повторно входимая: поток,
+    владеющий блокировкой записи, может повторно получить блокировку записи
+    или чтения, а поток, владеющий блокировкой чтения, - повторно получить
+    блокировку чтения. Повышение блокировки чтения до записи не
+    поддерживается.
+    """
+    def __init__(self):
+        self._condition = Condition(Lock())
+        # количество блокировок чтения потоков вида {ID потока: количество}:
+        self._readers: dict[int, int] = {}
+        self._writer: int | None = None
+        self._writes_count: int = 0
+        self._waiting_writers: int = 0
+
+    def acquire_read(self) -> None:
+        """
+        Получение блокировки чтения.
+
+        :return: None.
+        """
+        thread_id: int = get_ident()
+        with self._condition:
+            if self._writer != thread_id and thread_id not in self._readers:
+                while self._writer is not None or self._waiting_writers:
+                    self._condition.wait()
+            self._readers[thread_id] = self._readers.get(thread_id, 0) + 1
+
+    def release_read(self) -> None:
+        """
+        Освобождение блокировки чтения.
+
+        :return: None.
+
+        :raises RuntimeError: если поток не владеет блокировкой чтения.
+        """
+        thread_id: int = get_ident()
+        with self._condition:
+            count: int | None = self._readers.get(thread_id)
+            if count is None:
+                raise RuntimeError("блокировка чтения не получена")
+            if count > 1:
+                self._readers[thread_id] = count - 1
+                return
+            del self._readers[thread_id]
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """
+        Получение блокировки записи.
+
+        :return: None.
+
+        :raises RuntimeError: если поток владеет только блокировкой чтения
+            (ожидание записи привело бы к взаимной блокировке).
+        """
+        thread_id: int = get_ident()
+        with self._condition:
+            if self._writer == thread_id:
+                self._writes_count += 1
+                return
+            if thread_id in self._readers:
+                raise RuntimeError(
+                    "повышение блокировки чтения до записи не поддерживается"
+                )
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = thread_id
+            self._writes_count = 1
+
+    def release_write(self) -> None:
+        """
+        Освобождение блокировки записи.
+
+        :return: None.
+
+        :raises RuntimeError: если поток не владеет блокировкой записи.
+        """
+        with self._condition:
+            if self._writer != get_ident():
+                raise RuntimeError("блокировка записи не получена")
+            self._writes_count -= 1
+            if not self._writes_count:
+                self._writer = None
+                self._condition.notify_all()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """
+        Выполнение блока под блокировкой чтения.
+        """
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """
+        Выполнение блока под блокировкой записи.
+        """
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
@@ -0,0 +1,60 @@
+import json
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+
+from src.primitive_db.conf import CONFIG
+from src.primitive_db.core import Core
+
+
+@pytest.fixture
+def database_path(tmp_path: Path) -> Path:
+    """
+    Директория БД теста с конфигурацией: фоновое сохранение выполняется
+    только по явному вызову (большой интервал), вывод отключен.
+    """
+    path = tmp_path / "db"
+    path.mkdir()
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({
+        "database_path": str(path),
+        "flush_interval": 3_600_000,
+        "flush_mutations": 1_000_000,
+    }))
+    CONFIG.load(config_path)
+    CONFIG.set_run_mode(False, True, True)
+    return path
+
+
+def _stop(core: Core) -> None:
+    """
+    Остановка фонового сохранения ядра без сохранения данных.
+    """
+    if core._flusher is not None:
+        core._flusher.stop()
+
+
+@pytest.fixture
+def core(database_path: Path) -> Iterator[Core]:
+    core = Core(database_path)
+    yield core
+    _stop(core)
+
+
+@pytest.fixture
+def reopen(database_path: Path) -> Iterator[Callable[[], Core]]:
+    """
+    Повторное открытие БД теста новым ядром, как после перезапуска
+    программы: данные читаются из файлов, открытое ранее ядро не
+    закрывается (не сохраняет данные).
+    """
+    cores: list[Core] = []
+
+    def open_core() -> Core:
+        cores.append(Core(database_path))
+        return cores[-1]
+
+    yield open_core
+    for core in cores:
+        _stop(core)
@@ -0,0 +1,69 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from src.primitive_db.core import Core
+from src.primitive_db.storage import MappedStorage
+from src.primitive_db.utils.binary_format import (
+    BinaryTableFile,
+    write_binary_table,
+)
+from src.primitive_db.utils.load_data import LoadDataError, SaveDataError
+
+COLUMNS = [("ID", "int"), ("name", "str"), ("age", "int"), ("ok", "bool")]
+ROWS = [
+    {"ID": 1, "name": "Анна", "age": 30, "ok": True},
+    {"ID": 2, "name": "", "age": -(2 ** 63), "ok": False},
+    {"ID": 5, "name": "Bob Lee", "age": 2 ** 63 - 1, "ok": True},
+]
+
+
+def test_binary_round_trip(tmp_path: Path):
+    path = tmp_path / "table.bin"
+    write_binary_table(path, COLUMNS, ROWS)
+    table_file = BinaryTableFile(path)
+    try:
+        assert table_file.columns == COLUMNS
+        assert len(table_file) == 3
+        assert list(table_file.records()) == ROWS
+        assert table_file.value(2, "name") == "Bob Lee"
+        assert table_file.value(0, "ok") is True
+    finally:
+        table_file.close()
+
+
+def test_binary_write_and_read_errors(tmp_path: Path):
+    path = tmp_path / "table.bin"
+    with pytest.raises(SaveDataError):
+        write_binary_table(
+            path,
+            COLUMNS,
+            [{"ID": 1, "name": "a", "age": 2 ** 63, "ok": True}]
+        )
+    path.write_bytes(b"not a table")
+    with pytest.raises(LoadDataError):
+        BinaryTableFile(path)
+
+
+def test_binary_table_is_mapped_until_changed(
+        core: Core,
+        reopen: Callable[[], Core]
+):
+    core.create_table("users", [("name", "str"), ("age", "int")])
+    core.insert_many("users", [["a", "1"], ["b", "2"], ["c", "3"]])
+    core.convert_table("users", "binary")
+    assert not (core._database_path / "table_users.json").exists()
+
+    reopened = reopen()
+    table = reopened.get_table("users")
+    assert isinstance(table._storage, MappedStorage)
+    assert table._storage._materialized is None
+    assert list(reopened.select("users", {"age": "2"}))[1:] == [[2, "b", 2]]
+    # при первом изменении строки переносятся в память:
+    reopened.update("users", {"name": "bb"}, {"ID": "2"})
+    assert table._storage._materialized is not None
+    reopened.close()
+
+    table_rows = list(reopen().select("users", None))[1:]
+    assert table_rows == [[1, "a", 1], [2, "bb", 2], [3, "c", 3]]
@@ -0,0 +1,79 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from src.primitive_db.conf import CONFIG
+from src.primitive_db.core import Core
+from src.primitive_db.utils.change_log import ChangeLog
+from src.primitive_db.utils.load_data import LoadDataError
+
+
+def _rows(core: Core, table_name: str) -> list[list]:
+    return list(core.select(table_name, None))[1:]
+
+
+def test_change_log_round_trip(tmp_path: Path):
+    change_log = ChangeLog(tmp_path / "log.jsonl")
+    assert change_log.read() == []
+    change_log.append({"op": "delete", "ids": [1]})
+    change_log.extend([{"op": "delete", "ids": [2]}, {"op": "x"}])
+    assert change_log.records_count == 3
+    reread = ChangeLog(change_log.path)
+    assert reread.read() == [
+        {"op": "delete", "ids": [1]},
+        {"op": "delete", "ids": [2]},
+        {"op": "x"},
+    ]
+    assert reread.records_count == 3
+    reread.clear()
+    assert not change_log.path.exists()
+    assert reread.records_count == 0
+
+
+def test_change_log_drops_torn_last_line(tmp_path: Path):
+    path = tmp_path / "log.jsonl"
+    path.write_text('{"op": "delete", "ids": [1]}\n{"op": "del')
+    assert ChangeLog(path).read() == [{"op": "delete", "ids": [1]}]
+    path.write_text('{"op": "del\n{"op": "delete", "ids": [1]}\n')
+    with pytest.raises(LoadDataError):
+        ChangeLog(path).read()
+
+
+def test_changes_are_replayed_after_restart(
+        core: Core,
+        reopen: Callable[[], Core]
+):
+    core.create_table("users", [("name", "str"), ("age", "int")])
+    core.insert_many("users", [["a", "1"], ["b", "2"], ["c", "3"]])
+    core.update("users", {"age": 20}, {"name": "b"})
+    core.delete("users", {"name": "a"})
+    core._flush_pending()
+    # изменения сохранены только в журнал:
+    assert core._change_logs["users"].records_count == 3
+    reopened = reopen()
+    assert _rows(reopened, "users") == [[2, "b", 20], [3, "c", 3]]
+    assert reopened.insert("users", ["d", "4"]) == 4
+
+
+def test_checkpoint_when_change_log_is_full(
+        core: Core,
+        reopen: Callable[[], Core],
+        monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(CONFIG, "_change_log_limit", 3)
+    core.create_table("users", [("name", "str")])
+    for name in "abc":
+        core.insert("users", [name])
+        core._flush_pending()
+    change_log: ChangeLog = core._change_logs["users"]
+    # журнал достиг допустимого размера: данные сохраняются в файл
+    # таблицы, журнал очищается
+    assert change_log.records_count == 0
+    assert not change_log.path.exists()
+    core.insert("users", ["d"])
+    core.delete("users", {"name": "a"})
+    core._flush_pending()
+    assert change_log.records_count == 2
+    reopened = reopen()
+    assert _rows(reopened, "users") == [[2, "b"], [3, "c"], [4, "d"]]
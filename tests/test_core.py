@@ -0,0 +1,198 @@
+from collections.abc import Callable
+
+import pytest
+
+from src.primitive_db import core as core_module
+from src.primitive_db.conf import CONFIG
+from src.primitive_db.const.commands import Commands
+from src.primitive_db.const.operators import Operators
+from src.primitive_db.core import Core
+from src.primitive_db.metadata.table import Table
+from src.primitive_db.query import planner
+from src.primitive_db.query.ast import Placeholder, SelectStatement
+from src.primitive_db.query.condition import Condition
+from src.primitive_db.query.parser import parse_statement
+from src.primitive_db.storage import StorageError
+from src.primitive_db.utils.change_log import ChangeLog
+from src.primitive_db.utils.load_data import SaveDataError
+
+
+def _rows(core: Core, table_name: str) -> list[list]:
+    return list(core.select(table_name, None))[1:]
+
+
+def test_flush_in_transaction_does_not_log_uncommitted_update(
+        core: Core,
+        reopen: Callable[[], Core]
+):
+    core.create_table("users", [("name", "str")])
+    core.insert("users", ["committed"])
+    core.begin()
+    core.update("users", {"name": "uncommitted"}, {"ID": "1"})
+    # запись insert сохраняется в журнал во время транзакции:
+    core._flush_pending()
+    core.rollback()
+    assert _rows(core, "users") == [[1, "committed"]]
+    # данные читаются заново из файлов (без сохранения при закрытии):
+    reopened = reopen()
+    assert _rows(reopened, "users") == [[1, "committed"]]
+
+
+def test_replay_after_checkpoint_without_log_clear(
+        core: Core,
+        reopen: Callable[[], Core],
+        monkeypatch: pytest.MonkeyPatch
+):
+    core.create_table("users", [("name", "str")])
+    core.insert_many("users", [["a"], ["b"], ["c"]])
+    core.update("users", {"name": "b2"}, {"ID": "2"})
+    core.delete("users", {"ID": "3"})
+    core._flush_pending()
+    # сбой после сохранения данных таблицы, до очистки журнала:
+    monkeypatch.setattr(ChangeLog, "clear", lambda self: None)
+    assert core.flush() == ["users"]
+    monkeypatch.undo()
+    reopened = reopen()
+    assert _rows(reopened, "users") == [[1, "a"], [2, "b2"]]
+    assert reopened.insert("users", ["d"]) == 4
+
+
+def test_failed_storage_conversion_keeps_storage_type(
+        core: Core,
+        reopen: Callable[[], Core]
+):
+    core.create_table("numbers", [("value", "int")])
+    core.insert_many("numbers", [["1"], [str(2 ** 70)]])
+    with pytest.raises(StorageError):
+        core.set_storage("numbers", "columnar")
+    assert core.get_table("numbers").storage_type == "rows"
+    assert _rows(core, "numbers") == [[1, 1], [2, 2 ** 70]]
+    core.close()
+    reopened = reopen()
+    assert reopened.get_table("numbers").storage_type == "rows"
+    assert _rows(reopened, "numbers") == [[1, 1], [2, 2 ** 70]]
+
+
+def test_stats_follow_rollback_update_and_delete(core: Core):
+    core.create_table("users", [("name", "str")])
+    core.insert_many("users", [["a"], ["b"], [""]])
+    core.analyze("users")
+    stats = core.get_table("users").get_column("name").stats
+    assert (stats.rows_count, stats.empty_count) == (3, 1)
+
+    core.begin()
+    core.insert("users", ["d"])
+    core.delete("users", {"ID": "1"})
+    core.rollback()
+    stats = core.get_table("users").get_column("name").stats
+    assert (stats.rows_count, stats.empty_count) == (3, 1)
+    assert (stats.min_value, stats.max_value) == ("", "b")
+
+    core.update("users", {"name": "c"}, {"ID": "3"})
+    assert (stats.rows_count, stats.empty_count) == (3, 0)
+    assert stats.max_value == "c"
+    core.delete("users", {"ID": "2"})
+    assert (stats.rows_count, stats.empty_count) == (2, 0)
+
+
+def test_stats_include_replayed_changes(
+        core: Core,
+        reopen: Callable[[], Core]
+):
+    core.create_table("users", [("name", "str")])
+    core.insert_many("users", [["a"], ["b"]])
+    core.analyze("users")
+    core.insert("users", ["c"])
+    core._flush_pending()
+    reopened = reopen()
+    stats = reopened.get_table("users").get_column("name").stats
+    assert (stats.rows_count, stats.max_value) == (3, "c")
+
+
+def test_prepared_statement_reuses_validation_and_plan(
+        core: Core,
+        monkeypatch: pytest.MonkeyPatch
+):
+    core.create_table("users", [("name", "str"), ("age", "int")])
+    core.insert_many("users", [["a", "20"], ["b", "30"], ["c", "40"]])
+    core.create_index("users", "name")
+    core.prepare("by_name", SelectStatement(
+        "users",
+        where=(
+            Condition("name", Operators.eq, Placeholder(0)),
+            Condition("age", Operators.gt, Placeholder(1)),
+        )
+    ))
+    calls: dict[str, int] = {"validate": 0, "plan": 0}
+
+    def counted(name, func):
+        def wrapper(*args, **kwargs):
+            calls[name] += 1
+            return func(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(
+        Table,
+        "_validate_conditions",
+        counted("validate", Table._validate_conditions)
+    )
+    monkeypatch.setattr(
+        planner,
+        "plan_query",
+        counted("plan", planner.plan_query)
+    )
+    for name, age, expected in (
+        ("a", "10", [[1, "a", 20]]),
+        ("b", "10", [[2, "b", 30]]),
+        ("c", "50", []),
+    ):
+        _, result = core.execute_prepared("by_name", [name, age])
+        assert list(result)[1:] == expected
+    assert calls == {"validate": 0, "plan": 1}
+
+    # после изменения индексов план строится заново:
+    core.drop_index("users", "name")
+    _, result = core.execute_prepared("by_name", ["a", "10"])
+    assert list(result)[1:] == [[1, "a", 20]]
+    assert calls == {"validate": 0, "plan": 2}
+
+
+def test_failed_binary_conversion_keeps_file_format(
+        core: Core,
+        reopen: Callable[[], Core],
+        monkeypatch: pytest.MonkeyPatch
+):
+    core.create_table("numbers", [("value", "int")])
+    core.create_table("other", [("name", "str")])
+    core.insert_many("numbers", [["1"], [str(2 ** 70)]])
+    core.flush()
+    with pytest.raises(SaveDataError):
+        core.convert_table("numbers", "binary")
+    assert core.get_table("numbers").file_format == "json"
+
+    # ошибка записи файла нового формата:
+    core.delete("numbers", {"ID": "2"})
+
+    def fail(*args, **kwargs):
+        raise SaveDataError("ошибка записи")
+
+    monkeypatch.setattr(core_module, "write_binary_table", fail)
+    with pytest.raises(SaveDataError):
+        core.convert_table("numbers", "binary")
+    monkeypatch.undo()
+    assert core.get_table("numbers").file_format == "json"
+    # метаданные сохраняются с прежним форматом файла:
+    core.analyze("other")
+    assert core.flush() == ["numbers"]
+    reopened = reopen()
+    assert reopened.get_table("numbers").file_format == "json"
+    assert _rows(reopened, "numbers") == [[1, 1]]
+
+
+def test_aggregate_logs_time(core: Core, capsys: pytest.CaptureFixture):
+    core.create_table("users", [("age", "int")])
+    core.insert_many("users", [["1"], ["2"]])
+    CONFIG.set_run_mode(False, True, False)
+    statement = parse_statement(Commands.select, "sum(age) from users")
+    assert list(core.execute(statement)) == [["sum(age)"], [3]]
+    assert "Функция aggregate выполнилась" in capsys.readouterr().out
@@ -0,0 +1,69 @@
+import random
+from itertools import count
+from operator import itemgetter
+
+import pytest
+
+from src.primitive_db.conf import CONFIG
+from src.primitive_db.core import Core
+from src.primitive_db.utils import external_sort
+from src.primitive_db.utils.external_sort import sort_rows
+
+
+@pytest.fixture
+def rows() -> list[list]:
+    numbers = random.Random(1)
+    # второе значение - исходная позиция строки (проверка устойчивости):
+    return [[numbers.randint(0, 20), i] for i in range(100)]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_external_merge_sort(
+        rows: list[list],
+        reverse: bool,
+        monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(CONFIG, "_sort_buffer_rows", 7)
+    runs = count()
+    write_run = external_sort._write_run
+
+    def counted_write_run(chunk: list[list]):
+        next(runs)
+        return write_run(chunk)
+
+    monkeypatch.setattr(external_sort, "_write_run", counted_write_run)
+    result = list(sort_rows(rows, itemgetter(0), reverse))
+    assert result == sorted(rows, key=itemgetter(0), reverse=reverse)
+    # строки сортировались частями во временных файлах:
+    assert next(runs) == 15
+
+
+def test_sort_in_memory(rows: list[list], monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        external_sort,
+        "_write_run",
+        pytest.fail
+    )
+    assert list(sort_rows(rows, itemgetter(0))) == \
+        sorted(rows, key=itemgetter(0))
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_top_k(rows: list[list], reverse: bool):
+    result = list(sort_rows(iter(rows), itemgetter(0), reverse, limit=5))
+    assert result == sorted(rows, key=itemgetter(0), reverse=reverse)[:5]
+
+
+def test_select_order_by(core: Core, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(CONFIG, "_sort_buffer_rows", 4)
+    core.create_table("users", [("age", "int")])
+    ages = [35, 12, 50, 12, 41, 8, 27, 33, 19, 60]
+    core.insert_many("users", [[str(age)] for age in ages])
+    result = list(core.select("users", None, order_by="age"))[1:]
+    assert [row[1] for row in result] == sorted(ages)
+    result = core.select(
+        "users", None, limit=3, offset=1, columns=["ID"],
+        order_by="age", descending=True
+    )
+    # колонка сортировки не выбирается:
+    assert list(result) == [["ID"], [3], [5], [1]]
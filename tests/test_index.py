@@ -0,0 +1,42 @@
+from collections.abc import Callable
+
+import pytest
+
+from src.primitive_db.const.operators import Operators
+from src.primitive_db.core import Core
+from src.primitive_db.metadata import index as index_module
+from src.primitive_db.metadata.index import Index
+from src.primitive_db.query.condition import Condition
+
+
+def test_build_sorted_index():
+    index = Index("age", type="sorted")
+    index.build([(30, 1), (10, 2), (30, 3), (20, 4)])
+    assert index.keys_count == 3
+    assert index.lookup(30) == {1, 3}
+    assert index.range(15, None) == {1, 3, 4}
+    assert index.range_keys_count(None, 20) == 2
+    index.add(15, 5)
+    index.remove(10, 2)
+    assert index.range(None, 20) == {4, 5}
+
+
+def test_sorted_index_is_built_without_insort(
+        core: Core,
+        reopen: Callable[[], Core],
+        monkeypatch: pytest.MonkeyPatch
+):
+    core.create_table("users", [("age", "int")])
+    core.insert_many("users", [[str(age)] for age in (40, 10, 30, 20)])
+    calls: list = []
+    monkeypatch.setattr(
+        index_module,
+        "insort",
+        lambda keys, value: calls.append(value) or keys.append(value)
+    )
+    core.create_index("users", "age", "sorted")
+    core.close()
+    reopened = reopen()
+    select = reopened.select("users", [Condition("age", Operators.ge, 20)])
+    assert list(select)[1:] == [[1, 40], [3, 30], [4, 20]]
+    assert calls == []
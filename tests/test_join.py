@@ -0,0 +1,72 @@
+import pytest
+
+from src.primitive_db.conf import CONFIG
+from src.primitive_db.const.commands import Commands
+from src.primitive_db.core import Core
+from src.primitive_db.query.join import hash_join
+from src.primitive_db.query.parser import parse_statement
+
+
+def test_hash_join():
+    users = [[1, "a"], [2, "b"], [3, "c"]]
+    orders = [[10, 1], [11, 3], [12, 1], [13, 9]]
+    assert list(hash_join(users, orders, 0, 1)) == [
+        ([1, "a"], [10, 1]),
+        ([3, "c"], [11, 3]),
+        ([1, "a"], [12, 1]),
+    ]
+
+
+def test_hash_join_converts_probe_keys():
+    build = [[1, "a"], [2, "b"]]
+    probe = [["2"], ["x"], ["1"]]
+    assert list(hash_join(build, probe, 0, 0, int)) == [
+        ([2, "b"], ["2"]),
+        ([1, "a"], ["1"]),
+    ]
+
+
+@pytest.fixture
+def shop(core: Core) -> Core:
+    core.create_table("users", [("name", "str")])
+    core.create_table("orders", [("user_id", "int"), ("item", "str")])
+    core.insert_many("users", [["a"], ["b"], ["c"]])
+    core.insert_many(
+        "orders",
+        [["1", "x"], ["3", "y"], ["1", "z"], ["9", "w"]]
+    )
+    return core
+
+
+def _join(core: Core, query: str) -> list[list]:
+    return list(core.join(parse_statement(Commands.select, query)))
+
+
+def test_select_join(shop: Core):
+    assert _join(shop, "* from users join orders on users.ID = user_id") \
+        == [
+            [
+                "users.ID", "users.name",
+                "orders.ID", "orders.user_id", "orders.item"
+            ],
+            [1, "a", 1, 1, "x"],
+            [3, "c", 2, 3, "y"],
+            [1, "a", 3, 1, "z"],
+        ]
+    assert _join(
+        shop,
+        'name, item from orders join users on user_id = users.ID '
+        'where item = "x"'
+    ) == [["name", "item"], ["a", "x"]]
+
+
+def test_select_join_ambiguous_column(shop: Core):
+    with pytest.raises(ValueError):
+        _join(shop, "* from users join orders on ID = user_id")
+
+
+def test_join_logs_time(shop: Core, capsys: pytest.CaptureFixture):
+    CONFIG.set_run_mode(False, True, False)
+    query = "item from users join orders on users.ID = user_id"
+    assert len(_join(shop, query)) == 4
+    assert "Функция join выполнилась" in capsys.readouterr().out
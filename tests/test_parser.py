@@ -0,0 +1,102 @@
+import pytest
+
+from src.primitive_db.const.aggregate_functions import AggregateFunctions
+from src.primitive_db.const.commands import Commands
+from src.primitive_db.const.operators import Operators
+from src.primitive_db.query.ast import (
+    Aggregate,
+    DeleteStatement,
+    InsertStatement,
+    JoinClause,
+    Placeholder,
+    SelectStatement,
+    UpdateStatement,
+)
+from src.primitive_db.query.condition import Condition
+from src.primitive_db.query.parser import parse_statement, parse_values
+from src.primitive_db.utils.parser import ParserError
+
+
+def _conditions(conditions: tuple[Condition, ...]) -> list[tuple]:
+    return [(c.column_name, c.operator, c.value) for c in conditions]
+
+
+def test_parse_insert():
+    statement = parse_statement(
+        Commands.insert,
+        'into users values ("Ann Lee", 30, true), ("Bob", -5, false)'
+    )
+    assert statement == InsertStatement(
+        "users",
+        (("Ann Lee", "30", "true"), ("Bob", "-5", "false"))
+    )
+
+
+def test_parse_select():
+    statement = parse_statement(
+        Commands.select,
+        'name, age from users where age >= 18 and name = "Ann" '
+        'order by age desc after ID=3 limit 10 offset 2'
+    )
+    assert isinstance(statement, SelectStatement)
+    assert statement.table == "users"
+    assert statement.columns == ("name", "age")
+    assert _conditions(statement.where) == [
+        ("age", Operators.ge, "18"),
+        ("name", Operators.eq, "Ann"),
+    ]
+    assert (statement.order_by, statement.descending) == ("age", True)
+    assert (statement.after_id, statement.limit, statement.offset) == \
+        (3, 10, 2)
+
+
+def test_parse_select_aggregates_and_join():
+    statement = parse_statement(
+        Commands.select,
+        "count(*), sum(age) from users group by name"
+    )
+    assert statement.aggregates == (
+        Aggregate(AggregateFunctions.count),
+        Aggregate(AggregateFunctions.sum, "age"),
+    )
+    assert statement.group_by == "name"
+    statement = parse_statement(
+        Commands.select,
+        "* from a join b on a.x = b.y where a.x between 1 and 5"
+    )
+    assert statement.join == JoinClause("b", "a.x", "b.y")
+    assert _conditions(statement.where) == [
+        ("a.x", Operators.between, ("1", "5")),
+    ]
+
+
+def test_parse_update_and_delete_with_placeholders():
+    statement = parse_statement(
+        Commands.update,
+        "users set age = ? where name = ?"
+    )
+    assert isinstance(statement, UpdateStatement)
+    assert statement.assignments == (("age", Placeholder(0)),)
+    assert _conditions(statement.where) == [
+        ("name", Operators.eq, Placeholder(1)),
+    ]
+    statement = parse_statement(Commands.delete, "from users where ID = 1")
+    assert isinstance(statement, DeleteStatement)
+    assert _conditions(statement.where) == [("ID", Operators.eq, "1")]
+
+
+def test_parse_values():
+    assert parse_values('(1, "a b", true)') == ("1", "a b", "true")
+
+
+@pytest.mark.parametrize(("command", "command_data"), [
+    (Commands.select, "from"),
+    (Commands.delete, "from users"),
+    (Commands.update, "users set age = 1"),
+    (Commands.insert, "into t values (1"),
+    (Commands.select, "* from t where a ~ 1"),
+    (Commands.select, "* from t limit x"),
+])
+def test_parse_errors(command: Commands, command_data: str):
+    with pytest.raises(ParserError):
+        parse_statement(command, command_data)
@@ -0,0 +1,91 @@
+import threading
+import time
+
+import pytest
+
+from src.primitive_db.core import Core
+from src.primitive_db.query_executor import QueryExecutor
+from src.primitive_db.utils.rw_lock import RWLock
+
+TIMEOUT = 5
+
+
+def test_readers_share_lock():
+    lock = RWLock()
+    barrier = threading.Barrier(3, timeout=TIMEOUT)
+
+    def read():
+        with lock.read():
+            # все читающие потоки одновременно держат блокировку:
+            barrier.wait()
+
+    threads = [threading.Thread(target=read) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(TIMEOUT)
+    assert not barrier.broken
+
+
+def test_writer_excludes_readers_and_waits_for_them():
+    lock = RWLock()
+    events: list[str] = []
+    release_writer = threading.Event()
+
+    def write():
+        with lock.write():
+            events.append("write")
+            release_writer.wait(TIMEOUT)
+            events.append("write done")
+
+    def read():
+        with lock.read():
+            events.append("read")
+
+    lock.acquire_read()
+    writer = threading.Thread(target=write)
+    writer.start()
+    time.sleep(0.1)
+    # поток записи ждет освобождения блокировки чтения:
+    assert events == []
+    reader = threading.Thread(target=read)
+    reader.start()
+    time.sleep(0.1)
+    # ожидающий поток записи не пропускает новых читающих:
+    assert events == []
+    lock.release_read()
+    time.sleep(0.1)
+    assert events == ["write"]
+    release_writer.set()
+    writer.join(TIMEOUT)
+    reader.join(TIMEOUT)
+    assert events == ["write", "write done", "read"]
+
+
+def test_reentrant_lock():
+    lock = RWLock()
+    with lock.write():
+        with lock.write():
+            with lock.read():
+                pass
+    with lock.read():
+        with lock.read():
+            with pytest.raises(RuntimeError):
+                lock.acquire_write()
+    with pytest.raises(RuntimeError):
+        lock.release_read()
+    with pytest.raises(RuntimeError):
+        lock.release_write()
+
+
+def test_parallel_queries(core: Core):
+    core.create_table("users", [("name", "str"), ("age", "int")])
+    with QueryExecutor(core, max_workers=4) as executor:
+        inserted = list(executor.map(
+            f'insert into users values ("u{i}", {i})' for i in range(40)
+        ))
+        assert sorted(ids[0] for ids in inserted) == list(range(1, 41))
+        results = list(executor.map(
+            f"select * from users where age = {i}" for i in range(40)
+        ))
+    assert [rows[1][2] for rows in results] == list(range(40))
@@ -0,0 +1,84 @@
+from collections.abc import Callable
+
+import pytest
+
+from src.primitive_db.const.operators import Operators
+from src.primitive_db.core import Core
+from src.primitive_db.metadata.column import Column
+from src.primitive_db.query.condition import Condition
+from src.primitive_db.storage import StorageError, create_storage
+from src.primitive_db.storage.columnar_storage import ColumnarStorage
+
+
+def _columns() -> list[Column]:
+    return [
+        Column("ID", type="int"),
+        Column("name", type="str"),
+        Column("age", type="int"),
+        Column("ok", type="bool"),
+    ]
+
+
+@pytest.fixture(params=["rows", "columnar"])
+def storage(request: pytest.FixtureRequest):
+    storage = create_storage(request.param, _columns())
+    for i in range(1, 7):
+        storage.insert(
+            {"ID": i, "name": f"n{i}", "age": i * 10, "ok": i % 2 == 0}
+        )
+    return storage
+
+
+def test_storage_operations(storage):
+    assert len(storage) == 6
+    assert storage.get(2) == {"ID": 2, "name": "n2", "age": 20, "ok": True}
+    assert storage.get(7) is None
+    storage.update(2, {"age": 25})
+    storage.delete(3)
+    assert 3 not in storage
+    assert list(storage.ids()) == [1, 2, 4, 5, 6]
+    assert storage.value(2, "age") == 25
+    assert list(storage.project([4, 1], ["name", "ok"])) == \
+        [["n4", True], ["n1", False]]
+    conditions = [
+        Condition("age", Operators.gt, 15),
+        Condition("ok", Operators.eq, True),
+    ]
+    assert list(storage.filter(conditions)) == [2, 4, 6]
+    assert list(storage.filter(conditions, [4, 5])) == [4]
+
+
+def test_columnar_storage_compacts_deleted_rows():
+    storage = ColumnarStorage(_columns())
+    for i in range(1, 11):
+        storage.insert({"ID": i, "name": "", "age": i, "ok": False})
+    for i in range(1, 8):
+        storage.delete(i)
+    # после шестого удаления удаленных позиций больше, чем действующих:
+    # массивы уплотнены до 4 позиций
+    assert len(storage._values["ID"]) == 4
+    assert [row["age"] for row in storage.rows()] == [8, 9, 10]
+    assert storage.value(9, "age") == 9
+
+
+def test_columnar_storage_int_range():
+    storage = ColumnarStorage(_columns())
+    with pytest.raises(StorageError):
+        storage.insert({"ID": 1, "name": "", "age": 2 ** 63, "ok": False})
+    storage.insert({"ID": 1, "name": "", "age": 1, "ok": False})
+    with pytest.raises(StorageError):
+        storage.update(1, {"age": -(2 ** 63) - 1})
+
+
+def test_set_columnar_storage(core: Core, reopen: Callable[[], Core]):
+    core.create_table("users", [("name", "str"), ("age", "int")])
+    core.insert_many("users", [["a", "1"], ["b", "2"]])
+    core.set_storage("users", "columnar")
+    core.insert("users", ["c", "3"])
+    core.delete("users", {"name": "a"})
+    assert isinstance(core.get_table("users")._storage, ColumnarStorage)
+    core.close()
+    reopened = reopen()
+    assert reopened.get_table("users").storage_type == "columnar"
+    assert list(reopened.select("users", None))[1:] == \
+        [[2, "b", 2], [3, "c", 3]]